@@ -1,5 +1,7 @@
-from fastapi import Query, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi import Query, Request, status, Depends
+from app.helpers.utils.json_response import FastJSONResponse
+from app.api.services.bulk_register_service import bulk_register_users
+from app.api.services.revocation_service import logout_user, revoke_user_tokens
 from app.api.services.auth_service import (
     register_user, get_users_list, login_user,
     get_user_profile
@@ -7,16 +9,19 @@ from app.api.services.auth_service import (
 from app.helpers.schema_validations.auth_schema import (
     authRegisterUsersRequest, authLoginRequest
 )
-from sqlalchemy.orm import Session
-from app.connections.db_connector import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.connections.db_connector import get_async_db
 from app.middlewares.auth_middleware import get_current_user
-from app.models.user_model import UserModel
+from app.helpers.enums.enum_config import paginationCountModes
+from app.core.config import settings
+from app.helpers.utils.fast_json import loads
+from app.helpers.utils.principal_cache import Principal
 
-async def register(payload: authRegisterUsersRequest, db: Session = Depends(get_db)):
+async def register(payload: authRegisterUsersRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         data = payload.dict()
         response_data = await register_user(data=data, db=db)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code= response_data.get("status_code", 500),
             content=response_data.get("content", {
                     "error": True,
@@ -25,7 +30,7 @@ async def register(payload: authRegisterUsersRequest, db: Session = Depends(get_
             )
     except Exception as e:
         print(f"Error while registering :: {str(e)}")
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": True,
@@ -33,10 +38,66 @@ async def register(payload: authRegisterUsersRequest, db: Session = Depends(get_
                 },
             )
 
-async def get_user(page: int = Query(1, ge=1), items_per_page: int = Query(20, ge=1, le=100),db: Session = Depends(get_db)):
+def _parse_bulk_payload(body: bytes, content_type: str) -> list:
+    # JSON array, or one JSON object per line for application/x-ndjson uploads
+    if "ndjson" in content_type:
+        return [loads(line) for line in body.splitlines() if line.strip()]
+    items = loads(body)
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON array of users")
+    return items
+
+async def bulk_register(request: Request, db: AsyncSession = Depends(get_async_db)):
     try:
-        response_data = await get_users_list(db=db, page=page, items_per_page=items_per_page,)
-        return JSONResponse(
+        try:
+            items = _parse_bulk_payload(await request.body(), request.headers.get("content-type", ""))
+        except ValueError:
+            return FastJSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={
+                    "error": True,
+                    "data": {"message": "Invalid bulk registration payload."},
+                },
+            )
+        if len(items) > settings.BULK_REGISTER_MAX_ROWS:
+            return FastJSONResponse(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={
+                    "error": True,
+                    "data": {"message": f"At most {settings.BULK_REGISTER_MAX_ROWS} users per request."},
+                },
+            )
+
+        response_data = await bulk_register_users(items=items, db=db)
+        return FastJSONResponse(
+            status_code=response_data.get("status_code", 500),
+            content=response_data.get("content", {
+                    "error": True,
+                    "data": {"message": "Internal server error while bulk registering."},
+                }),
+            )
+    except Exception as e:
+        print(f"Error while bulk registering :: {str(e)}")
+        return FastJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "error": True,
+                    "data": {"message": "Internal server error while bulk registering."},
+                },
+            )
+
+async def get_user(
+    page: int = Query(1, ge=1),
+    items_per_page: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description="Opaque keyset cursor from pagination.next_cursor; overrides page"),
+    count_mode: paginationCountModes | None = Query(None, description="How pagination.total is computed; defaults to PAGINATION_COUNT_MODE"),
+    db: AsyncSession = Depends(get_async_db),
+):
+    try:
+        response_data = await get_users_list(
+            db=db, page=page, items_per_page=items_per_page, cursor=cursor, count_mode=count_mode
+        )
+        return FastJSONResponse(
                 status_code=response_data.get("status_code", 500),
                 content=response_data.get("content", {
                     "error": True,
@@ -45,7 +106,7 @@ async def get_user(page: int = Query(1, ge=1), items_per_page: int = Query(20, g
             )
     except Exception as e:
         print(f"Error while  trying to getting users :: {str(e)}")
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": True,
@@ -53,11 +114,11 @@ async def get_user(page: int = Query(1, ge=1), items_per_page: int = Query(20, g
                 },
             )
     
-async def login(payload: authLoginRequest, db: Session = Depends(get_db)):
+async def login(payload: authLoginRequest, db: AsyncSession = Depends(get_async_db)):
     try:
         data = payload.dict()
         response_data = await login_user(data=data, db=db)
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=response_data.get("status_code", 500),
                 content=response_data.get("content", {
                     "error": True,
@@ -66,7 +127,7 @@ async def login(payload: authLoginRequest, db: Session = Depends(get_db)):
             )
     except Exception as e:
         print(f"Error while  trying to login :: {str(e)}")
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": True,
@@ -74,10 +135,10 @@ async def login(payload: authLoginRequest, db: Session = Depends(get_db)):
                 },
             )
     
-async def user_profile(current_user: UserModel = Depends(get_current_user), db: Session = Depends(get_db)):
+async def user_profile(current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
     try:
         response_data = await get_user_profile(data=current_user, db=db)
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=response_data.get("status_code", 500),
                 content=response_data.get("content", {
                     "error": True,
@@ -86,10 +147,50 @@ async def user_profile(current_user: UserModel = Depends(get_current_user), db:
             )
     except Exception as e:
         print(f"Error while  trying to fetch me :: {str(e)}")
-        return JSONResponse(
+        return FastJSONResponse(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 content={
                     "error": True,
                     "data": {"message": "Internal server error while trying to fetch me."},
                 },
-            )
\ No newline at end of file
+            )
+
+async def logout(request: Request, current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    try:
+        response_data = await logout_user(payload=request.state.token_payload, db=db)
+        return FastJSONResponse(
+                status_code=response_data.get("status_code", 500),
+                content=response_data.get("content", {
+                    "error": True,
+                    "data": {"message": "Internal server error while logging out."},
+                }),
+            )
+    except Exception as e:
+        print(f"Error while trying to logout :: {str(e)}")
+        return FastJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "error": True,
+                    "data": {"message": "Internal server error while logging out."},
+                },
+            )
+
+async def revoke_tokens(user_id: int, current_user: Principal = Depends(get_current_user), db: AsyncSession = Depends(get_async_db)):
+    try:
+        response_data = await revoke_user_tokens(user_id=user_id, current_user=current_user, db=db)
+        return FastJSONResponse(
+                status_code=response_data.get("status_code", 500),
+                content=response_data.get("content", {
+                    "error": True,
+                    "data": {"message": "Internal server error while revoking tokens."},
+                }),
+            )
+    except Exception as e:
+        print(f"Error while trying to revoke tokens :: {str(e)}")
+        return FastJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "error": True,
+                    "data": {"message": "Internal server error while revoking tokens."},
+                },
+            )
@@ -0,0 +1,34 @@
+from datetime import datetime, timezone
+from typing import Callable
+from fastapi import Query, status, Depends
+from fastapi.responses import StreamingResponse
+from app.api.services.export_service import stream_users_export
+from app.connections.db_connector import get_async_session_factory
+from app.helpers.enums.enum_config import exportFormats
+from app.helpers.utils.json_response import FastJSONResponse
+
+EXPORT_MEDIA_TYPES = {
+    exportFormats.NDJSON: "application/x-ndjson",
+    exportFormats.CSV: "text/csv; charset=utf-8",
+}
+
+async def export_users(
+    format: exportFormats = Query(exportFormats.NDJSON),
+    session_factory: Callable = Depends(get_async_session_factory),
+):
+    try:
+        filename = f"users-{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}.{format.value}"
+        return StreamingResponse(
+            stream_users_export(session_factory=session_factory, export_format=format),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+    except Exception as e:
+        print(f"Error while exporting users :: {str(e)}")
+        return FastJSONResponse(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                content={
+                    "error": True,
+                    "data": {"message": "Internal server error while exporting users."},
+                },
+            )
@@ -1,4 +1,5 @@
 from .auth_route import auth_router
+from .export_route import export_router
 from .health_route import router as health_router
 
-__all__ = ["auth_router", "health_router"]
+__all__ = ["auth_router", "export_router", "health_router"]
@@ -1,16 +1,21 @@
 from fastapi import APIRouter, Depends
 from app.api.controllers.auth_controller import (
-    register, get_user, login, user_profile
+    register, bulk_register, get_user, login, user_profile,
+    logout, revoke_tokens
 )
 from app.helpers.schema_validations.auth_schema import (
     authRegisterUsersResponse, authGetUsersResponse,
     authLoginResponse, authMeResponse
 )
 from app.middlewares.auth_middleware import get_current_admin
+from app.middlewares.rate_limit_middleware import throttle_login
 
 auth_router = APIRouter()
 
 auth_router.post("/registerUsers", response_model=authRegisterUsersResponse, include_in_schema=False)(register)
+auth_router.post("/registerUsers/bulk", include_in_schema=False)(bulk_register)
 auth_router.get("/getUsers", response_model=authGetUsersResponse, dependencies=[Depends(get_current_admin)])(get_user)
-auth_router.post("/login", response_model=authLoginResponse)(login)
-auth_router.get("/me", response_model=authMeResponse)(user_profile)
\ No newline at end of file
+auth_router.post("/login", response_model=authLoginResponse, dependencies=[Depends(throttle_login)])(login)
+auth_router.get("/me", response_model=authMeResponse)(user_profile)
+auth_router.post("/logout")(logout)
+auth_router.post("/revokeUserTokens/{user_id}")(revoke_tokens)
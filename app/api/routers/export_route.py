@@ -0,0 +1,7 @@
+from fastapi import APIRouter, Depends
+from app.api.controllers.export_controller import export_users
+from app.middlewares.auth_middleware import get_current_admin
+
+export_router = APIRouter()
+
+export_router.get("/exportUsers", dependencies=[Depends(get_current_admin)])(export_users)
@@ -1,11 +1,64 @@
 from fastapi import APIRouter, status
-from fastapi.responses import JSONResponse
+from app.helpers.utils.json_response import FastJSONResponse
+from app.connections.db_connector import get_pool_stats
+from app.connections.write_behind import login_write_behind
+from app.helpers.loggers.logging_config import log_queue_stats
+from app.helpers.utils.password_hash import hashing_stats
+from app.helpers.utils.jwt_util import verified_token_cache
+from app.helpers.utils.principal_cache import principal_cache
+from app.helpers.utils.token_revocation import token_revocations
+from app.middlewares.timeout_middleware import timeout_stats
 
 router = APIRouter()
 
 @router.get("/health")
 async def health_check():
-    return JSONResponse(
+    return FastJSONResponse(
         content={"status": "ok"},
         status_code=status.HTTP_200_OK
     )
+
+@router.get("/health/pool")
+async def pool_stats():
+    # connection pool usage (checkout wait, checked-out, overflow) for pool sizing
+    return FastJSONResponse(
+        content={"status": "ok", "pools": get_pool_stats(), "login_write_behind": login_write_behind.snapshot()},
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/health/hashing")
+async def hashing_pool_stats():
+    # password hashing pool queue depth and wait time
+    return FastJSONResponse(
+        content={"status": "ok", "hashing": hashing_stats.snapshot()},
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/health/cache")
+async def cache_stats():
+    # in-process cache hit/miss counters
+    caches = {
+        "principal": principal_cache.stats(),
+        "verified_token": verified_token_cache.stats(),
+        "token_revocation": token_revocations.stats(),
+    }
+    return FastJSONResponse(
+        content={"status": "ok", "caches": caches},
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/health/logging")
+async def logging_stats():
+    # log shipping queue depth and dropped records
+    return FastJSONResponse(
+        content={"status": "ok", "logging": log_queue_stats.snapshot()},
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/health/timeouts")
+async def request_timeout_stats():
+    # timed-out requests per route, split by whether the response had started
+    return FastJSONResponse(
+        content={"status": "ok", "timeouts": timeout_stats.snapshot()},
+        status_code=status.HTTP_200_OK
+    )
@@ -0,0 +1,20 @@
+from fastapi import APIRouter, Request, status
+from fastapi.responses import Response
+from app.core.config import settings
+from app.helpers.utils.jwt_keys import get_keyring
+
+router = APIRouter()
+
+
+@router.get("/.well-known/jwks.json", include_in_schema=False)
+async def jwks(request: Request):
+    # Public verification keys (RFC 7517), serialized once with the key ring; downstream services
+    # cache them for max-age and revalidate with If-None-Match.
+    keyring = get_keyring()
+    headers = {
+        "ETag": keyring.jwks_etag,
+        "Cache-Control": f"public, max-age={settings.JWKS_MAX_AGE_SECONDS}",
+    }
+    if keyring.jwks_etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=keyring.jwks_body, media_type="application/json", headers=headers)
@@ -0,0 +1,58 @@
+from fastapi import APIRouter
+from fastapi.responses import Response
+from app.connections.db_connector import get_pool_stats
+from app.helpers.loggers.logging_config import log_queue_stats
+from app.helpers.utils.metrics import CONTENT_TYPE, registry
+from app.helpers.utils.password_hash import hashing_stats
+from app.helpers.utils.token_revocation import token_revocations
+from app.middlewares.timeout_middleware import timeout_stats
+
+router = APIRouter()
+
+
+def _numeric(stats: dict):
+    for key, value in stats.items():
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield key, value
+
+
+def _pool_samples():
+    for name, stats in get_pool_stats().items():
+        for key, value in _numeric(stats):
+            yield (name, key), value
+
+
+def _hashing_samples():
+    return [((key,), value) for key, value in _numeric(hashing_stats.snapshot())]
+
+
+def _log_queue_samples():
+    return [((key,), value) for key, value in _numeric(log_queue_stats.snapshot())]
+
+
+def _revocation_samples():
+    return [((key,), value) for key, value in _numeric(token_revocations.stats())]
+
+
+def _timeout_samples():
+    for phase, counts in timeout_stats.snapshot().items():
+        for route, count in counts.items():
+            yield (route, phase), count
+
+
+# read from the existing stats objects at scrape time; nothing extra on the request path
+registry.gauge_callback("db_pool", "Connection pool telemetry (see /health/pool).", ("engine", "stat"), _pool_samples)
+registry.gauge_callback("password_hash_pool", "Password hashing pool telemetry (see /health/hashing).", ("stat",), _hashing_samples)
+registry.gauge_callback("log_queue", "Access log queue telemetry (see /health/logging).", ("stat",), _log_queue_samples)
+registry.gauge_callback(
+    "token_revocation", "Revoked token list and Bloom filter telemetry (see /health/cache).", ("stat",), _revocation_samples
+)
+registry.gauge_callback(
+    "http_request_timeouts", "Timed-out requests per route (see /health/timeouts).", ("route", "phase"), _timeout_samples
+)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    # Prometheus text exposition format
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -1,14 +1,20 @@
 from datetime import datetime, timedelta, timezone
 from fastapi import status, Depends
-from sqlalchemy import func
+from sqlalchemy import select, tuple_, update
+from app.api.services.count_service import count_rows, invalidate_count
+from app.connections.write_behind import login_write_behind
+from app.helpers.utils.cursor import decode_cursor, encode_cursor
 from app.helpers.utils.jwt_util import create_access_token
+from app.helpers.utils.user_serializer import (
+    LOGIN_COLUMNS, PROFILE_COLUMNS, USER_LIST_COLUMNS, user_rows_to_wire
+)
 from app.models.user_model import UserModel
 from app.helpers.schema_validations.auth_schema import authRegisterUsersRequest
-from app.helpers.utils.password_hash import pwd_context
-from sqlalchemy.orm import Session
+from app.helpers.utils.password_hash import hash_password, verify_password
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
-async def register_user(data: authRegisterUsersRequest, db: Session):
+async def register_user(data: authRegisterUsersRequest, db: AsyncSession):
     try:
         # Only admin can register 
         username = data.get('userName') or data.get('username') or data.get('user_name')
@@ -30,10 +36,12 @@ async def register_user(data: authRegisterUsersRequest, db: Session):
         
         # check for user already exists
         user_exist = (
-            db.query(UserModel)
-            .filter(UserModel.user_name == username, UserModel.email == email, UserModel.role == role)
-            .first()
-        )
+            await db.execute(
+                select(UserModel)
+                .where(UserModel.user_name == username, UserModel.email == email, UserModel.role == role)
+                .limit(1)
+            )
+        ).scalars().first()
         if user_exist:
             response = {
                 "status_code":status.HTTP_409_CONFLICT,
@@ -45,10 +53,11 @@ async def register_user(data: authRegisterUsersRequest, db: Session):
             return response
         
         # create user
-        user = UserModel(user_name=username, email=email, password=pwd_context.hash(password), role=role)
+        user = UserModel(user_name=username, email=email, password=await hash_password(password), role=role)
         db.add(user)
-        db.commit()
-        db.refresh(user)
+        await db.commit()
+        await db.refresh(user)
+        invalidate_count(UserModel)
 
         response = {
                 "status_code":status.HTTP_201_CREATED,
@@ -63,7 +72,7 @@ async def register_user(data: authRegisterUsersRequest, db: Session):
         }
         return response
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error while registering user :: {str(e)}")
         response = {
                 "status_code":status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -75,23 +84,44 @@ async def register_user(data: authRegisterUsersRequest, db: Session):
         return response
 
 
-async def get_users_list(db: Session, page: int, items_per_page: int):
+async def get_users_list(
+    db: AsyncSession, page: int, items_per_page: int, cursor: str | None = None, count_mode: str | None = None
+):
     try:
         # Note: role-based restriction (only admin can fetch all users) - handled in auth middleware
-        offset = (page - 1) * items_per_page
-        if offset<0:
-            raise Exception("Pagination Offset cannot be negative")
-        
-        total = db.query(func.count(UserModel.id)).scalar()
-        
-        # Fetch all users
+        query = select(*USER_LIST_COLUMNS).order_by(UserModel.created_at.desc(), UserModel.id.desc())
+
+        if cursor:
+            # Keyset mode: seek past the last (created_at, id) seen, no OFFSET scan and no COUNT
+            try:
+                last_created_at, last_id = decode_cursor(cursor)
+            except ValueError:
+                return {
+                    "status_code": status.HTTP_400_BAD_REQUEST,
+                    "content": {
+                        "error": True,
+                        "data": {"message": "Invalid pagination cursor."},
+                    },
+                }
+            query = query.where(tuple_(UserModel.created_at, UserModel.id) < tuple_(last_created_at, last_id))
+            page = None
+        else:
+            offset = (page - 1) * items_per_page
+            if offset<0:
+                raise Exception("Pagination Offset cannot be negative")
+            query = query.offset(offset)
+
+        # cursor pages only count when a count mode is asked for explicitly
+        total, is_estimate = None, False
+        if not cursor or count_mode:
+            total, is_estimate = await count_rows(db, UserModel, count_mode)
+
+        # Fetch one extra row to know whether a next page exists
         users = (
-            db.query(UserModel)
-            .order_by(UserModel.created_at.desc())
-            .offset(offset)
-            .limit(items_per_page)
-            .all()
-        )
+            await db.execute(query.limit(items_per_page + 1))
+        ).all()
+        has_more = len(users) > items_per_page
+        users = users[:items_per_page]
 
         if not users:
             response = {
@@ -103,18 +133,8 @@ async def get_users_list(db: Session, page: int, items_per_page: int):
             }
             return response
 
-        # Convert to dicts (Beanie returns Document objects)
-        user_list = [
-            {
-                "id": str(user.id),
-                "username": user.user_name,
-                "email": user.email,
-                "role": user.role.value,
-                "lastLogin": user.last_login.isoformat() if user.last_login else None,
-                "createdAt": user.created_at.isoformat() if user.created_at else None,
-            }
-            for user in users
-        ]
+        # Column rows straight to wire objects; datetimes/enums are encoded by FastJSONResponse
+        user_list = user_rows_to_wire(users)
 
         response = {
             "status_code": status.HTTP_200_OK,
@@ -124,8 +144,10 @@ async def get_users_list(db: Session, page: int, items_per_page: int):
                     "users": user_list, 
                     "pagination":{
                         "total": total,
+                        "is_estimate": is_estimate,
                         "page": page,
                         "items_per_page": items_per_page,
+                        "next_cursor": encode_cursor(users[-1].created_at, users[-1].id) if has_more else None,
                     },
                     "message": "Users fetched successfully."
                 },
@@ -144,7 +166,7 @@ async def get_users_list(db: Session, page: int, items_per_page: int):
         }
         return response
 
-async def login_user(data: dict, db: Session):
+async def login_user(data: dict, db: AsyncSession):
     try:
         username = data.get("username") or data.get("userName") or data.get('user_name')
         email = data.get("email")
@@ -160,12 +182,14 @@ async def login_user(data: dict, db: Session):
                 },
             }
 
-        # Fetch user
+        # Fetch only the columns needed to authenticate (row tuple, no ORM identity)
         user = (
-            db.query(UserModel)
-            .filter(UserModel.user_name == username, UserModel.email == email)
-            .first()
-        )
+            await db.execute(
+                select(*LOGIN_COLUMNS)
+                .where(UserModel.user_name == username, UserModel.email == email)
+                .limit(1)
+            )
+        ).first()
 
         if not user:
             return {
@@ -177,7 +201,7 @@ async def login_user(data: dict, db: Session):
             }
 
         # Verify password
-        if not pwd_context.verify(password, user.password):
+        if not await verify_password(password, user.password):
             return {
                 "status_code": status.HTTP_401_UNAUTHORIZED,
                 "content": {
@@ -195,15 +219,18 @@ async def login_user(data: dict, db: Session):
         }
 
         token, exp = create_access_token(token_payload)
-        print(token, exp)
-
-        # Update login metadata
-        user.access_token = token
-        user.last_login = datetime.now(timezone.utc)
-        user.updated_at = datetime.now(timezone.utc)
 
-        db.commit()
-        db.refresh(user)
+        # Update login metadata (coalesced into a batched UPDATE when write-behind is on)
+        now = datetime.now(timezone.utc)
+        if login_write_behind.running:
+            login_write_behind.record(user.id, access_token=token, last_login=now, updated_at=now)
+        else:
+            await db.execute(
+                update(UserModel)
+                .where(UserModel.id == user.id)
+                .values(access_token=token, last_login=now, updated_at=now)
+            )
+            await db.commit()
 
         return {
             "status_code": status.HTTP_200_OK,
@@ -218,7 +245,7 @@ async def login_user(data: dict, db: Session):
         }
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"Error while logging in :: {e}")
 
         return {
@@ -230,13 +257,14 @@ async def login_user(data: dict, db: Session):
         }
     
 
-async def get_user_profile(data: dict, db: Session):
+async def get_user_profile(data: dict, db: AsyncSession):
     try:
         # Fetch current user profile
         user = (
-            db.query(UserModel)
-            .filter(UserModel.id == data.id)
-            .first())
+            await db.execute(
+                select(*PROFILE_COLUMNS)
+                .where(UserModel.id == data.id))
+        ).first()
 
         if not user:
             response = {
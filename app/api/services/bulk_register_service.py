@@ -0,0 +1,132 @@
+import asyncio
+import time
+from typing import Any, Dict, List
+from fastapi import status
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.services.count_service import invalidate_count
+from app.core.config import settings
+from app.helpers.schema_validations.auth_schema import authRegisterUsersRequest
+from app.helpers.utils.password_hash import hash_password
+from app.models.user_model import UserModel
+
+
+def _chunks(items: List[Any], size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+async def _existing_emails(db: AsyncSession, emails: List[str]) -> set:
+    # one set-based lookup per chunk instead of one query per user
+    existing = set()
+    for chunk in _chunks(emails, settings.BULK_REGISTER_CHUNK_SIZE):
+        rows = await db.execute(select(UserModel.email).where(UserModel.email.in_(chunk)))
+        existing.update(rows.scalars().all())
+    return existing
+
+
+async def _insert_chunk(db: AsyncSession, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+    # multi-row INSERT ... RETURNING; email -> new id
+    result = await db.execute(insert(UserModel).returning(UserModel.id, UserModel.email), rows)
+    inserted = {email: user_id for user_id, email in result.all()}
+    await db.commit()
+    return inserted
+
+
+async def bulk_register_users(items: List[Any], db: AsyncSession):
+    """
+    Register many users in one request.
+
+    Rows are validated individually, duplicates (already stored or repeated in
+    the payload) are found with set-based email lookups, passwords are hashed
+    concurrently on the hashing pool and inserts are issued in chunks of
+    ``BULK_REGISTER_CHUNK_SIZE``. Returns a per-row result list.
+    """
+    try:
+        started = time.perf_counter()
+        results: List[Dict[str, Any]] = [None] * len(items)
+        pending = []  # (index, validated request)
+
+        for index, item in enumerate(items):
+            try:
+                pending.append((index, authRegisterUsersRequest.model_validate(item)))
+            except ValidationError:
+                results[index] = {"index": index, "status": "invalid", "message": "Invalid user record."}
+
+        existing = await _existing_emails(db, [request.email for _, request in pending])
+        accepted = []
+        for index, request in pending:
+            if request.email in existing:
+                results[index] = {
+                    "index": index, "email": request.email, "status": "duplicate", "message": "User already exists."
+                }
+                continue
+            existing.add(request.email)  # later rows with the same email are duplicates
+            accepted.append((index, request))
+
+        hashes = await asyncio.gather(*(hash_password(request.password) for _, request in accepted))
+
+        for chunk in _chunks(list(zip(accepted, hashes)), settings.BULK_REGISTER_CHUNK_SIZE):
+            rows = [
+                {"user_name": request.user_name, "email": request.email, "password": hashed, "role": request.role}
+                for (_, request), hashed in chunk
+            ]
+            try:
+                inserted = await _insert_chunk(db, rows)
+            except IntegrityError:
+                # a concurrent registration took one of the emails: retry this chunk row by row
+                await db.rollback()
+                inserted = {}
+                for row in rows:
+                    try:
+                        inserted.update(await _insert_chunk(db, [row]))
+                    except IntegrityError:
+                        await db.rollback()
+
+            for (index, request), _ in chunk:
+                user_id = inserted.get(request.email)
+                if user_id is None:
+                    results[index] = {
+                        "index": index, "email": request.email, "status": "duplicate", "message": "User already exists."
+                    }
+                else:
+                    results[index] = {
+                        "index": index, "email": request.email, "status": "created", "user_id": str(user_id)
+                    }
+
+        invalidate_count(UserModel)
+        elapsed = time.perf_counter() - started
+        created = sum(1 for result in results if result["status"] == "created")
+
+        response = {
+            "status_code": status.HTTP_200_OK,
+            "content": {
+                "error": False,
+                "data": {
+                    "results": results,
+                    "summary": {
+                        "total": len(items),
+                        "created": created,
+                        "duplicates": sum(1 for result in results if result["status"] == "duplicate"),
+                        "invalid": sum(1 for result in results if result["status"] == "invalid"),
+                        "elapsed_seconds": round(elapsed, 3),
+                        "users_per_second": round(created / elapsed, 1) if elapsed else None,
+                    },
+                    "message": "Bulk registration processed.",
+                },
+            },
+        }
+        return response
+    except Exception as e:
+        await db.rollback()
+        print(f"Error while bulk registering users :: {str(e)}")
+        response = {
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "content": {
+                "error": True,
+                "data": {"message": "Internal server error while bulk registering users."},
+            },
+        }
+        return response
@@ -0,0 +1,60 @@
+from typing import Tuple
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.helpers.enums.enum_config import paginationCountModes
+from app.helpers.utils.ttl_cache import TTLCache
+
+# table name -> exact row count
+count_cache = TTLCache(max_size=128, ttl_seconds=settings.PAGINATION_COUNT_CACHE_TTL_SECONDS)
+
+
+async def _exact_count(db: AsyncSession, model) -> int:
+    return await db.scalar(select(func.count()).select_from(model))
+
+
+async def _estimated_count(db: AsyncSession, model) -> int | None:
+    # planner estimate from pg_class; None when unsupported or the table was never analyzed
+    if db.get_bind().dialect.name != "postgresql":
+        return None
+    estimate = await db.scalar(
+        text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": model.__tablename__},
+    )
+    if estimate is None or estimate < 0:
+        return None
+    return int(estimate)
+
+
+async def count_rows(db: AsyncSession, model, mode: paginationCountModes | str | None = None) -> Tuple[int, bool]:
+    """
+    Count rows of a model's table.
+
+    Returns:
+        (total, is_estimate)
+    """
+    mode = paginationCountModes(mode or settings.PAGINATION_COUNT_MODE)
+    table = model.__tablename__
+
+    if mode == paginationCountModes.ESTIMATED:
+        estimate = await _estimated_count(db, model)
+        if estimate is not None:
+            return estimate, True
+        # SQLite (and unanalyzed tables) fall back to the exact count
+        return await _exact_count(db, model), False
+
+    if mode == paginationCountModes.CACHED:
+        cached = count_cache.get(table)
+        if cached is not None:
+            # exact when computed, but may be up to the TTL stale
+            return cached, True
+        total = await _exact_count(db, model)
+        count_cache.set(table, total)
+        return total, False
+
+    return await _exact_count(db, model), False
+
+
+def invalidate_count(model):
+    # Drop the cached count after writes that change the table size.
+    count_cache.pop(model.__tablename__)
@@ -0,0 +1,53 @@
+import csv
+import io
+from typing import AsyncIterator, Callable
+from sqlalchemy import select
+from app.core.config import settings
+from app.helpers.enums.enum_config import exportFormats
+from app.helpers.utils.fast_json import dumps_bytes
+from app.helpers.utils.user_serializer import USER_EXPORT_COLUMNS, USER_EXPORT_FIELDS, user_row_to_csv
+from app.models.user_model import UserModel
+
+
+async def stream_users_export(session_factory: Callable, export_format: exportFormats) -> AsyncIterator[bytes]:
+    """
+    Yield every user as NDJSON lines or CSV rows, one chunk per fetched partition.
+
+    Rows are read through a server-side cursor (``yield_per``), so memory stays
+    bounded by ``EXPORT_BATCH_SIZE`` regardless of table size. The session is
+    owned here because the body is produced after the request dependencies exit.
+    """
+    batch_size = settings.EXPORT_BATCH_SIZE
+    query = (
+        select(*USER_EXPORT_COLUMNS)
+        .order_by(UserModel.id)
+        .execution_options(yield_per=batch_size)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    if export_format == exportFormats.CSV:
+        writer.writerow(USER_EXPORT_FIELDS)
+        yield buffer.getvalue().encode("utf-8")
+
+    async with session_factory() as db:
+        result = await db.stream(query)
+        try:
+            async for partition in result.partitions(batch_size):
+                if export_format == exportFormats.CSV:
+                    buffer.seek(0)
+                    buffer.truncate()
+                    writer.writerows(user_row_to_csv(row) for row in partition)
+                    yield buffer.getvalue().encode("utf-8")
+                else:
+                    yield b"".join(
+                        dumps_bytes(dict(zip(USER_EXPORT_FIELDS, (str(row[0]), *row[1:])))) + b"\n"
+                        for row in partition
+                    )
+        except Exception as e:
+            # headers are already sent: re-raise so the server aborts the chunked body
+            # instead of ending it cleanly with missing rows
+            print(f"Error while streaming users export :: {str(e)}")
+            raise
+        finally:
+            await result.close()
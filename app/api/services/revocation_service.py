@@ -0,0 +1,97 @@
+from datetime import datetime, timezone
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.helpers.enums.enum_config import userRoles
+from app.helpers.utils.principal_cache import Principal, invalidate_principal
+from app.helpers.utils.token_revocation import token_revocations
+from app.models.token_revocation_model import RevokedTokenModel, UserTokenRevocationModel
+
+
+async def logout_user(payload: dict, db: AsyncSession):
+    # Revoke the presented token only; the user's other sessions stay valid.
+    try:
+        jti = payload.get("jti")
+        if not jti:
+            # tokens issued before jti existed can only be revoked all at once
+            return {
+                "status_code": status.HTTP_400_BAD_REQUEST,
+                "content": {
+                    "error": True,
+                    "data": {"message": "Token cannot be revoked individually."},
+                },
+            }
+
+        expires_at = datetime.fromtimestamp(payload["exp"], timezone.utc)
+        if await db.get(RevokedTokenModel, jti) is None:
+            db.add(RevokedTokenModel(jti=jti, user_id=int(payload["sub"]), expires_at=expires_at))
+            try:
+                await db.commit()
+            except IntegrityError:
+                # a concurrent logout with the same token inserted it first: already revoked
+                await db.rollback()
+        # this worker rejects it right away; the others within TOKEN_REVOCATION_REFRESH_SECONDS
+        token_revocations.revoke(jti, expires_at.timestamp())
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "content": {
+                "error": False,
+                "data": {"message": "Logged out successfully."},
+            },
+        }
+    except Exception as e:
+        await db.rollback()
+        print(f"Error while logging out :: {str(e)}")
+        return {
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "content": {
+                "error": True,
+                "data": {"message": "Internal server error while logging out."},
+            },
+        }
+
+
+async def revoke_user_tokens(user_id: int, current_user: Principal, db: AsyncSession):
+    # Revoke every token issued to the user so far; users may revoke their own, admins anyone's.
+    try:
+        if current_user.id != user_id and current_user.role != userRoles.ADMIN:
+            return {
+                "status_code": status.HTTP_403_FORBIDDEN,
+                "content": {
+                    "error": True,
+                    "data": {"message": "Admin privileges required"},
+                },
+            }
+
+        revoked_at = datetime.now(timezone.utc)
+        entry = await db.get(UserTokenRevocationModel, user_id)
+        if entry is None:
+            db.add(UserTokenRevocationModel(user_id=user_id, revoked_at=revoked_at))
+        else:
+            entry.revoked_at = revoked_at
+        await db.commit()
+        token_revocations.revoke_user(user_id, revoked_at.timestamp())
+        invalidate_principal(user_id)
+
+        return {
+            "status_code": status.HTTP_200_OK,
+            "content": {
+                "error": False,
+                "data": {
+                    "user_id": str(user_id),
+                    "revoked_at": revoked_at.isoformat(),
+                    "message": "All tokens revoked successfully.",
+                },
+            },
+        }
+    except Exception as e:
+        await db.rollback()
+        print(f"Error while revoking user tokens :: {str(e)}")
+        return {
+            "status_code": status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "content": {
+                "error": True,
+                "data": {"message": "Internal server error while revoking tokens."},
+            },
+        }
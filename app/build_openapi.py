@@ -0,0 +1,18 @@
+"""
+Write the OpenAPI schema to a file at build time, to be served via
+OPENAPI_SCHEMA_FILE instead of being generated in each worker.
+
+Usage:
+    python -m app.build_openapi [path]   (defaults to OPENAPI_SCHEMA_FILE, else openapi.json)
+"""
+import sys
+
+from app.core.config import settings
+from app.helpers.utils.custom_openapi import write_openapi
+from app.main import app
+
+
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else settings.OPENAPI_SCHEMA_FILE or "openapi.json"
+    write_openapi(app, output)
+    print(f"OpenAPI schema written to {output}")
@@ -1,7 +1,13 @@
 from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
 from app.core.config import settings
+from app.connections.pool_monitor import PoolMonitor, instrumented_pool_class
+from app.connections.query_metrics import instrument_queries
+import os
 import signal
 import sys
 from sqlalchemy.exc import SQLAlchemyError
@@ -10,11 +16,47 @@ Base = declarative_base()
 DATABASE_URL = settings.DATABASE_URL
 engine = None
 SessionLocal = None
+async_engine = None
+AsyncSessionLocal = None
+pool_monitors = {"sync": PoolMonitor("sync"), "async": PoolMonitor("async")}
+
+# sync driver -> async driver used by the async engine
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url(url: str) -> str:
+    # Derive the async driver URL (asyncpg / aiosqlite) from a sync DATABASE_URL.
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for database backend '{backend}'")
+    return parsed.set(drivername=ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+def _engine_options(url: str, monitor: PoolMonitor) -> dict:
+    # Pool sizing from settings; queue-less pools (e.g. in-memory SQLite) take no sizing options.
+    poolclass = instrumented_pool_class(url, monitor)
+    options = {
+        "poolclass": poolclass,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,   # handles stale connections
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+    if issubclass(poolclass, QueuePool):
+        options.update({
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+        })
+    return options
 
 def init_db():
     # Initialize database engine, session factory, and validate database connectivity.
     
-    global engine, SessionLocal
+    global engine, SessionLocal, async_engine, AsyncSessionLocal
 
     if not DATABASE_URL:
         print("DATABASE_URL is missing")
@@ -22,9 +64,11 @@ def init_db():
 
     engine = create_engine(
         DATABASE_URL,
-        pool_pre_ping=True,   # handles stale connections
-        future=True
+        future=True,
+        **_engine_options(DATABASE_URL, pool_monitors["sync"]),
     )
+    pool_monitors["sync"].attach(engine)
+    instrument_queries(engine, "sync")
 
     SessionLocal = sessionmaker(
         autocommit=False,
@@ -32,8 +76,27 @@ def init_db():
         bind=engine
     )
 
+    if settings.DB_ASYNC_ENABLED:
+        async_url = get_async_database_url(DATABASE_URL)
+        async_engine = create_async_engine(
+            async_url,
+            **_engine_options(async_url, pool_monitors["async"]),
+        )
+        pool_monitors["async"].attach(async_engine.sync_engine)
+        instrument_queries(async_engine.sync_engine, "async")
+
+        AsyncSessionLocal = async_sessionmaker(
+            bind=async_engine,
+            autoflush=False,
+            expire_on_commit=False,  # keep loaded attributes usable after commit without lazy IO
+        )
+
     _validate_db_connection()
 
+    if settings.DB_AUTO_MIGRATE:
+        from app.connections.migrations import run_migrations  # imports models, which import this module
+        run_migrations(engine)
+
 def _validate_db_connection():
     # Validate database connectivity.
 
@@ -53,9 +116,121 @@ def get_db():
     finally:
         db.close()
 
-def shutdown_db():
-    # Dispose database engine on shutdown.
+
+class SyncSessionAdapter:
+    # Exposes a sync Session through the awaitable AsyncSession surface used by the services,
+    # so DB_ASYNC_ENABLED=false runs the same code on the blocking driver (A/B baseline).
+
+    def __init__(self, session):
+        self.sync_session = session
+
+    def add(self, instance):
+        self.sync_session.add(instance)
+
+    def add_all(self, instances):
+        self.sync_session.add_all(instances)
+
+    async def execute(self, statement, *args, **kwargs):
+        return self.sync_session.execute(statement, *args, **kwargs)
+
+    async def scalar(self, statement, *args, **kwargs):
+        return self.sync_session.scalar(statement, *args, **kwargs)
+
+    async def scalars(self, statement, *args, **kwargs):
+        return self.sync_session.scalars(statement, *args, **kwargs)
+
+    def get_bind(self, *args, **kwargs):
+        return self.sync_session.get_bind(*args, **kwargs)
+
+    async def get(self, entity, ident, **kwargs):
+        return self.sync_session.get(entity, ident, **kwargs)
+
+    async def flush(self, objects=None):
+        self.sync_session.flush(objects)
+
+    async def commit(self):
+        self.sync_session.commit()
+
+    async def rollback(self):
+        self.sync_session.rollback()
+
+    async def refresh(self, instance, attribute_names=None):
+        self.sync_session.refresh(instance, attribute_names)
+
+    async def stream(self, statement, *args, **kwargs):
+        return _SyncStreamResult(self.sync_session.execute(statement, *args, **kwargs))
+
+    async def close(self):
+        self.sync_session.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+
+class _SyncStreamResult:
+    # AsyncResult.partitions() over a sync (yield_per) Result.
+
+    def __init__(self, result):
+        self._result = result
+
+    async def partitions(self, size=None):
+        for partition in self._result.partitions(size):
+            yield partition
+
+    async def close(self):
+        self._result.close()
+
+
+def _new_async_session():
+    if not settings.DB_ASYNC_ENABLED:
+        return SyncSessionAdapter(SessionLocal())
+    return AsyncSessionLocal()
+
+
+async def get_async_db():
+    # FastAPI dependency that provides an AsyncSession (or the wrapped sync session when async is disabled).
+    db = _new_async_session()
+    try:
+        yield db
+    finally:
+        await db.close()
+
+def get_pool_stats() -> dict:
+    # Telemetry for every initialized engine pool.
+    stats = {}
+    if engine:
+        stats["sync"] = pool_monitors["sync"].snapshot()
+    if async_engine:
+        stats["async"] = pool_monitors["async"].snapshot()
+    return stats
+
+def get_async_session_factory():
+    # FastAPI dependency returning the session factory, for work that outlives the request
+    # (e.g. a streamed response body opens and closes its own session).
+    return _new_async_session
+
+async def shutdown_db():
+    # Flush buffered writes, then dispose database engines on shutdown.
+    from app.connections.write_behind import login_write_behind  # imports models, which import this module
+    from app.connections.revocation_sync import revocation_refresher
+    await login_write_behind.stop()
+    await revocation_refresher.stop()
+
+    if async_engine:
+        await async_engine.dispose()
     if engine:
         engine.dispose()
         print("Database connection closed")
 
+def _dispose_inherited_pools():
+    # A forked child must not reuse the parent's pooled connections (shared sockets).
+    # close=False drops them from this process's pools without closing them under the parent.
+    if engine:
+        engine.dispose(close=False)
+    if async_engine:
+        async_engine.sync_engine.dispose(close=False)
+
+os.register_at_fork(after_in_child=_dispose_inherited_pools)
@@ -0,0 +1,109 @@
+from datetime import datetime, timezone
+from typing import Callable, List, NamedTuple
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import IntegrityError
+
+# Kept out of Base.metadata so create_all/drop_all of the app models never touch it
+migration_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    migration_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime(timezone=True), nullable=False),
+)
+
+
+class Migration(NamedTuple):
+    version: int
+    description: str
+    apply: Callable[[Connection], None]
+
+
+def _create_users_table(conn: Connection):
+    from app.models.user_model import UserModel
+
+    UserModel.__table__.create(conn, checkfirst=True)
+
+
+def _create_token_revocation_tables(conn: Connection):
+    from app.models.token_revocation_model import RevokedTokenModel, UserTokenRevocationModel
+
+    RevokedTokenModel.__table__.create(conn, checkfirst=True)
+    UserTokenRevocationModel.__table__.create(conn, checkfirst=True)
+
+
+# indexes an old migration creates that the models no longer declare (a later migration drops them)
+_RETIRED_INDEXES = {
+    "ix_users_user_name_email_role": ("user_name", "email", "role"),
+}
+
+
+def _create_index(name: str) -> Callable[[Connection], None]:
+    def apply(conn: Connection):
+        from app.models.user_model import UserModel
+
+        if name in _RETIRED_INDEXES:
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON users ({', '.join(_RETIRED_INDEXES[name])})"))
+            return
+        index = next(index for index in UserModel.__table__.indexes if index.name == name)
+        index.create(conn, checkfirst=True)
+    return apply
+
+
+def _drop_index(name: str) -> Callable[[Connection], None]:
+    def apply(conn: Connection):
+        conn.execute(text(f"DROP INDEX IF EXISTS {name}"))
+    return apply
+
+
+# Append only; never edit or reorder an applied migration.
+MIGRATIONS: List[Migration] = [
+    Migration(1, "create users table", _create_users_table),
+    Migration(2, "index users (created_at, id) for listing", _create_index("ix_users_created_at_id")),
+    Migration(3, "index users (user_name, email, role) for login/registration", _create_index("ix_users_user_name_email_role")),
+    Migration(4, "create revoked_tokens and user_token_revocations tables", _create_token_revocation_tables),
+    # login/registration lookups filter on email, which is unique (and so already indexed)
+    Migration(5, "drop redundant index ix_users_user_name_email_role", _drop_index("ix_users_user_name_email_role")),
+]
+
+
+def applied_versions(engine: Engine) -> set:
+    with engine.begin() as conn:
+        schema_migrations.create(conn, checkfirst=True)
+        return set(conn.execute(select(schema_migrations.c.version)).scalars())
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Apply pending migrations in version order, one transaction each.
+
+    Safe to run from several processes at once: a version recorded by another
+    process is skipped (every step is idempotent via checkfirst).
+
+    Returns:
+        versions applied by this call
+    """
+    done = applied_versions(engine)
+    applied = []
+    for migration in sorted(MIGRATIONS, key=lambda m: m.version):
+        if migration.version in done:
+            continue
+        try:
+            with engine.begin() as conn:
+                migration.apply(conn)
+                conn.execute(
+                    schema_migrations.insert().values(
+                        version=migration.version,
+                        description=migration.description,
+                        applied_at=datetime.now(timezone.utc),
+                    )
+                )
+        except IntegrityError:
+            # applied concurrently by another worker/node
+            continue
+        print(f"Applied migration {migration.version}: {migration.description}")
+        applied.append(migration.version)
+    return applied
@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import Pool, QueuePool
+
+
+class PoolMonitor:
+    """
+    Collects connection pool telemetry for one engine.
+
+    Checkout wait time is measured around ``Pool.connect()`` by the pool class
+    returned from ``instrumented_pool_class``; checkout/checkin counts come from
+    pool events so they survive ``engine.dispose()`` (the pool is recreated with
+    the same dispatch).
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.engine: Engine | None = None
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.timeouts = 0
+            self.wait_seconds_total = 0.0
+            self.wait_seconds_max = 0.0
+            self.peak_checked_out = 0
+            self.peak_overflow = 0
+            self.overflow_checkouts = 0
+
+    def attach(self, engine: Engine):
+        # Register pool events; call once per (sync) engine.
+        self.engine = engine
+        event.listen(engine.pool, "connect", self._on_connect)
+        event.listen(engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.pool, "checkin", self._on_checkin)
+
+    @property
+    def pool(self) -> Pool | None:
+        # Always the engine's current pool (dispose() swaps it for a fresh one).
+        return self.engine.pool if self.engine is not None else None
+
+    def record_wait(self, seconds: float, timed_out: bool = False):
+        with self._lock:
+            if timed_out:
+                self.timeouts += 1
+                return
+            self.wait_seconds_total += seconds
+            if seconds > self.wait_seconds_max:
+                self.wait_seconds_max = seconds
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.connects += 1
+
+    def _on_checkout(self, dbapi_connection, connection_record, connection_proxy):
+        checked_out, overflow = self._live_usage()
+        with self._lock:
+            self.checkouts += 1
+            if checked_out > self.peak_checked_out:
+                self.peak_checked_out = checked_out
+            if overflow > 0:
+                self.overflow_checkouts += 1
+                if overflow > self.peak_overflow:
+                    self.peak_overflow = overflow
+
+    def _on_checkin(self, dbapi_connection, connection_record):
+        with self._lock:
+            self.checkins += 1
+
+    def _live_usage(self):
+        pool = self.pool
+        if not isinstance(pool, QueuePool):
+            return 0, 0
+        return pool.checkedout(), max(pool.overflow(), 0)
+
+    def snapshot(self) -> Dict[str, Any]:
+        # Point-in-time view of counters plus the live pool state.
+        pool = self.pool
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "checkout_wait_seconds_total": round(self.wait_seconds_total, 6),
+                "checkout_wait_seconds_max": round(self.wait_seconds_max, 6),
+                "checkout_wait_seconds_avg": (
+                    round(self.wait_seconds_total / self.checkouts, 6) if self.checkouts else 0.0
+                ),
+                "peak_checked_out": self.peak_checked_out,
+                "peak_overflow": self.peak_overflow,
+                "overflow_checkouts": self.overflow_checkouts,
+            }
+
+        if pool is not None:
+            data["pool_class"] = type(pool).__name__
+        if isinstance(pool, QueuePool):
+            data.update({
+                "size": pool.size(),
+                "checked_in": pool.checkedin(),
+                "checked_out": pool.checkedout(),
+                "overflow": max(pool.overflow(), 0),
+            })
+        return data
+
+
+def instrumented_pool_class(url: str, monitor: PoolMonitor):
+    """
+    Return the dialect's default pool class wrapped so ``connect()`` reports
+    how long the caller waited for a connection.
+    """
+    parsed = make_url(url)
+    base = parsed.get_dialect().get_pool_class(parsed)
+
+    class InstrumentedPool(base):
+        def connect(self):
+            started = time.perf_counter()
+            try:
+                connection = super().connect()
+            except PoolTimeoutError:
+                monitor.record_wait(time.perf_counter() - started, timed_out=True)
+                raise
+            monitor.record_wait(time.perf_counter() - started)
+            return connection
+
+    InstrumentedPool.__name__ = f"Instrumented{base.__name__}"
+    return InstrumentedPool
@@ -0,0 +1,36 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "BEGIN", "COMMIT", "ROLLBACK", "PRAGMA", "CREATE"}
+
+
+def _operation(statement: str) -> str:
+    # first keyword only, so the label set stays small
+    head = statement.lstrip()[:8].split(None, 1)
+    verb = head[0].upper() if head else ""
+    return verb.lower() if verb in _OPERATIONS else "other"
+
+
+def instrument_queries(engine: Engine, name: str):
+    """
+    Time every statement run on ``engine`` into ``db_query_duration_seconds``.
+
+    Uses ``before/after_cursor_execute``, so the duration is the DBAPI
+    execute call only (no ORM loading). For an AsyncEngine pass
+    ``async_engine.sync_engine``.
+    """
+    # app.helpers.utils imports the models, which import db_connector (which imports this module)
+    from app.helpers.utils.metrics import db_query_duration_seconds
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_started_at = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        started_at = getattr(context, "_query_started_at", None)
+        if started_at is not None:
+            db_query_duration_seconds.observe(time.perf_counter() - started_at, (name, _operation(statement)))
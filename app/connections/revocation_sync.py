@@ -0,0 +1,121 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
+from sqlalchemy import delete, select
+from app.core.config import settings
+from app.helpers.utils.token_revocation import token_revocations
+from app.models.token_revocation_model import RevokedTokenModel, UserTokenRevocationModel
+
+# rows are re-read this far behind the watermark, to tolerate clock skew between workers
+_OVERLAP = timedelta(seconds=5)
+
+
+def epoch(value: datetime) -> float:
+    # SQLite hands back naive datetimes; everything is stored in UTC
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def load_revocations(session_factory: Callable):
+    """
+    Rebuild ``token_revocations`` from the database (sync session, at startup).
+    """
+    now = datetime.now(timezone.utc)
+    try:
+        with session_factory() as db:
+            tokens = db.execute(
+                select(RevokedTokenModel.jti, RevokedTokenModel.expires_at).where(RevokedTokenModel.expires_at > now)
+            ).all()
+            cutoffs = db.execute(select(UserTokenRevocationModel.user_id, UserTokenRevocationModel.revoked_at)).all()
+    except Exception as e:
+        # the watermark stays unset, so the refresher's first pass does the full load instead
+        print(f"Error while loading token revocations :: {str(e)}")
+        return
+    token_revocations.load(
+        ((jti, epoch(expires_at)) for jti, expires_at in tokens),
+        ((user_id, epoch(revoked_at)) for user_id, revoked_at in cutoffs),
+    )
+    revocation_refresher.watermark = now
+    print(f"Loaded {len(tokens)} revoked tokens and {len(cutoffs)} user revocations")
+
+
+class RevocationRefresher:
+    """
+    Pulls revocations made by other workers every ``interval`` seconds.
+
+    Reads only rows with ``revoked_at`` past the last watermark (indexed), and
+    drops expired entries from memory and from ``revoked_tokens``, and user
+    cutoffs older than a token lifetime from ``user_token_revocations``. Without a
+    watermark (the startup load failed) it reads every unexpired revocation.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.watermark: Optional[datetime] = None
+        self._session_factory: Optional[Callable] = None
+        self._task: Optional[asyncio.Task] = None
+        self.refreshes = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: Callable):
+        # Must be called from the running event loop (application startup).
+        self._session_factory = session_factory
+        self._task = asyncio.create_task(self._run(), name="token-revocation-refresh")
+
+    async def _run(self):
+        # right away when the startup load failed: authentication is refused until a full load
+        delay = self.interval if self.watermark is not None else 0
+        while True:
+            await asyncio.sleep(delay)
+            delay = self.interval
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.errors += 1
+                print(f"Error while refreshing token revocations :: {str(e)}")
+
+    async def refresh(self):
+        now = datetime.now(timezone.utc)
+        token_query = select(RevokedTokenModel.jti, RevokedTokenModel.expires_at)
+        cutoff_query = select(UserTokenRevocationModel.user_id, UserTokenRevocationModel.revoked_at)
+        if self.watermark is None:
+            # nothing loaded yet: fail closed by reading everything still in force
+            token_query = token_query.where(RevokedTokenModel.expires_at > now)
+        else:
+            since = self.watermark - _OVERLAP
+            token_query = token_query.where(RevokedTokenModel.revoked_at > since)
+            cutoff_query = cutoff_query.where(UserTokenRevocationModel.revoked_at > since)
+        async with self._session_factory() as db:
+            tokens = (await db.execute(token_query)).all()
+            cutoffs = (await db.execute(cutoff_query)).all()
+
+            for jti, expires_at in tokens:
+                token_revocations.revoke(jti, epoch(expires_at))
+            for user_id, revoked_at in cutoffs:
+                token_revocations.revoke_user(user_id, epoch(revoked_at))
+
+            if token_revocations.prune():
+                outlived = now - timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+                await db.execute(delete(RevokedTokenModel).where(RevokedTokenModel.expires_at <= now))
+                await db.execute(delete(UserTokenRevocationModel).where(UserTokenRevocationModel.revoked_at <= outlived))
+                await db.commit()
+        self.watermark = now
+        token_revocations.loaded = True
+        self.refreshes += 1
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+revocation_refresher = RevocationRefresher(interval=settings.TOKEN_REVOCATION_REFRESH_SECONDS)
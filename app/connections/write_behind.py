@@ -0,0 +1,140 @@
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional
+from sqlalchemy import bindparam, update
+from app.core.config import settings
+from app.models.user_model import UserModel
+
+
+_users = UserModel.__table__
+_UPDATE_LOGIN_METADATA = (
+    update(_users)
+    .where(_users.c.id == bindparam("user_id"))
+    .values(
+        access_token=bindparam("access_token"),
+        last_login=bindparam("last_login"),
+        updated_at=bindparam("updated_at"),
+    )
+)
+
+
+class LoginMetadataBuffer:
+    """
+    Write-behind buffer for per-login user metadata (last_login, access_token, updated_at).
+
+    Updates are coalesced per user id and written as one executemany UPDATE
+    every ``interval_ms`` or as soon as ``max_records`` users are pending.
+    Reads of these columns may lag by up to one interval. Users deleted in the
+    meantime are skipped; a failed flush is retried ``max_attempts`` times
+    before its updates are dropped.
+    """
+
+    def __init__(self, interval_ms: int, max_records: int, max_attempts: int = 5):
+        self.interval = interval_ms / 1000
+        self.max_records = max_records
+        self.max_attempts = max_attempts
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        # user id -> failed flushes of its pending update
+        self._attempts: Dict[int, int] = {}
+        self._session_factory: Optional[Callable] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stats_lock = threading.Lock()
+        self.recorded = 0
+        self.coalesced = 0
+        self.flushed_rows = 0
+        self.flushed_batches = 0
+        self.errors = 0
+        self.dropped_rows = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    def start(self, session_factory: Callable):
+        # Must be called from the running event loop (application startup).
+        self._session_factory = session_factory
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run(), name="login-write-behind")
+
+    def record(self, user_id: int, **values):
+        with self._stats_lock:
+            self.recorded += 1
+            if user_id in self._pending:
+                self.coalesced += 1
+        self._pending[user_id] = {"user_id": user_id, **values}
+        if len(self._pending) >= self.max_records:
+            self._wakeup.set()
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self):
+        if not self._pending or self._session_factory is None:
+            return
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            try:
+                async with self._session_factory() as db:
+                    # Core executemany UPDATE: unlike the ORM bulk UPDATE by primary key it does not
+                    # fail the whole batch when a user was deleted since logging in
+                    await db.execute(_UPDATE_LOGIN_METADATA, list(batch.values()))
+                    await db.commit()
+            except Exception as e:
+                print(f"Error while flushing login metadata :: {str(e)}")
+                with self._stats_lock:
+                    self.errors += 1
+                # keep newer values recorded meanwhile; retry on the next tick, a few times at most
+                for user_id, values in batch.items():
+                    attempts = self._attempts.get(user_id, 0) + 1
+                    if attempts >= self.max_attempts:
+                        self._attempts.pop(user_id, None)
+                        with self._stats_lock:
+                            self.dropped_rows += 1
+                        continue
+                    self._attempts[user_id] = attempts
+                    self._pending.setdefault(user_id, values)
+                return
+            for user_id in batch:
+                self._attempts.pop(user_id, None)
+            with self._stats_lock:
+                self.flushed_rows += len(batch)
+                self.flushed_batches += 1
+
+    async def stop(self):
+        # Stop the flush loop and write whatever is still pending.
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "running": self.running,
+                "pending": len(self._pending),
+                "recorded": self.recorded,
+                "coalesced": self.coalesced,
+                "flushed_rows": self.flushed_rows,
+                "flushed_batches": self.flushed_batches,
+                "errors": self.errors,
+                "dropped_rows": self.dropped_rows,
+            }
+
+
+login_write_behind = LoginMetadataBuffer(
+    interval_ms=settings.LOGIN_WRITE_BEHIND_INTERVAL_MS,
+    max_records=settings.LOGIN_WRITE_BEHIND_MAX_RECORDS,
+)
@@ -20,3 +20,14 @@ class jwtAuth(str, Enum):
     ACCESS_TOKEN_EXPIRE_MINUTES = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
     SECRET_KEY = settings.JWT_SECRET_KEY
     ALGORITHM = settings.JWT_ALGORITHM
+
+
+class paginationCountModes(str, Enum):
+    EXACT = "exact"
+    CACHED = "cached"  # exact count reused for PAGINATION_COUNT_CACHE_TTL_SECONDS
+    ESTIMATED = "estimated"  # planner statistics (Postgres); exact elsewhere
+
+
+class exportFormats(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
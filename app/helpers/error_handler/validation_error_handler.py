@@ -1,5 +1,5 @@
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from app.helpers.utils.json_response import FastJSONResponse
 from fastapi import Request
 from app.helpers.utils.encrypt import is_encryption_required
 
@@ -23,7 +23,7 @@ def validation_exception_handler(request:Request, exc: RequestValidationError):
         if len(errors)==1:
             errors = errors[0]
 
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": True,
@@ -31,7 +31,7 @@ def validation_exception_handler(request:Request, exc: RequestValidationError):
             })
     except Exception as e:
         print(f"Error while handling validation error :: {str(e)}")
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=400,
             content={
                 "error": True,
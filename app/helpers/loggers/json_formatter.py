@@ -0,0 +1,73 @@
+import logging
+import random
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.helpers.utils.fast_json import dumps
+
+
+class JsonFormatter(logging.Formatter):
+    # One JSON object per line: timestamp, level, logger plus either the structured
+    # fields passed as extra={"log_entry": {...}} or the plain message.
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+        }
+        log_entry = getattr(record, "log_entry", None)
+        if log_entry:
+            entry.update(log_entry)
+        else:
+            entry["message"] = record.getMessage()
+
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry["exception"] = record.exc_text
+        return dumps(entry)
+
+
+class AccessLogSampler(logging.Filter):
+    """
+    Sample access log records by route and status.
+
+    ``rules`` maps ``"<path>|<status>"`` to a keep rate in [0, 1], where path may
+    be ``*`` and status is an exact code (``404``), a class (``2xx``) or ``*``.
+    The most specific rule wins, e.g. ``{"/api/v1/health|2xx": 0.01, "*|5xx": 1.0}``.
+    Records without a structured ``log_entry`` always pass.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, float]] = None, default_rate: float = 1.0):
+        super().__init__()
+        self.rules = {key.strip(): float(rate) for key, rate in (rules or {}).items()}
+        self.default_rate = default_rate
+        self._rate_cache: Dict[tuple, float] = {}
+
+    def rate_for(self, path: str, status_code: int) -> float:
+        key = (path, status_code)
+        rate = self._rate_cache.get(key)
+        if rate is None:
+            rate = self._resolve(path, status_code)
+            if len(self._rate_cache) < 4096:
+                self._rate_cache[key] = rate
+        return rate
+
+    def _resolve(self, path: str, status_code: int) -> float:
+        status_class = f"{status_code // 100}xx"
+        for route in (path, "*"):
+            for status in (str(status_code), status_class, "*"):
+                rate = self.rules.get(f"{route}|{status}")
+                if rate is not None:
+                    return rate
+        return self.default_rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        log_entry = getattr(record, "log_entry", None)
+        if not log_entry:
+            return True
+        rate = self.rate_for(log_entry.get("path", ""), log_entry.get("status_code", 0))
+        if rate >= 1.0:
+            return True
+        return rate > 0.0 and random.random() < rate
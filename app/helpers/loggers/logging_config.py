@@ -1,21 +1,185 @@
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
+import threading
+from app.core.config import settings
+from app.helpers.loggers.json_formatter import AccessLogSampler, JsonFormatter
+
+_listener = None
+_queue_handler = None
+
+
+class LogQueueStats:
+    # Counters for the log shipping queue.
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.queued = 0
+        self.dropped = 0
+        self.written = 0
+        self.batches = 0
+
+    def add(self, field: str, amount: int = 1):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + amount)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "queued": self.queued,
+                "dropped": self.dropped,
+                "written": self.written,
+                "batches": self.batches,
+                "queue_depth": _queue_handler.queue.qsize() if _queue_handler else 0,
+                "queue_max_size": settings.LOG_QUEUE_MAX_SIZE,
+                "full_policy": settings.LOG_QUEUE_FULL_POLICY,
+            }
+
+
+log_queue_stats = LogQueueStats()
+
+
+class BoundedQueueHandler(QueueHandler):
+    # Enqueues records without blocking the caller; when the queue is full the
+    # record is dropped ("drop") or the caller waits up to block_timeout ("block").
+
+    def __init__(self, log_queue: queue.Queue, full_policy: str = "drop", block_timeout: float = 0.05):
+        super().__init__(log_queue)
+        self.full_policy = full_policy
+        self.block_timeout = block_timeout
+
+    def prepare(self, record):
+        # QueueHandler.prepare formats and copies every record on the caller; our formatter
+        # runs on the listener thread, so only records carrying args/exc_info (which may not
+        # survive the hand-off) take that path. Access records are queued as-is.
+        if record.args or record.exc_info:
+            return super().prepare(record)
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.full_policy == "block":
+                self.queue.put(record, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            log_queue_stats.add("dropped")
+            return
+        log_queue_stats.add("queued")
+
+
+class BatchedRotatingFileHandler(RotatingFileHandler):
+    # Writes without the per-record flush; the listener flushes once per batch.
+    # File size is tracked in memory so the rollover check does not seek/flush.
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._bytes_written = os.path.getsize(self.baseFilename) if os.path.exists(self.baseFilename) else 0
+
+    def shouldRollover(self, record) -> bool:
+        return bool(self.maxBytes) and self._bytes_written >= self.maxBytes
+
+    def doRollover(self):
+        super().doRollover()
+        self._bytes_written = 0
+
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            line = self.format(record) + self.terminator
+            self.stream.write(line)
+            self._bytes_written += len(line.encode(self.encoding or "utf-8", errors="replace"))
+        except Exception:
+            self.handleError(record)
+
+
+class BatchingQueueListener(QueueListener):
+    # Drains up to batch_size records per wake-up, writes them, then flushes once.
+    # All file IO (including rotation) happens on this listener thread.
+
+    def __init__(self, log_queue: queue.Queue, *handlers, batch_size: int = 256):
+        super().__init__(log_queue, *handlers, respect_handler_level=True)
+        self.batch_size = batch_size
+
+    def enqueue_sentinel(self):
+        # the queue is bounded: wait for room rather than failing on stop()
+        self.queue.put(self._sentinel)
+
+    def _monitor(self):
+        log_queue = self.queue
+        has_task_done = hasattr(log_queue, "task_done")
+        while True:
+            batch = [self.dequeue(True)]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = False
+            written = 0
+            for record in batch:
+                if record is self._sentinel:
+                    stop = True
+                    continue
+                self.handle(record)
+                written += 1
+
+            for handler in self.handlers:
+                handler.flush()
+            log_queue_stats.add("written", written)
+            log_queue_stats.add("batches")
+
+            if has_task_done:
+                for _ in batch:
+                    log_queue.task_done()
+            if stop:
+                break
 
-LOG_DIR = "logs"
-LOG_FILE_PATH = os.path.join(LOG_DIR, "app.log")
 
 def setup_logging():
-    os.makedirs(os.path.dirname(LOG_FILE_PATH), exist_ok=True)
+    global _listener, _queue_handler
+    # read at call time: app.serve gives every worker its own file before startup
+    log_file_path = settings.LOG_FILE_PATH
+    os.makedirs(os.path.dirname(log_file_path) or ".", exist_ok=True)
 
     logger = logging.getLogger("rotational_logger")
     logger.setLevel(logging.INFO)
 
     if not logger.handlers:
-        handler = RotatingFileHandler(LOG_FILE_PATH, maxBytes=20 * 1024 * 1024, backupCount=7)
-        formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(message)s")
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        handler = BatchedRotatingFileHandler(log_file_path, maxBytes=20 * 1024 * 1024, backupCount=7)
+        # JSON serialization runs on the listener thread, not the request path
+        handler.setFormatter(JsonFormatter())
+
+        log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_MAX_SIZE)
+        _queue_handler = BoundedQueueHandler(
+            log_queue,
+            full_policy=settings.LOG_QUEUE_FULL_POLICY,
+            block_timeout=settings.LOG_QUEUE_BLOCK_TIMEOUT,
+        )
+        # sampled-out access records are discarded before they are queued
+        _queue_handler.addFilter(
+            AccessLogSampler(settings.ACCESS_LOG_SAMPLING, default_rate=settings.ACCESS_LOG_SAMPLE_RATE)
+        )
+        _listener = BatchingQueueListener(log_queue, handler, batch_size=settings.LOG_BATCH_SIZE)
+        _listener.start()
+        logger.addHandler(_queue_handler)
 
     return logger
 
+
+def shutdown_logging():
+    # Drain the queue and close the file handler; setup_logging() can start it again.
+    global _listener, _queue_handler
+    if _queue_handler is not None:
+        logging.getLogger("rotational_logger").removeHandler(_queue_handler)
+        _queue_handler = None
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Union
+from typing import Optional, Union
 from app.helpers.enums.enum_config import userRegisterToken, userRoles
 
 class dataModel(BaseModel):
@@ -18,9 +18,11 @@ class authRegisterUsersRequest(BaseModel):
     role: userRoles
 
 class PaginationModel(BaseModel):
-    total: int
-    page: int
+    total: Optional[int] = None  # not computed in cursor mode
+    is_estimate: bool = False  # total came from planner statistics or the count cache
+    page: Optional[int] = None  # offset mode only
     items_per_page: int
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page; null on the last page
 
 class authGetUsersDataModel(BaseModel):
     users: list
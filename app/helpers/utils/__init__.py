@@ -1,3 +1,10 @@
-from . import custom_openapi, encrypt, jwt_util, password_hash
+from . import (
+    bloom_filter, cursor, custom_openapi, encrypt, fast_json, json_response, jwt_keys, jwt_util,
+    metrics, password_hash, principal_cache, route_rules, token_revocation, ttl_cache, user_serializer
+)
 
-__all__ = ["custom_openapi", "encrypt", "jwt_util", "password_hash"]
\ No newline at end of file
+__all__ = [
+    "bloom_filter", "cursor", "custom_openapi", "encrypt", "fast_json", "json_response", "jwt_keys", "jwt_util",
+    "metrics", "password_hash", "principal_cache", "route_rules", "token_revocation", "ttl_cache",
+    "user_serializer"
+]
\ No newline at end of file
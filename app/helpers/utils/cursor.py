@@ -0,0 +1,32 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Tuple
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: int) -> str:
+    """
+    Build an opaque keyset cursor for the (created_at, id) position of a row.
+    """
+    raw = json.dumps(
+        {"c": created_at.isoformat() if created_at else None, "i": row_id},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Optional[datetime], int]:
+    """
+    Decode a cursor produced by ``encode_cursor``.
+
+    Raises:
+        ValueError: if the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        created_at = datetime.fromisoformat(data["c"]) if data["c"] else None
+        row_id = int(data["i"])
+    except Exception as exc:
+        raise ValueError("Invalid pagination cursor") from exc
+    return created_at, row_id
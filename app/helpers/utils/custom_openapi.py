@@ -1,9 +1,25 @@
+import os
 from fastapi.openapi.utils import get_openapi
-from app.core.config import Settings
+from app.core.config import settings
+from app.helpers.utils.fast_json import dumps_bytes, loads
 
 def custom_openapi(app):
     if app.openapi_schema:
         return app.openapi_schema
+    # prebuilt schema: no route walk / model schema generation in the serving process
+    if settings.OPENAPI_SCHEMA_FILE:
+        if not os.path.exists(settings.OPENAPI_SCHEMA_FILE):
+            # a missed build step, not a reason to quietly generate it in every worker
+            raise FileNotFoundError(
+                f"OPENAPI_SCHEMA_FILE {settings.OPENAPI_SCHEMA_FILE} does not exist (python -m app.build_openapi)"
+            )
+        with open(settings.OPENAPI_SCHEMA_FILE, "rb") as handle:
+            app.openapi_schema = loads(handle.read())
+        return app.openapi_schema
+    app.openapi_schema = build_openapi(app)
+    return app.openapi_schema
+
+def build_openapi(app):
     openapi_schema = get_openapi(
         title="Backend Automation System",
         version="1.0.0",
@@ -43,5 +59,9 @@ def custom_openapi(app):
 
         for method in methods.values():
             method["security"] = [{"BearerAuth": []}]
-    app.openapi_schema = openapi_schema
     return openapi_schema
+
+def write_openapi(app, path: str):
+    # Build step: generate the schema and write it where OPENAPI_SCHEMA_FILE points.
+    with open(path, "wb") as handle:
+        handle.write(dumps_bytes(build_openapi(app)))
@@ -1,21 +1,23 @@
-from cryptography.fernet import Fernet
+from functools import lru_cache
 from app.core.config import settings
 
-# encryption key
-KEY = settings.ENCRYPTION_KEY
-cipher_suite = Fernet(KEY)
+# Fernet cipher, built on first use (the startup event), not when the app is imported
+@lru_cache(maxsize=None)
+def get_cipher():
+    from cryptography.fernet import Fernet
+    return Fernet(settings.ENCRYPTION_KEY)
 
 # to encrypt
 def encrypt(data: str) -> str:
-    encrypted = cipher_suite.encrypt(data.encode())
+    encrypted = get_cipher().encrypt(data.encode())
     return encrypted.decode()
 
 # to decrypt
 def decrypt(data: str) -> str:
-    decrypted = cipher_suite.decrypt(data.encode())
+    decrypted = get_cipher().decrypt(data.encode())
     return decrypted.decode()
 
 def is_encryption_required(url: str) -> bool:
     # Protected urls
     required_urls = ["/registerUsers", "/login", "/logout"]
-    return any(required_url in url for required_url in required_urls)
\ No newline at end of file
+    return any(required_url in url for required_url in required_urls)
@@ -0,0 +1,37 @@
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+
+def _default(value: Any) -> Any:
+    # stdlib fallback for types orjson handles natively
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if hasattr(value, "value"):
+        return value.value
+    return str(value)
+
+
+def dumps_bytes(data: Any) -> bytes:
+    """
+    Serialize to compact UTF-8 JSON bytes (orjson when installed, stdlib otherwise).
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def dumps(data: Any) -> str:
+    return dumps_bytes(data).decode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,11 @@
+from typing import Any
+from starlette.responses import JSONResponse
+from app.helpers.utils.fast_json import dumps_bytes
+
+
+class FastJSONResponse(JSONResponse):
+    # JSONResponse rendered with orjson when installed (stdlib fallback); datetimes
+    # and enums are serialized natively, so payloads need no .isoformat()/.value pass.
+
+    def render(self, content: Any) -> bytes:
+        return dumps_bytes(content)
@@ -0,0 +1,121 @@
+"""
+Asymmetric key support for ``jwt_keys``: PEM loading, the usual JWS algorithm
+per key type, and an EdDSA (Ed25519) key class for python-jose.
+
+Imported only when an asymmetric algorithm or verification key is configured,
+so HS256 deployments never load ``cryptography``'s key machinery.
+"""
+from typing import Any, Dict
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jose import jwk
+from jose.backends.base import Key
+from jose.constants import ALGORITHMS
+from jose.exceptions import JWKError
+from jose.utils import base64url_decode, base64url_encode
+
+EDDSA = "EdDSA"
+
+_EC_ALGORITHMS = {"secp256r1": "ES256", "secp384r1": "ES384", "secp521r1": "ES512"}
+
+
+class Ed25519Key(Key):
+    """
+    EdDSA (Ed25519) key for python-jose, which has no OKP backend of its own.
+    Registered under ``"EdDSA"`` below, so ``jwt.encode``/``jwt.decode`` accept it.
+    """
+
+    def __init__(self, key, algorithm):
+        if algorithm != EDDSA:
+            raise JWKError(f"{algorithm} is not an EdDSA algorithm")
+        self._algorithm = algorithm
+        if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+            self._key = key
+        elif isinstance(key, dict):
+            self._key = self._from_jwk(key)
+        else:
+            self._key = load_pem(key)
+            if not isinstance(self._key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+                raise JWKError("Not an Ed25519 key")
+
+    @staticmethod
+    def _from_jwk(data: Dict[str, Any]):
+        if data.get("kty") != "OKP" or data.get("crv") != "Ed25519":
+            raise JWKError("Not an Ed25519 JWK")
+        if "d" in data:
+            return ed25519.Ed25519PrivateKey.from_private_bytes(base64url_decode(data["d"].encode()))
+        return ed25519.Ed25519PublicKey.from_public_bytes(base64url_decode(data["x"].encode()))
+
+    def is_public(self) -> bool:
+        return isinstance(self._key, ed25519.Ed25519PublicKey)
+
+    def sign(self, msg: bytes) -> bytes:
+        return self._key.sign(msg)
+
+    def verify(self, msg: bytes, sig: bytes) -> bool:
+        public = self._key if self.is_public() else self._key.public_key()
+        try:
+            public.verify(sig, msg)
+            return True
+        except InvalidSignature:
+            return False
+
+    def public_key(self) -> "Ed25519Key":
+        if self.is_public():
+            return self
+        return Ed25519Key(self._key.public_key(), self._algorithm)
+
+    def to_pem(self) -> bytes:
+        if self.is_public():
+            return self._key.public_bytes(serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo)
+        return self._key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+
+    def to_dict(self) -> Dict[str, str]:
+        public = self._key if self.is_public() else self._key.public_key()
+        raw = public.public_bytes(serialization.Encoding.Raw, serialization.PublicFormat.Raw)
+        data = {"alg": self._algorithm, "kty": "OKP", "crv": "Ed25519", "x": base64url_encode(raw).decode()}
+        if not self.is_public():
+            private = self._key.private_bytes(
+                serialization.Encoding.Raw, serialization.PrivateFormat.Raw, serialization.NoEncryption()
+            )
+            data["d"] = base64url_encode(private).decode()
+        return data
+
+
+jwk.register_key(EDDSA, Ed25519Key)
+
+
+def _read_pem(value: str) -> bytes:
+    # settings hold either the PEM text itself or the path of a PEM file
+    if value.lstrip().startswith("-----BEGIN"):
+        return value.encode()
+    with open(value, "rb") as handle:
+        return handle.read()
+
+
+def load_pem(value):
+    data = value if isinstance(value, bytes) else _read_pem(value)
+    if b"PRIVATE KEY" in data:
+        return serialization.load_pem_private_key(data, password=None)
+    return serialization.load_pem_public_key(data)
+
+
+def load_public_pem(value):
+    # a private key file works as a verification key too
+    key = load_pem(value)
+    return key.public_key() if hasattr(key, "public_key") else key
+
+
+def algorithm_for(public_key) -> str:
+    # verification-only keys carry no algorithm setting; use the usual one for the key type
+    if isinstance(public_key, rsa.RSAPublicKey):
+        return ALGORITHMS.RS256
+    if isinstance(public_key, ec.EllipticCurvePublicKey) and public_key.curve.name in _EC_ALGORITHMS:
+        return _EC_ALGORITHMS[public_key.curve.name]
+    if isinstance(public_key, ed25519.Ed25519PublicKey):
+        return EDDSA
+    raise ValueError(f"Unsupported verification key type {type(public_key).__name__}")
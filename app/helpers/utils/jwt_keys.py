@@ -0,0 +1,112 @@
+import base64
+import hashlib
+import json
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+from jose.constants import ALGORITHMS
+from jose.exceptions import JWTError
+
+from app.core.config import settings
+from app.helpers.enums.enum_config import jwtAuth
+
+# RFC 7638: the members hashed for a JWK thumbprint, per key type
+_THUMBPRINT_MEMBERS = {"RSA": ("e", "kty", "n"), "EC": ("crv", "kty", "x", "y"), "OKP": ("crv", "kty", "x")}
+
+
+def jwk_thumbprint(public_jwk: Dict[str, str]) -> str:
+    """
+    RFC 7638 thumbprint of a public JWK (base64url SHA-256), used as the
+    default ``kid`` so the same key always gets the same id.
+    """
+    members = _THUMBPRINT_MEMBERS[public_jwk["kty"]]
+    canonical = json.dumps({name: public_jwk[name] for name in members}, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(hashlib.sha256(canonical.encode()).digest()).rstrip(b"=").decode()
+
+
+class JWTKeyRing:
+    """
+    Signing key plus every key tokens are still accepted with, parsed once.
+
+    HMAC algorithms sign and verify with the shared secret; nothing is
+    published. Asymmetric algorithms (RS*, ES*, EdDSA) sign with the private
+    key, stamp its ``kid`` into the token header and publish the public keys
+    as a JWKS, so other services verify tokens locally. Rotation: sign with
+    the new key and keep the old public key in ``verification_keys`` until
+    the tokens it signed have expired.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        secret: str = "",
+        private_key: str = "",
+        key_id: str = "",
+        verification_keys: Optional[Dict[str, str]] = None,
+    ):
+        # python-jose loads its cryptography backend on import: deferred until a key ring is built
+        from jose import jwk
+
+        self.algorithm = algorithm
+        # kid -> (public key object, algorithm)
+        self._verification: Dict[str, Tuple[Any, str]] = {}
+
+        if algorithm in ALGORITHMS.HMAC:
+            if not secret:
+                raise ValueError(f"JWT_SECRET_KEY is required for {algorithm}")
+            self.signing_key = jwk.construct(secret, algorithm)
+            self.kid = key_id or None
+            self._default = (self.signing_key, algorithm)
+        else:
+            from app.helpers.utils.jwt_asymmetric import load_pem
+
+            if not private_key:
+                raise ValueError(f"JWT_PRIVATE_KEY is required for {algorithm}")
+            self.signing_key = jwk.construct(load_pem(private_key), algorithm)
+            public = self.signing_key.public_key()
+            self.kid = key_id or jwk_thumbprint(public.to_dict())
+            self._default = (public, algorithm)
+
+        if self.kid:
+            self._verification[self.kid] = self._default
+        for kid, pem in (verification_keys or {}).items():
+            from app.helpers.utils.jwt_asymmetric import algorithm_for, load_public_pem
+
+            public_key = load_public_pem(pem)
+            key_algorithm = algorithm_for(public_key)
+            self._verification.setdefault(kid, (jwk.construct(public_key, key_algorithm), key_algorithm))
+
+        self.headers = {"kid": self.kid} if self.kid else None
+        self.jwks_body = json.dumps(self.jwks(), separators=(",", ":")).encode()
+        self.jwks_etag = f'"{hashlib.sha256(self.jwks_body).hexdigest()[:32]}"'
+
+    def verification_key(self, kid: Optional[str]) -> Tuple[Any, str]:
+        # tokens without a kid (issued before one was set) are checked against the signing key
+        if kid is None:
+            return self._default
+        try:
+            return self._verification[kid]
+        except KeyError:
+            raise JWTError(f"Unknown signing key id {kid!r}")
+
+    def jwks(self) -> Dict[str, Any]:
+        keys = []
+        for kid, (key, algorithm) in self._verification.items():
+            if algorithm in ALGORITHMS.HMAC:
+                continue  # shared secrets are never published
+            keys.append({**key.to_dict(), "kid": kid, "alg": algorithm, "use": "sig"})
+        return {"keys": keys}
+
+
+@lru_cache(maxsize=None)
+def get_keyring() -> JWTKeyRing:
+    """
+    The application's key ring, built (keys parsed) on first use rather than at import.
+    """
+    return JWTKeyRing(
+        algorithm=jwtAuth.ALGORITHM.value,
+        secret=jwtAuth.SECRET_KEY.value,
+        private_key=settings.JWT_PRIVATE_KEY,
+        key_id=settings.JWT_KEY_ID,
+        verification_keys=settings.JWT_VERIFICATION_KEYS,
+    )
@@ -1,22 +1,37 @@
 from datetime import datetime, timedelta, timezone
 from typing import Optional, Tuple, Dict, Any
-from jose import jwt, JWTError, ExpiredSignatureError
+import hashlib
 import logging
+import math
+import time
+import uuid
+from app.core.config import settings
 from app.helpers.enums.enum_config import jwtAuth
+from app.helpers.utils.jwt_keys import get_keyring
+from app.helpers.utils.ttl_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# token digest -> verified claims, evicted at the token's exp
+verified_token_cache = TTLCache(
+    max_size=settings.JWT_VERIFY_CACHE_MAX_SIZE,
+    ttl_seconds=settings.JWT_VERIFY_CACHE_TTL_SECONDS,
+)
+
 
 def create_access_token(
     data: Dict[str, Any],
     expires_delta: Optional[timedelta] = None
 ) -> Tuple[str, str]:
     """
-    Create a signed JWT access token.
+    Create a signed JWT access token (with ``iat``, ``exp`` and a random ``jti``).
 
     Returns:
         (token, expiration_time_iso)
     """
+    # imported on first use: python-jose pulls in its cryptography backend
+    from jose import jwt, JWTError
+
     try:
         if "sub" not in data:
             raise ValueError("JWT payload must include 'sub' claim")
@@ -31,14 +46,21 @@ def create_access_token(
         )
 
         to_encode.update({
-            "iat": now,
+            # millisecond iat so a "revoke all" cutoff separates tokens issued within the same second;
+            # truncated, never rounded up past the real issue time (and so past a later cutoff)
+            "iat": math.floor(now.timestamp() * 1000) / 1000,
             "exp": expire,
         })
+        # unique token id, the key for revoking a single token (logout)
+        to_encode.setdefault("jti", uuid.uuid4().hex)
 
+        # key object parsed once (see jwt_keys); a PEM or secret string would be re-parsed per call
+        keyring = get_keyring()
         encoded_jwt = jwt.encode(
             to_encode,
-            jwtAuth.SECRET_KEY.value,
-            algorithm=jwtAuth.ALGORITHM.value,
+            keyring.signing_key,
+            algorithm=keyring.algorithm,
+            headers=keyring.headers,
         )
 
         return encoded_jwt, expire.isoformat()
@@ -51,20 +73,48 @@ def create_access_token(
         logger.exception("Unexpected error while creating JWT")
         raise RuntimeError("Internal token generation error") from exc
 
+def _token_digest(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+def _cache_verified(digest: bytes, payload: Dict[str, Any]):
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)):
+        return
+    # exp is wall-clock; the cache runs on the monotonic clock
+    expires_at = time.monotonic() + (exp - time.time())
+    verified_token_cache.set(digest, payload, expires_at=expires_at)
+
+
 def verify_token(token: str) -> Dict[str, Any]:
     """
     Verify JWT token and return payload.
 
+    The key is chosen by the token's ``kid`` header, so tokens signed with a
+    retired key stay valid while it is listed in ``JWT_VERIFICATION_KEYS``.
+    Tokens that already passed signature verification are served from
+    ``verified_token_cache`` until their ``exp``.
+
     Raises:
         ValueError: if token is invalid or expired
     """
+    digest = _token_digest(token)
+    cached = verified_token_cache.get(digest)
+    if cached is not None:
+        return dict(cached)
+
+    from jose import jwt, JWTError, ExpiredSignatureError
+
     try:
+        # the header's kid picks the key (and with it the only algorithm accepted)
+        key, algorithm = get_keyring().verification_key(jwt.get_unverified_header(token).get("kid"))
         payload = jwt.decode(
             token,
-            jwtAuth.SECRET_KEY.value,
-            algorithms=[jwtAuth.ALGORITHM.value],
+            key,
+            algorithms=[algorithm],
         )
-        return payload
+        _cache_verified(digest, payload)
+        return dict(payload)
 
     except ExpiredSignatureError:
         logger.warning("JWT verification failed: token expired")
@@ -0,0 +1,220 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Updates are lock-free: every thread writes to its own shard (a plain dict
+reached through ``threading.local``), and shards are merged only when
+``/metrics`` is scraped. The only lock is taken once per thread per metric,
+when that thread's shard is registered.
+"""
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+class _ShardedMetric:
+    type_name = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._local = threading.local()
+        self._shards: List[dict] = []
+        self._shards_lock = threading.Lock()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "values", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.values = shard
+        return shard
+
+    def _snapshots(self) -> List[dict]:
+        # dict.copy() runs without releasing the GIL, so a writer can't resize it mid-copy
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+    def clear(self):
+        with self._shards_lock:
+            for shard in self._shards:
+                shard.clear()
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+
+class Counter(_ShardedMetric):
+    type_name = "counter"
+
+    def inc(self, labels: LabelValues = (), amount: float = 1):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[LabelValues, float]:
+        merged: Dict[LabelValues, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                merged[labels] = merged.get(labels, 0) + value
+        return merged
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        for labels, value in sorted(self.values().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_ShardedMetric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, labels: LabelValues = ()):
+        shard = self._shard()
+        entry = shard.get(labels)
+        if entry is None:
+            # per-bucket (non-cumulative) counts, the last slot is +Inf; then the sum
+            entry = shard[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def values(self) -> Dict[LabelValues, Tuple[List[int], float]]:
+        merged: Dict[LabelValues, Tuple[List[int], float]] = {}
+        for shard in self._snapshots():
+            for labels, (counts, total) in shard.items():
+                counts = list(counts)
+                if labels in merged:
+                    prev_counts, prev_total = merged[labels]
+                    counts = [a + b for a, b in zip(prev_counts, counts)]
+                    total += prev_total
+                merged[labels] = (counts, total)
+        return merged
+
+    def render(self) -> List[str]:
+        lines = self.header()
+        bucket_names = self.labelnames + ("le",)
+        for labels, (counts, total) in sorted(self.values().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(bucket_names, labels + (_format_value(bound),))} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            # the count is derived from the buckets so the two always agree
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class GaugeCallback:
+    # Gauge whose samples are read from a callback at scrape time (pool and queue stats).
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], callback: Callable[[], Iterable[Tuple[LabelValues, float]]]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.callback = callback
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for labels, value in self.callback():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def gauge_callback(self, name: str, documentation: str, labelnames: Sequence[str], callback) -> GaugeCallback:
+        return self.register(GaugeCallback(name, documentation, labelnames, callback))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            try:
+                lines.extend(metric.render())
+            except Exception as e:
+                # one failing collector must not take the whole scrape down
+                print(f"Error while collecting metric {metric.name} :: {str(e)}")
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP (recorded by RequestPipelineMiddleware)
+http_requests_total = registry.counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ("method", "route", "status")
+)
+http_request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template.", ("method", "route")
+)
+
+# Database (recorded by cursor execute events, see app.connections.query_metrics)
+db_query_duration_seconds = registry.histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time by engine and statement type.",
+    ("engine", "operation"),
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# Password hashing (recorded by app.helpers.utils.password_hash)
+password_hash_duration_seconds = registry.histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hash/verify time on the hashing pool.",
+    ("operation",),
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+password_hash_queue_seconds = registry.histogram(
+    "password_hash_queue_seconds",
+    "Time a hash/verify call waited for a hashing slot.",
+    ("operation",),
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
@@ -1,3 +1,177 @@
-from passlib.context import CryptContext
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
\ No newline at end of file
+from app.core.config import settings
+from app.helpers.utils.metrics import password_hash_duration_seconds, password_hash_queue_seconds
+
+
+@lru_cache(maxsize=None)
+def get_pwd_context():
+    # passlib is imported and the CryptContext built on first use, not at startup
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+def __getattr__(name: str):
+    # keeps `from app.helpers.utils.password_hash import pwd_context` working
+    if name == "pwd_context":
+        return get_pwd_context()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+_semaphore: asyncio.Semaphore | None = None
+
+
+class HashingStats:
+    # Counters for the password hashing pool (queue depth, wait and CPU time).
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.queued = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self.hash_seconds_total = 0.0
+
+    def enqueue(self):
+        with self._lock:
+            self.queued += 1
+            if self.queued > self.peak_queued:
+                self.peak_queued = self.queued
+
+    def dequeue(self):
+        # called whether the wait ended in a slot or in cancellation (e.g. a request timeout)
+        with self._lock:
+            self.queued -= 1
+
+    def start(self, waited: float):
+        with self._lock:
+            self.in_flight += 1
+            self.wait_seconds_total += waited
+            if waited > self.wait_seconds_max:
+                self.wait_seconds_max = waited
+
+    def finish(self, elapsed: float):
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            self.hash_seconds_total += elapsed
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "executor": settings.PASSWORD_HASH_EXECUTOR,
+                "workers": _worker_count(),
+                "max_concurrency": _max_concurrency(),
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "queue_wait_seconds_total": round(self.wait_seconds_total, 6),
+                "queue_wait_seconds_max": round(self.wait_seconds_max, 6),
+                "hash_seconds_total": round(self.hash_seconds_total, 6),
+            }
+
+
+hashing_stats = HashingStats()
+
+
+def _worker_count() -> int:
+    return settings.PASSWORD_HASH_WORKERS or min(4, os.cpu_count() or 1)
+
+
+def _max_concurrency() -> int:
+    return settings.PASSWORD_HASH_MAX_CONCURRENCY or _worker_count()
+
+
+def _get_executor() -> Executor:
+    # Created on first use so forked workers never inherit a parent's pool threads/processes.
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                if settings.PASSWORD_HASH_EXECUTOR == "process":
+                    _executor = ProcessPoolExecutor(max_workers=_worker_count())
+                else:
+                    _executor = ThreadPoolExecutor(
+                        max_workers=_worker_count(), thread_name_prefix="password-hash"
+                    )
+    return _executor
+
+
+def _get_semaphore() -> asyncio.Semaphore:
+    global _semaphore
+    if _semaphore is None:
+        _semaphore = asyncio.Semaphore(_max_concurrency())
+    return _semaphore
+
+
+# module level so they can be pickled into a process pool
+def _hash(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+
+def _verify(password: str, hashed: str) -> bool:
+    return get_pwd_context().verify(password, hashed)
+
+
+async def _run(func, *args):
+    operation = "hash" if func is _hash else "verify"
+    semaphore = _get_semaphore()
+    hashing_stats.enqueue()
+    queued_at = time.perf_counter()
+    try:
+        await semaphore.acquire()
+    finally:
+        hashing_stats.dequeue()
+    started = time.perf_counter()
+    hashing_stats.start(started - queued_at)
+    password_hash_queue_seconds.observe(started - queued_at, (operation,))
+
+    def finished(_future=None):
+        # the slot is held until bcrypt actually returns, even if the caller was cancelled meanwhile
+        elapsed = time.perf_counter() - started
+        hashing_stats.finish(elapsed)
+        password_hash_duration_seconds.observe(elapsed, (operation,))
+        semaphore.release()
+
+    try:
+        future = asyncio.get_running_loop().run_in_executor(_get_executor(), func, *args)
+    except BaseException:
+        finished()
+        raise
+    future.add_done_callback(finished)
+    # cancelling the caller (request timeout, disconnect) must not mark the running hash as done
+    return await asyncio.shield(future)
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password on the hashing pool without blocking the event loop.
+    """
+    return await _run(_hash, password)
+
+
+async def verify_password(password: str, hashed: str) -> bool:
+    """
+    Verify a password against its hash on the hashing pool.
+    """
+    return await _run(_verify, password, hashed)
+
+
+def shutdown_password_executor():
+    # Stop hashing workers on shutdown. Called on the event loop: queued hashes are cancelled
+    # and a running one finishes in the background instead of blocking the loop.
+    global _executor, _semaphore
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+    _semaphore = None
@@ -0,0 +1,64 @@
+from typing import Any, Optional
+
+from sqlalchemy import event, inspect
+
+from app.core.config import settings
+from app.helpers.enums.enum_config import userRoles
+from app.helpers.utils.ttl_cache import TTLCache
+from app.models.user_model import UserModel
+
+
+class Principal:
+    # Slim authenticated identity cached in place of the full UserModel row.
+    __slots__ = ("id", "role", "is_active")
+
+    def __init__(self, id: int, role: userRoles, is_active: bool):
+        self.id = id
+        self.role = role
+        self.is_active = is_active
+
+    @classmethod
+    def from_user(cls, user: Any) -> "Principal":
+        return cls(id=user.id, role=user.role, is_active=user.is_active)
+
+    def __repr__(self) -> str:
+        return f"Principal(id={self.id!r}, role={self.role!r}, is_active={self.is_active!r})"
+
+
+principal_cache = TTLCache(
+    max_size=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
+
+
+def get_cached_principal(user_id: int, issued_at: Any) -> Optional[Principal]:
+    return principal_cache.get((user_id, issued_at))
+
+
+def cache_principal(principal: Principal, issued_at: Any):
+    # only active users are cached so re-activation is visible immediately
+    if principal.is_active:
+        principal_cache.set((principal.id, issued_at), principal)
+
+
+def invalidate_principal(user_id: int) -> int:
+    """
+    Drop every cached principal for a user (all tokens).
+
+    Call after deactivating a user or changing their role outside the ORM
+    (bulk UPDATEs); ORM updates of ``is_active``/``role`` are handled by the
+    listener below.
+    """
+    return principal_cache.discard_where(lambda key, _: key[0] == user_id)
+
+
+@event.listens_for(UserModel, "after_update")
+def _invalidate_on_user_change(mapper, connection, target):
+    state = inspect(target)
+    if state.attrs.is_active.history.has_changes() or state.attrs.role.history.has_changes():
+        invalidate_principal(target.id)
+
+
+@event.listens_for(UserModel, "after_delete")
+def _invalidate_on_user_delete(mapper, connection, target):
+    invalidate_principal(target.id)
@@ -0,0 +1,155 @@
+import re
+import threading
+from abc import ABC, abstractmethod
+import time
+from typing import Callable, Dict, Hashable, NamedTuple, Optional
+
+from app.core.config import settings
+from app.helpers.utils.metrics import registry
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+_RATE_RE = re.compile(r"^\s*(\d+)\s*/\s*(second|minute|hour|day)s?\s*$")
+
+
+class RateLimit(NamedTuple):
+    # Token bucket: up to `capacity` requests in a burst, refilled at `rate` tokens per second.
+    capacity: int
+    rate: float
+
+    @classmethod
+    def parse(cls, value: str) -> Optional["RateLimit"]:
+        """
+        Parse ``"<count>/<second|minute|hour|day>"``; an empty string or a zero
+        count means unlimited and returns ``None``.
+        """
+        if not value or not value.strip():
+            return None
+        match = _RATE_RE.match(value)
+        if not match:
+            raise ValueError(f"Invalid rate limit {value!r}, expected e.g. '10/minute'")
+        count = int(match.group(1))
+        if count == 0:
+            return None
+        return cls(capacity=count, rate=count / _PERIODS[match.group(2)])
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage for token buckets.
+
+    ``hit`` takes ``cost`` tokens from the bucket at ``key`` and returns 0 when
+    the request is allowed, otherwise the seconds until enough tokens are back.
+    The interface is async so a shared store (e.g. Redis) can replace the
+    in-process backend without touching callers.
+    """
+
+    @abstractmethod
+    async def hit(self, key: Hashable, limit: RateLimit, cost: int = 1) -> float:
+        ...
+
+    @abstractmethod
+    async def reset(self, key: Hashable):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets in one dict of ``key -> (tokens, updated_at, refill_seconds)``.
+
+    Buckets are refilled lazily when hit. The dict is kept in last-hit order,
+    so every ``sweep_interval`` seconds idle buckets (already back to full) are
+    dropped from the front, and the oldest go first past ``max_keys``; a
+    dropped bucket simply starts full again.
+    """
+
+    def __init__(self, max_keys: int = 100000, sweep_interval: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        self.max_keys = max_keys
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._buckets: Dict[Hashable, tuple] = {}
+        self._lock = threading.Lock()
+        self._last_sweep = clock()
+        self.evictions = 0
+
+    async def hit(self, key: Hashable, limit: RateLimit, cost: int = 1) -> float:
+        now = self._clock()
+        with self._lock:
+            entry = self._buckets.pop(key, None)
+            if entry is None:
+                tokens = float(limit.capacity)
+            else:
+                tokens, updated_at, _ = entry
+                tokens = min(float(limit.capacity), tokens + (now - updated_at) * limit.rate)
+
+            if tokens >= cost:
+                tokens -= cost
+                retry_after = 0.0
+            else:
+                retry_after = (cost - tokens) / limit.rate
+
+            # re-inserted at the end: the dict stays ordered by last hit
+            self._buckets[key] = (tokens, now, limit.capacity / limit.rate)
+
+            if now - self._last_sweep >= self.sweep_interval or len(self._buckets) > self.max_keys:
+                self._sweep(now)
+        return retry_after
+
+    def _sweep(self, now: float):
+        # caller holds the lock
+        self._last_sweep = now
+        for key in list(self._buckets):
+            _, updated_at, refill_seconds = self._buckets[key]
+            if now - updated_at < refill_seconds and len(self._buckets) <= self.max_keys:
+                # later buckets were hit more recently; they go once they reach the front
+                break
+            del self._buckets[key]
+            self.evictions += 1
+
+    async def reset(self, key: Hashable):
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"buckets": len(self._buckets), "max_keys": self.max_keys, "evictions": self.evictions}
+
+
+class RateLimiter:
+    # Entry point used by the middleware and route dependencies; swap `backend` for a shared store.
+    # The in-memory backend is per process: under N workers a client may get up to N times a limit.
+
+    def __init__(self, backend: RateLimitBackend):
+        self.backend = backend
+    async def hit(self, name: str, identity: Hashable, limit: Optional[RateLimit], cost: int = 1) -> float:
+        # `name` namespaces the bucket (route, "login:ip", ...); returns seconds to wait, 0 if allowed
+        if limit is None or not settings.RATE_LIMIT_ENABLED:
+            return 0.0
+        retry_after = await self.backend.hit((name, identity), limit, cost)
+        if retry_after:
+            rate_limit_rejections_total.inc((name,))
+        return retry_after
+
+
+rate_limit_rejections_total = registry.counter(
+    "rate_limit_rejections_total", "Requests rejected by a rate limit, by limit name.", ("limit",)
+)
+
+rate_limiter = RateLimiter(InMemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS))
+
+registry.gauge_callback(
+    "rate_limit_backend",
+    "Rate limiter backend state.",
+    ("stat",),
+    lambda: [((key,), value) for key, value in rate_limiter.backend.stats().items()],
+)
@@ -0,0 +1,20 @@
+from typing import Any, Dict, Optional
+
+
+class PrefixRules:
+    """
+    Per-route setting keyed by path prefix.
+
+    The longest matching prefix wins, so ``/api/v1/auth/exportUsers`` overrides
+    ``/api/v1/auth``; ``default`` applies when no prefix matches.
+    """
+
+    def __init__(self, default: Any, overrides: Optional[Dict[str, Any]] = None):
+        self.default = default
+        self.rules = sorted((overrides or {}).items(), key=lambda item: len(item[0]), reverse=True)
+
+    def lookup(self, path: str) -> Any:
+        for prefix, value in self.rules:
+            if path.startswith(prefix):
+                return value
+        return self.default
@@ -0,0 +1,136 @@
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.core.config import settings
+from app.helpers.utils.bloom_filter import BloomFilter
+
+
+class TokenRevocationList:
+    """
+    In-memory view of revoked tokens, checked on every authenticated request.
+
+    * revoked ``jti`` values sit in a Bloom filter backed by an exact
+      ``jti -> exp`` map: a token that was never revoked (almost every token)
+      is cleared by the filter alone, and the map only settles filter hits;
+    * "revoke all" is a per-user cutoff: tokens issued at or before it are
+      rejected.
+
+    Rebuilt from the database at startup and kept current incrementally (local
+    revocations immediately, other workers' via the refresher). Entries and
+    cutoffs are dropped once the tokens they cover have expired anyway. ``loaded``
+    stays false until one full load has succeeded; until then nothing can be
+    cleared as not revoked.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._lock = threading.Lock()
+        self._revoked: Dict[str, float] = {}
+        self._user_cutoffs: Dict[int, float] = {}
+        self._bloom = BloomFilter(capacity, error_rate)
+        self.loaded = False
+        self.checks = 0
+        self.filter_negatives = 0
+        self.false_positives = 0
+        self.rejected = 0
+
+    def rebuild(self, tokens: Iterable[Tuple[str, float]], user_cutoffs: Iterable[Tuple[int, float]]):
+        # Replace the whole state (startup, or after many entries expired).
+        now = time.time()
+        revoked = {jti: exp for jti, exp in tokens if exp > now}
+        bloom = BloomFilter(max(self.capacity, 2 * len(revoked)), self.error_rate)
+        for jti in revoked:
+            bloom.add(jti)
+        with self._lock:
+            self._revoked = revoked
+            self._bloom = bloom
+            self._user_cutoffs = dict(user_cutoffs)
+
+    def revoke(self, jti: str, expires_at: float):
+        with self._lock:
+            if jti in self._revoked:
+                return
+            self._revoked[jti] = expires_at
+            self._bloom.add(jti)
+            full = self._bloom.count > self._bloom.capacity
+        if full:
+            # past capacity the false positive rate climbs; resize
+            self.rebuild(list(self._revoked.items()), list(self._user_cutoffs.items()))
+
+    def revoke_user(self, user_id: int, cutoff: float):
+        with self._lock:
+            if cutoff > self._user_cutoffs.get(user_id, 0):
+                self._user_cutoffs[user_id] = cutoff
+
+    def is_revoked(self, payload: Dict[str, Any]) -> bool:
+        self.checks += 1
+        cutoff = self._user_cutoffs.get(_user_id(payload))
+        if cutoff is not None and (payload.get("iat") or 0) <= cutoff:
+            self.rejected += 1
+            return True
+
+        jti = payload.get("jti")
+        if not jti:
+            return False
+        if jti not in self._bloom:
+            self.filter_negatives += 1
+            return False
+        if jti in self._revoked:
+            self.rejected += 1
+            return True
+        self.false_positives += 1
+        return False
+
+    def prune(self) -> int:
+        # Drop expired jtis and cutoffs every token they cover has outlived;
+        # rebuilds the filter when most of it is stale. Returns how many went.
+        now = time.time()
+        outlived = now - settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        with self._lock:
+            expired = [jti for jti, exp in self._revoked.items() if exp <= now]
+            for jti in expired:
+                del self._revoked[jti]
+            past = [user_id for user_id, cutoff in self._user_cutoffs.items() if cutoff <= outlived]
+            for user_id in past:
+                del self._user_cutoffs[user_id]
+            stale = self._bloom.count > 2 * max(len(self._revoked), self.capacity // 2)
+        if stale:
+            self.rebuild(list(self._revoked.items()), list(self._user_cutoffs.items()))
+        return len(expired) + len(past)
+
+    def load(self, tokens: Iterable[Tuple[str, float]], user_cutoffs: Iterable[Tuple[int, float]]):
+        # Full state from the database.
+        self.rebuild(tokens, user_cutoffs)
+        self.loaded = True
+
+    def clear(self):
+        self.rebuild((), ())
+        self.loaded = False
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "revoked_tokens": len(self._revoked),
+                "users_revoked": len(self._user_cutoffs),
+                "filter_bits": self._bloom.size,
+                "filter_hashes": self._bloom.hash_count,
+                "filter_entries": self._bloom.count,
+                "checks": self.checks,
+                "filter_negatives": self.filter_negatives,
+                "false_positives": self.false_positives,
+                "rejected": self.rejected,
+            }
+
+
+def _user_id(payload: Dict[str, Any]) -> Optional[int]:
+    sub = payload.get("sub")
+    return int(sub) if sub is not None and str(sub).isdigit() else None
+
+
+token_revocations = TokenRevocationList(
+    capacity=settings.TOKEN_REVOCATION_FILTER_CAPACITY,
+    error_rate=settings.TOKEN_REVOCATION_FILTER_ERROR_RATE,
+)
@@ -0,0 +1,62 @@
+from typing import Any, Iterable, List
+from app.models.user_model import UserModel
+
+# Column sets for the auth hot paths: never load the password hash or access_token unless needed
+LOGIN_COLUMNS = (UserModel.id, UserModel.user_name, UserModel.email, UserModel.role, UserModel.password)
+PRINCIPAL_COLUMNS = (UserModel.id, UserModel.role, UserModel.is_active)
+PROFILE_COLUMNS = (
+    UserModel.id,
+    UserModel.user_name,
+    UserModel.email,
+    UserModel.is_active,
+    UserModel.last_login,
+    UserModel.created_at,
+)
+
+# Columns selected for list endpoints: rows come back as plain tuples, no ORM identities
+USER_LIST_COLUMNS = (
+    UserModel.id,
+    UserModel.user_name,
+    UserModel.email,
+    UserModel.role,
+    UserModel.last_login,
+    UserModel.created_at,
+)
+
+
+def user_rows_to_wire(rows: Iterable[Any]) -> List[dict]:
+    """
+    Map ``USER_LIST_COLUMNS`` rows straight to wire objects.
+
+    Datetimes and the role enum are left as-is for FastJSONResponse to encode.
+    """
+    return [
+        {
+            "id": str(user_id),
+            "username": user_name,
+            "email": email,
+            "role": role,
+            "lastLogin": last_login,
+            "createdAt": created_at,
+        }
+        for user_id, user_name, email, role, last_login, created_at in rows
+    ]
+
+
+# Columns streamed by the admin export
+USER_EXPORT_COLUMNS = USER_LIST_COLUMNS + (UserModel.is_active,)
+USER_EXPORT_FIELDS = ("id", "username", "email", "role", "lastLogin", "createdAt", "is_active")
+
+
+def user_row_to_csv(row: Any) -> tuple:
+    # csv.writer calls str() on every value; render enums/datetimes explicitly
+    user_id, user_name, email, role, last_login, created_at, is_active = row
+    return (
+        user_id,
+        user_name,
+        email,
+        role.value if role is not None else "",
+        last_login.isoformat() if last_login else "",
+        created_at.isoformat() if created_at else "",
+        is_active,
+    )
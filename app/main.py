@@ -1,17 +1,24 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings 
-import uvicorn
 from app.helpers.error_handler.validation_error_handler import validation_exception_handler
-from app.helpers.loggers.logging_config import setup_logging
-from app.middlewares.logging_middleware import RotationalLoggerMiddleware
-from app.middlewares.timeout_middleware import TimeoutMiddleware
-from app.middlewares.payload_limit_middleware import PayloadLimitMiddleware
+from app.helpers.loggers.logging_config import setup_logging, shutdown_logging
+from app.middlewares.rate_limit_middleware import RateLimitMiddleware
+from app.middlewares.request_pipeline_middleware import RequestPipelineMiddleware
 from app.helpers.utils.custom_openapi import custom_openapi
+from app.helpers.utils.encrypt import get_cipher
+from app.helpers.utils.json_response import FastJSONResponse
 from app.api.routers.health_route import router as health_router
+from app.api.routers.metrics_route import router as metrics_router
+from app.api.routers.jwks_route import router as jwks_router
 from fastapi.staticfiles import StaticFiles
-from app.connections.db_connector import init_db, shutdown_db
+from app.connections import db_connector
+from app.connections.db_connector import get_async_session_factory, init_db, shutdown_db
+from app.connections.revocation_sync import load_revocations, revocation_refresher
+from app.connections.write_behind import login_write_behind
+from app.helpers.utils.password_hash import shutdown_password_executor
 from app.api.routers.auth_route import auth_router
+from app.api.routers.export_route import export_router
 from fastapi.exceptions import RequestValidationError
 
 setup_logging()
@@ -21,15 +28,31 @@ app = FastAPI(
     title="Backend Automation System",
     description="Production-ready FastAPI backend for automation workflows with authentication, PostgreSQL, and AWS deployment.",
     version="1.0.0",
+    default_response_class=FastJSONResponse,
 )
 base_router = settings.API_PREFIX
 
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
-# rotational logger initialize using middleware
-app.add_middleware(RotationalLoggerMiddleware)
+# per client IP rate limits (inside the pipeline so 429s are logged and counted)
+app.add_middleware(
+    RateLimitMiddleware,
+    default=settings.RATE_LIMIT_DEFAULT,
+    route_limits=settings.RATE_LIMIT_ROUTES,
+)
+
+# body limit, timeout and access logging run as a single ASGI layer
+# (see RequestPipelineMiddleware; benchmarks/bench_middleware_stack.py compares it
+# with the separate middlewares)
+app.add_middleware(
+    RequestPipelineMiddleware,
+    timeout=settings.REQUEST_TIMEOUT_SECONDS,
+    route_timeouts=settings.REQUEST_TIMEOUT_OVERRIDES,
+    max_content_size=settings.MAX_REQUEST_BODY_BYTES,
+    route_limits=settings.REQUEST_BODY_LIMIT_OVERRIDES,
+)
 
-# Cors middleware
+# Cors middleware (outermost, so 408/413 responses carry CORS headers too)
 app.add_middleware(
     CORSMiddleware,
     allow_origins = ["*"], 
@@ -38,12 +61,6 @@ app.add_middleware(
     allow_credentials = True,
 )
 
-# timeout middleware initialize with 10s
-app.add_middleware(TimeoutMiddleware, timeout=10)
-
-# max payload size limit middleware with 10MB
-app.add_middleware(PayloadLimitMiddleware, max_content_size=10 * 1024 * 1024)
-
 # custom swagger / openapi
 app.openapi = lambda: custom_openapi(app=app)
 
@@ -54,18 +71,39 @@ async def startup_event():
     print(
         f"Base URL: {base_url}, Swagger Docs: {base_url}/docs, ReDoc Docs: {base_url}/redoc"
     )
+    # log shipping (no-op if already running)
+    setup_logging()
+    # a bad ENCRYPTION_KEY fails here rather than on the first login
+    get_cipher()
+    # a configured prebuilt schema must exist: fail here rather than on the first /docs
+    if settings.OPENAPI_SCHEMA_FILE:
+        app.openapi()
     # db initialize
     init_db()
+    if settings.LOGIN_WRITE_BEHIND_ENABLED:
+        login_write_behind.start(get_async_session_factory())
+    # revoked tokens into memory, then follow revocations made by other workers
+    load_revocations(db_connector.SessionLocal)
+    revocation_refresher.start(get_async_session_factory())
 
 @app.on_event("shutdown")
-def shutdown():
+async def shutdown():
     # graceful shutdown
-    shutdown_db()
+    await shutdown_db()
+    shutdown_password_executor()
+    # drain queued log records last so shutdown messages are written
+    shutdown_logging()
 
 # Health check router
 app.include_router(prefix=f"{base_router}", router=health_router)
+# Prometheus metrics (served at /metrics, the default scrape path)
+app.include_router(router=metrics_router)
+# JWKS for verifying tokens elsewhere (served at /.well-known/jwks.json)
+app.include_router(router=jwks_router)
 # Auth router
 app.include_router(prefix=f"{base_router}/auth", router=auth_router)
+# Admin export router (streamed)
+app.include_router(prefix=f"{base_router}/auth", router=export_router)
 
 # custom validation error
 @app.exception_handler(RequestValidationError)
@@ -76,7 +114,7 @@ async def custom_validation_exception_handler(request, exc):
 app.exception_handler(Exception)
 
 if __name__ == "__main__":
-    port = int(settings.PORT)
-    uvicorn.run("api.main:app", host = "0.0.0.0", port = port, reload=True)
-
+    # development server (single process, auto reload); production: python -m app.serve
+    import uvicorn
 
+    uvicorn.run("app.main:app", host="0.0.0.0", port=int(settings.PORT), reload=True)
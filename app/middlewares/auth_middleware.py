@@ -1,10 +1,16 @@
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import logging
+import math
 
-from app.connections.db_connector import get_db
+from app.connections.db_connector import get_async_db
+from app.core.config import settings
 from app.helpers.utils.jwt_util import verify_token
+from app.helpers.utils.principal_cache import Principal, cache_principal, get_cached_principal
+from app.helpers.utils.token_revocation import token_revocations
+from app.helpers.utils.user_serializer import PRINCIPAL_COLUMNS
 from app.models.user_model import UserModel
 
 logger = logging.getLogger(__name__)
@@ -14,7 +20,7 @@ security = HTTPBearer(auto_error=False)
 async def get_current_user(
     request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     if not credentials:
         raise HTTPException(
@@ -30,25 +36,53 @@ async def get_current_user(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid or expired token",
             )
-        
-        user_id = payload.get("sub")
-        if not user_id:
+
+        # fail closed: until the revocations have been loaded once, no token can be trusted
+        if not token_revocations.loaded:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Token revocations not loaded yet",
+                headers={"Retry-After": str(math.ceil(settings.TOKEN_REVOCATION_REFRESH_SECONDS))},
+            )
+
+        # in memory: tokens that were never revoked clear the Bloom filter without a DB hit
+        if token_revocations.is_revoked(payload):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
+                detail="Token has been revoked",
             )
 
-        user = db.query(UserModel).filter(UserModel.id == user_id).first()
-        if not user or not user.is_active:
+        user_id = payload.get("sub")
+        if not user_id or not str(user_id).isdigit():
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found or inactive",
+                detail="Invalid token payload",
             )
 
+        user_id = int(user_id)
+        issued_at = payload.get("iat")
+        principal = get_cached_principal(user_id, issued_at)
+        if principal is None:
+            # (id, role, is_active) only: the full row carries the password hash and last token
+            user = (
+                await db.execute(select(*PRINCIPAL_COLUMNS).where(UserModel.id == user_id))
+            ).first()
+            if not user or not user.is_active:
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="User not found or inactive",
+                )
+            principal = Principal.from_user(user)
+            cache_principal(principal, issued_at)
+
         # Attach user to request state
-        request.state.user = user
+        request.state.user = principal
+        request.state.token_payload = payload
+
+        return principal
 
-        return user
+    except HTTPException:
+        raise
 
     except ValueError as e:
         logger.warning(f"JWT verification failed: {e}")
@@ -65,7 +99,7 @@ async def get_current_user(
         )
 
 async def get_current_admin(
-    current_user: UserModel = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     if current_user.role.value != "ADMIN":
         raise HTTPException(
@@ -1,64 +1,92 @@
-import json
 import time
 import logging
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response
+from starlette.datastructures import URL, QueryParams
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
 
-class RotationalLoggerMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
-        # Use the same logger configured in logging_config
-        self.logger = logging.getLogger("rotational_logger")
 
-    async def dispatch(self, request, call_next):
-        start_time = time.time()
+def _decode(body: bytes) -> str:
+    # truncation can split a multi-byte character
+    return body.decode("utf-8", errors="replace")
 
-        body_bytes = await request.body()
-        try:
-            body_text = body_bytes.decode("utf-8")
-        except Exception:
-            body_text = str(body_bytes)
 
-        # Rebuild receive method so downstream code still sees the body
-        async def receive():
-            return {"type": "http.request", "body": body_bytes, "more_body": False}
-        request._receive = receive
+def access_log_entry(scope: Scope, status_code: int, started_at: float, sizes: dict,
+                     request_body: bytearray | None = None, response_body: bytearray | None = None,
+                     cap: int = 0) -> dict:
+    # bodies are only passed when capture is enabled
+    client = scope.get("client")
+    log_entry = {
+        "method": scope["method"],
+        "url": str(URL(scope=scope)),
+        "path": scope["path"],
+        "ip": client[0] if client else None,
+        "query_params": dict(QueryParams(scope.get("query_string", b""))),
+        "status_code": status_code,
+        "latency_seconds": round(time.perf_counter() - started_at, 3),
+        "request_bytes": sizes["request"],
+        "response_bytes": sizes["response"],
+    }
+    if request_body is not None:
+        log_entry["request_body"] = _decode(bytes(request_body))
+        log_entry["response_body"] = _decode(bytes(response_body))
+        log_entry["body_truncated"] = sizes["request"] > cap or sizes["response"] > cap
+    return log_entry
 
-        try:
-            response = await call_next(request)
-        except Exception as e:
-            self.logger.exception(f"Unhandled exception at {request.url}: {e}")
-            raise
 
-        resp_body = b""
-        async for chunk in response.body_iterator:
-            resp_body += chunk
+class RotationalLoggerMiddleware:
+    # Pure ASGI access logger: taps receive/send to record size, status and timing.
+    # Bodies are optionally captured up to max_body_bytes; nothing is re-buffered,
+    # so streaming responses pass straight through.
 
-        # Rebuild response to pass back to FastAPI
-        response = Response(
-            content=resp_body,
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            media_type=response.media_type,
-        )
+    def __init__(self, app: ASGIApp, capture_body: bool | None = None, max_body_bytes: int | None = None):
+        self.app = app
+        # Use the same logger configured in logging_config
+        self.logger = logging.getLogger("rotational_logger")
+        self.capture_body = settings.ACCESS_LOG_CAPTURE_BODY if capture_body is None else capture_body
+        self.max_body_bytes = settings.ACCESS_LOG_MAX_BODY_BYTES if max_body_bytes is None else max_body_bytes
 
-        try:
-            resp_text = resp_body.decode("utf-8")
-        except Exception:
-            resp_text = str(resp_body)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        capture = self.capture_body and self.max_body_bytes > 0
+        cap = self.max_body_bytes
+        request_body = bytearray()
+        response_body = bytearray()
+        sizes = {"request": 0, "response": 0}
+        status_code = 500
 
-        latency = round(time.time() - start_time, 3)
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                sizes["request"] += len(chunk)
+                if capture and len(request_body) < cap:
+                    request_body.extend(chunk[: cap - len(request_body)])
+            return message
 
-        log_entry = {
-            "method": request.method,
-            "url": str(request.url),
-            "ip": request.client.host if request.client else None,
-            "query_params": dict(request.query_params),
-            "request_body": body_text,
-            "response_body": resp_text,
-            "status_code": response.status_code,
-            "latency_seconds": latency,
-        }
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                sizes["response"] += len(chunk)
+                if capture and len(response_body) < cap:
+                    response_body.extend(chunk[: cap - len(response_body)])
+            await send(message)
 
-        self.logger.info(json.dumps(log_entry, ensure_ascii=False))
-        return response
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception as e:
+            self.logger.exception(f"Unhandled exception at {URL(scope=scope)}: {e}")
+            raise
+        finally:
+            if capture:
+                log_entry = access_log_entry(scope, status_code, start_time, sizes, request_body, response_body, cap)
+            else:
+                log_entry = access_log_entry(scope, status_code, start_time, sizes)
+            # serialized by JsonFormatter on the log listener thread
+            self.logger.info("access", extra={"log_entry": log_entry})
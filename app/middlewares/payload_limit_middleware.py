@@ -1,11 +1,52 @@
-from starlette.types import ASGIApp, Receive, Scope, Send
-from starlette.responses import JSONResponse
+from typing import Dict, Optional
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.helpers.utils.json_response import FastJSONResponse
+from app.helpers.utils.route_rules import PrefixRules
 from fastapi import status
 
+
+def _format_size(size: int) -> str:
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
+    return f"{size / 1024:.2f} KB"
+
+
+def payload_too_large_response(limit: int) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={
+            "error": True,
+            "data": {
+                "message": f"Payload too large. Max allowed size is {_format_size(limit)}."
+            },
+        },
+    )
+
+
+def invalid_content_length_response() -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"error": True, "data": {"message": "Invalid Content-Length header."}},
+    )
+
+
+def declared_content_length(scope: Scope) -> Optional[int]:
+    # raises ValueError for a malformed header
+    for name, value in scope.get("headers") or []:
+        if name == b"content-length":
+            return int(value.decode())
+    return None
+
+
 class PayloadLimitMiddleware:
-    def __init__(self, app: ASGIApp, max_content_size: int = 10 * 1024 * 1024):
+    # Enforces the body size limit while the body streams in, not just via Content-Length,
+    # so chunked uploads and clients that under-report their length are cut off as soon as
+    # they cross the limit. route_limits maps a path prefix to its own limit in bytes
+    # (longest prefix wins).
+
+    def __init__(self, app: ASGIApp, max_content_size: int = 10 * 1024 * 1024, route_limits: Optional[Dict[str, int]] = None):
         self.app = app
-        self.max_content_size = max_content_size
+        self.limits = PrefixRules(max_content_size, route_limits)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         # only check HTTP requests
@@ -13,32 +54,51 @@ class PayloadLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = dict(scope.get("headers") or [])
-        content_length = None
-        if b"content-length" in headers:
-            try:
-                content_length = int(headers[b"content-length"].decode())
-            except ValueError:
-                response = JSONResponse(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    content={"error": True, "data": {"message": "Invalid Content-Length header."}},
-                )
-                await response(scope, receive, send)
-                return
+        limit = self.limits.lookup(scope["path"])
+        try:
+            content_length = declared_content_length(scope)
+        except ValueError:
+            await invalid_content_length_response()(scope, receive, send)
+            return
 
-        if content_length and content_length > self.max_content_size:
-            response = JSONResponse(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                content={
-                    "error": True,
-                    "data": {
-                        "message": f"Payload too large. "
-                                   f"Max allowed size is {self.max_content_size / (1024 * 1024):.2f} MB."
-                    },
-                },
-            )
-            await response(scope, receive, send)
+        # honest clients are rejected before any of the body is read
+        if content_length and content_length > limit:
+            await payload_too_large_response(limit)(scope, receive, send)
             return
 
-        await self.app(scope, receive, send)
+        received = 0
+        rejected = False
+        response_started = False
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            # once the 413 is out, whatever the app answers to the disconnect is dropped
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        async def receive_wrapper() -> Message:
+            nonlocal received, rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    if not response_started:
+                        await payload_too_large_response(limit)(scope, receive, send)
+                    rejected = True
+                    # the app sees a client disconnect and stops reading; the rest of the
+                    # body is never buffered
+                    return {"type": "http.disconnect"}
+            return message
 
+        try:
+            await self.app(scope, receive_wrapper, send_wrapper)
+        except Exception:
+            # the app failing on the cut-off body is expected; the 413 has been sent
+            if not rejected:
+                raise
@@ -0,0 +1,87 @@
+import math
+from typing import Dict, Optional
+from fastapi import HTTPException, Request, status
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.config import settings
+from app.helpers.schema_validations.auth_schema import authLoginRequest
+from app.helpers.utils.json_response import FastJSONResponse
+from app.helpers.utils.rate_limiter import RateLimit, rate_limiter
+from app.helpers.utils.route_rules import PrefixRules
+
+
+def _retry_after_header(retry_after: float) -> Dict[str, str]:
+    return {"Retry-After": str(max(1, math.ceil(retry_after)))}
+
+
+def _client_ip(scope: Scope) -> str:
+    # run uvicorn with --proxy-headers behind a load balancer so this is the real client
+    client = scope.get("client")
+    return client[0] if client else "unknown"
+
+
+class RateLimitMiddleware:
+    # Per client IP token bucket for each route prefix (longest prefix wins; "" = unlimited).
+    # Rejected requests get a 429 with Retry-After without reaching routing or the handler.
+
+    def __init__(self, app: ASGIApp, default: str = "", route_limits: Optional[Dict[str, str]] = None):
+        self.app = app
+        # the matched prefix names the bucket, so every route under it shares one budget
+        self.limits = PrefixRules(
+            ("*", RateLimit.parse(default)),
+            {prefix: (prefix, RateLimit.parse(value)) for prefix, value in (route_limits or {}).items()},
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        name, limit = self.limits.lookup(scope["path"])
+        retry_after = await rate_limiter.hit(name, _client_ip(scope), limit)
+        if retry_after:
+            response = FastJSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"error": True, "data": {"message": "Too many requests. Please retry later."}},
+                headers=_retry_after_header(retry_after),
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
+
+
+def rate_limit(name: str, limit: str):
+    """
+    Route dependency applying a per client IP limit, e.g.
+    ``dependencies=[Depends(rate_limit("export", "5/minute"))]``.
+    """
+    parsed = RateLimit.parse(limit)
+
+    async def dependency(request: Request):
+        retry_after = await rate_limiter.hit(name, _client_ip(request.scope), parsed)
+        if retry_after:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please retry later.",
+                headers=_retry_after_header(retry_after),
+            )
+
+    return dependency
+
+
+_login_per_ip = RateLimit.parse(settings.LOGIN_RATE_LIMIT_PER_IP)
+_login_per_user = RateLimit.parse(settings.LOGIN_RATE_LIMIT_PER_USER)
+
+
+async def throttle_login(request: Request, payload: authLoginRequest):
+    # Runs as a route dependency, i.e. before login_user does the user lookup and the bcrypt
+    # verify, so throttled attempts cost neither. Shares the parsed body with the endpoint.
+    retry_after = await rate_limiter.hit("login:ip", _client_ip(request.scope), _login_per_ip)
+    if not retry_after:
+        retry_after = await rate_limiter.hit("login:user", payload.username.strip().lower(), _login_per_user)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please retry later.",
+            headers=_retry_after_header(retry_after),
+        )
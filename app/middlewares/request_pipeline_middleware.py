@@ -0,0 +1,167 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Optional
+from starlette.datastructures import URL
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
+from app.helpers.utils.metrics import http_request_duration_seconds, http_requests_total, registry
+from app.helpers.utils.route_rules import PrefixRules
+from app.middlewares.logging_middleware import access_log_entry
+from app.middlewares.payload_limit_middleware import (
+    declared_content_length, invalid_content_length_response, payload_too_large_response
+)
+from app.middlewares.timeout_middleware import route_label, timeout_response, timeout_stats
+
+logger = logging.getLogger(__name__)
+
+# scopes of requests currently being served; grouped by route only when /metrics is scraped,
+# by which time the router has resolved their route template
+_in_flight: Dict[int, Scope] = {}
+
+
+def _in_flight_samples():
+    counts: Dict[tuple, int] = {}
+    for scope in list(_in_flight.values()):
+        labels = (scope["method"], route_label(scope))
+        counts[labels] = counts.get(labels, 0) + 1
+    return sorted(counts.items())
+
+
+registry.gauge_callback(
+    "http_requests_in_progress", "HTTP requests currently being served.", ("method", "route"), _in_flight_samples
+)
+
+
+class RequestPipelineMiddleware:
+    # Body limit, request timeout and access logging in one ASGI layer.
+    # Same behavior as PayloadLimitMiddleware + TimeoutMiddleware + RotationalLoggerMiddleware,
+    # but a request goes through one receive/send wrapper pair and one extra frame instead of
+    # three. Responses produced here (400/408/413) are access-logged too.
+    # Also records the per-route request metrics (count, status, latency, in flight).
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        timeout: float = 10,
+        route_timeouts: Optional[Dict[str, float]] = None,
+        max_content_size: int = 10 * 1024 * 1024,
+        route_limits: Optional[Dict[str, int]] = None,
+        capture_body: bool | None = None,
+        max_body_bytes: int | None = None,
+    ):
+        self.app = app
+        self.timeouts = PrefixRules(timeout, route_timeouts)
+        self.limits = PrefixRules(max_content_size, route_limits)
+        # Use the same logger configured in logging_config
+        self.access_logger = logging.getLogger("rotational_logger")
+        self.capture_body = settings.ACCESS_LOG_CAPTURE_BODY if capture_body is None else capture_body
+        self.max_body_bytes = settings.ACCESS_LOG_MAX_BODY_BYTES if max_body_bytes is None else max_body_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        path = scope["path"]
+        limit = self.limits.lookup(path)
+        budget = 0 if path == "/favicon.ico" else self.timeouts.lookup(path)
+        capture = self.capture_body and self.max_body_bytes > 0
+        cap = self.max_body_bytes
+        request_body = bytearray()
+        response_body = bytearray()
+        sizes = {"request": 0, "response": 0}
+        status_code = 500
+        response_started = False
+        rejected = False
+        request_key = id(scope)
+        _in_flight[request_key] = scope
+        loop = asyncio.get_running_loop()
+        deadline = None
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code, response_started
+            # once the 413 is out, whatever the app answers to the disconnect is dropped
+            if rejected:
+                return
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                response_started = True
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                sizes["response"] += len(chunk)
+                if capture and len(response_body) < cap:
+                    response_body.extend(chunk[: cap - len(response_body)])
+            await send(message)
+            # after the response start the budget bounds each gap between chunks, not the whole body
+            if response_started and deadline is not None and not deadline.expired():
+                deadline.reschedule(loop.time() + budget)
+
+        async def receive_wrapper() -> Message:
+            nonlocal rejected
+            if rejected:
+                return {"type": "http.disconnect"}
+
+            message = await receive()
+            if message["type"] == "http.request":
+                chunk = message.get("body", b"")
+                sizes["request"] += len(chunk)
+                if capture and len(request_body) < cap:
+                    request_body.extend(chunk[: cap - len(request_body)])
+                if sizes["request"] > limit:
+                    if not response_started:
+                        await payload_too_large_response(limit)(scope, receive, send_wrapper)
+                    rejected = True
+                    return {"type": "http.disconnect"}
+            return message
+
+        try:
+            try:
+                content_length = declared_content_length(scope)
+            except ValueError:
+                await invalid_content_length_response()(scope, receive, send_wrapper)
+                return
+
+            # honest clients are rejected before any of the body is read
+            if content_length and content_length > limit:
+                await payload_too_large_response(limit)(scope, receive, send_wrapper)
+                return
+
+            if budget:
+                # cancels the request task on expiry without spawning a new one
+                async with asyncio.timeout(budget) as deadline:
+                    await self.app(scope, receive_wrapper, send_wrapper)
+            else:
+                await self.app(scope, receive_wrapper, send_wrapper)
+        except TimeoutError as e:
+            # a TimeoutError raised inside the app (DB driver, HTTP client) is an error, not a 408
+            if deadline is None or not deadline.expired():
+                self.access_logger.exception(f"Unhandled exception at {URL(scope=scope)}: {e!r}")
+                raise
+            route = route_label(scope)
+            timeout_stats.record(route, response_started)
+            if response_started:
+                # a 408 can no longer be sent: abort and let the server drop the connection
+                logger.warning(f"Request to {route} stalled for {budget:g}s while streaming the response")
+                raise
+            await timeout_response(budget)(scope, receive, send_wrapper)
+        except Exception as e:
+            # the app failing on the cut-off body is expected; the 413 has been sent
+            if rejected:
+                return
+            self.access_logger.exception(f"Unhandled exception at {URL(scope=scope)}: {e}")
+            raise
+        finally:
+            del _in_flight[request_key]
+            method = scope["method"]
+            route = route_label(scope)
+            http_requests_total.inc((method, route, str(status_code)))
+            http_request_duration_seconds.observe(time.perf_counter() - start_time, (method, route))
+
+            if capture:
+                log_entry = access_log_entry(scope, status_code, start_time, sizes, request_body, response_body, cap)
+            else:
+                log_entry = access_log_entry(scope, status_code, start_time, sizes)
+            # serialized by JsonFormatter on the log listener thread
+            self.access_logger.info("access", extra={"log_entry": log_entry})
@@ -1,28 +1,110 @@
 import asyncio
-from fastapi import Request, Response, status
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+import logging
+from typing import Dict, Optional
+from fastapi import status
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.helpers.utils.json_response import FastJSONResponse
+from app.helpers.utils.route_rules import PrefixRules
 
-class TimeoutMiddleware(BaseHTTPMiddleware):
-    # by default 10s timeout
-    def __init__(self, app, timeout: int = 10):
-        super().__init__(app)
-        self.timeout = timeout
+logger = logging.getLogger(__name__)
+
+
+class TimeoutStats:
+    # Timed-out request counters per route (single event loop, no locking needed).
+
+    def __init__(self):
+        self.before_response: Dict[str, int] = {}
+        self.after_response_start: Dict[str, int] = {}
+
+    def record(self, route: str, response_started: bool):
+        counters = self.after_response_start if response_started else self.before_response
+        counters[route] = counters.get(route, 0) + 1
+
+    def snapshot(self) -> dict:
+        return {
+            "before_response": dict(self.before_response),
+            "after_response_start": dict(self.after_response_start),
+        }
+
+
+timeout_stats = TimeoutStats()
+
+
+def route_template(scope: Scope) -> Optional[str]:
+    # the router stores the matched route in the shared scope; routes of an included router
+    # keep their template relative to its prefix, so a parameterless template is completed
+    # from the request path (still one label per route)
+    template = getattr(scope.get("route"), "path", None)
+    if template and "{" not in template and scope["path"].endswith(template):
+        return scope["path"]
+    return template
+
+
+def route_label(scope: Scope) -> str:
+    # route template only; raw paths of unmatched requests (404 scans, ids) would be unbounded keys
+    return route_template(scope) or "unmatched"
+
+
+def timeout_response(budget: float) -> FastJSONResponse:
+    return FastJSONResponse(
+        content={
+            "error": True,
+            "data": {
+                "message": f"Request timed out after {budget:g} seconds"
+                }
+            },
+        status_code = status.HTTP_408_REQUEST_TIMEOUT
+    )
+
+
+class TimeoutMiddleware:
+    # Pure ASGI request timeout. The downstream app runs inside asyncio.timeout, so on
+    # expiry the request task is cancelled (DB awaits, hashing waits, ...) rather than left running.
+    # route_timeouts maps a path prefix to its own budget (longest prefix wins; 0 = no limit).
+    # The budget bounds the time to the response start, then each gap between body chunks:
+    # a streamed response that keeps sending (e.g. /exportUsers) is never cut off, a stalled one is.
+
+    def __init__(self, app: ASGIApp, timeout: float = 10, route_timeouts: Optional[Dict[str, float]] = None):
+        self.app = app
+        self.timeouts = PrefixRules(timeout, route_timeouts)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["path"] == "/favicon.ico":
+            await self.app(scope, receive, send)
+            return
+
+        budget = self.timeouts.lookup(scope["path"])
+        if not budget:
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+        loop = asyncio.get_running_loop()
+        deadline = None
+
+        async def send_wrapper(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+            if response_started and not deadline.expired():
+                deadline.reschedule(loop.time() + budget)
 
-    async def dispatch(self, request: Request, call_next):
         try:
-            if request.url.path == "/favicon.ico":
-                return await call_next(request)
-            
-            return await asyncio.wait_for(call_next(request), timeout=self.timeout)
-        except asyncio.TimeoutError:
-            return JSONResponse(
-            content={
-                "error": True, 
-                "data": {
-                    "message": "Request timed out after 10 seconds"
-                    }
-                },
-            status_code = status.HTTP_408_REQUEST_TIMEOUT
-            )
-        
+            # cancels the current task on expiry; unlike wait_for it does not spawn one
+            async with asyncio.timeout(budget) as deadline:
+                await self.app(scope, receive, send_wrapper)
+        except TimeoutError:
+            # a TimeoutError raised inside the app (DB driver, HTTP client) is an error, not a 408
+            if not deadline.expired():
+                raise
+            route = route_label(scope)
+            timeout_stats.record(route, response_started)
+
+            if response_started:
+                # headers (and maybe part of the body) are already out: a 408 can no longer be
+                # sent, so abort and let the server drop the connection
+                logger.warning(f"Request to {route} stalled for {budget:g}s while streaming the response")
+                raise
+
+            await timeout_response(budget)(scope, receive, send)
@@ -1,3 +1,4 @@
 from .user_model import UserModel
+from .token_revocation_model import RevokedTokenModel, UserTokenRevocationModel
 
-__all__ = ["UserModel"]
\ No newline at end of file
+__all__ = ["UserModel", "RevokedTokenModel", "UserTokenRevocationModel"]
@@ -0,0 +1,26 @@
+from datetime import datetime, timezone
+from sqlalchemy import Column, DateTime, Integer, String
+from app.connections.db_connector import Base
+
+
+def _utcnow():
+    return datetime.now(timezone.utc)
+
+
+class RevokedTokenModel(Base):
+    # One row per revoked access token (logout); deleted once the token has expired.
+    __tablename__ = "revoked_tokens"
+
+    jti = Column(String(64), primary_key=True)
+    user_id = Column(Integer, nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    # workers pick up new rows by revoked_at (see app/connections/revocation_sync.py)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, index=True)
+
+
+class UserTokenRevocationModel(Base):
+    # "Revoke all": every token of the user issued at or before revoked_at is rejected.
+    __tablename__ = "user_token_revocations"
+
+    user_id = Column(Integer, primary_key=True)
+    revoked_at = Column(DateTime(timezone=True), nullable=False, default=_utcnow, index=True)
@@ -1,4 +1,5 @@
-from sqlalchemy import Boolean, Column, Enum, Integer, String, DateTime, func
+from datetime import datetime, timezone
+from sqlalchemy import Boolean, Column, Enum, Index, Integer, String, DateTime, func
 from app.connections.db_connector import Base
 from app.helpers.enums.enum_config import userRoles
 
@@ -13,5 +14,13 @@ class UserModel(Base):
     is_active = Column(Boolean, nullable=False, default=True)
     last_login = Column(DateTime(timezone=True), nullable=True, default=None)
     access_token = Column(String, nullable=True, default=None)
-    created_at = Column(DateTime(timezone=True), default=func.now())  
+    # set in Python so SQLite stores the same format keyset cursors bind against
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
     updated_at = Column(DateTime(timezone=True), default=func.now(), onupdate=func.now())
+
+    # New indexes also need a migration in app/connections/migrations.py
+    __table_args__ = (
+        # keyset pagination on /getUsers (ORDER BY created_at DESC, id DESC)
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # login/registration lookups filter on email and use its unique index
+    )
@@ -0,0 +1,239 @@
+"""
+Production launcher: loads the app once, then forks worker processes that
+serve it on one shared listening socket.
+
+* the app, its routes and the lazily built pieces (JWT key ring, CryptContext,
+  OpenAPI schema) are built before fork and shared copy-on-write;
+* pending migrations run once, in the parent, so workers never race on DDL;
+* each worker opens its own database engine in the startup event, after fork
+  (``init_db``), so no pooled connection is shared between processes;
+* SIGTERM / SIGINT are forwarded to the workers, which stop accepting, let
+  in-flight requests finish (up to ``--graceful-timeout``) and run the shutdown
+  event (``shutdown_db`` disposes the pools); stragglers are killed after that;
+* a worker that dies is replaced, unless it failed during startup;
+* rate limits are enforced per worker (each keeps its own in-memory buckets),
+  so a client spread over N workers may get up to N times a configured limit;
+* every worker writes its own access log (``logs/app.worker-<n>.log`` for the
+  default ``LOG_FILE_PATH``), rotated by that worker alone; a replacement
+  worker appends to the file of the one it replaces.
+
+Usage:
+    python -m app.serve [--workers N] [--host 0.0.0.0] [--port 5000] [--graceful-timeout 30]
+"""
+import argparse
+import gc
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, List
+
+import uvicorn
+
+from app.core.config import settings
+
+# worker exit code for "could not start" (bad config, database unreachable): not restarted
+WORKER_BOOT_ERROR = 3
+# time the shutdown event gets on top of the graceful timeout before workers are killed
+SHUTDOWN_MARGIN_SECONDS = 10
+
+_STOP_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+
+
+def bind_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+def migrate():
+    # Apply pending migrations before fork; workers starting together would race on DDL.
+    from sqlalchemy import create_engine
+
+    from app.connections.migrations import run_migrations
+
+    engine = create_engine(settings.DATABASE_URL)
+    try:
+        applied = run_migrations(engine)
+    finally:
+        engine.dispose()
+    if applied:
+        print(f"Applied migrations {applied}")
+
+
+def preload():
+    # Import and warm up everything that is read-only afterwards, in the parent.
+    from app.helpers.loggers.logging_config import shutdown_logging
+    from app.helpers.utils.encrypt import get_cipher
+    from app.helpers.utils.jwt_keys import get_keyring
+    from app.helpers.utils.password_hash import get_pwd_context
+    from app.main import app
+
+    get_keyring()  # also fails fast on a bad key configuration
+    get_cipher()  # likewise for ENCRYPTION_KEY
+    get_pwd_context()
+    app.openapi()
+    # the log listener thread does not survive fork; every worker starts its own at startup
+    shutdown_logging()
+    return app
+
+
+_stop_requested = False
+
+
+def worker_log_path(path: str, worker: int) -> str:
+    # logs/app.log -> logs/app.worker-1.log; processes rotating one shared file would clobber each other
+    root, ext = os.path.splitext(path)
+    return f"{root}.worker-{worker}{ext}"
+
+
+def _exit_on_signal(signum, frame):
+    global _stop_requested
+    _stop_requested = True
+    raise SystemExit(0)
+
+
+def run_worker(app, sock: socket.socket, graceful_timeout: float, worker: int):
+    # Runs in the forked child; never returns. `worker` is the slot number (1..N), stable across restarts.
+    code = 0
+    server = None
+    try:
+        signal.signal(signal.SIGTERM, _exit_on_signal)
+        signal.signal(signal.SIGINT, _exit_on_signal)
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+        # picked up by setup_logging() in the startup event
+        settings.LOG_FILE_PATH = worker_log_path(settings.LOG_FILE_PATH, worker)
+        config = uvicorn.Config(
+            app,
+            lifespan="on",
+            timeout_graceful_shutdown=graceful_timeout,
+            access_log=False,  # requests are access-logged by RequestPipelineMiddleware
+            proxy_headers=True,
+        )
+        server = uvicorn.Server(config)
+        server.run(sockets=[sock])
+    except SystemExit:
+        pass  # uvicorn exits this way when the startup event fails
+    except BaseException as e:
+        print(f"Error in worker {os.getpid()} :: {str(e)}")
+        code = 1
+    finally:
+        if code == 0 and not _stop_requested and not (server and server.started):
+            code = WORKER_BOOT_ERROR
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(code)
+
+
+class Supervisor:
+    # Forks the workers, replaces the ones that die and coordinates shutdown.
+
+    def __init__(self, app, sock: socket.socket, workers: int, graceful_timeout: float):
+        self.app = app
+        self.sock = sock
+        self.workers = workers
+        self.graceful_timeout = graceful_timeout
+        # pid -> worker slot
+        self.children: Dict[int, int] = {}
+        self.stopping = False
+        self.deadline = 0.0
+        self.exit_code = 0
+
+    def spawn(self, worker: int):
+        # signals stay blocked across fork so the child never runs the supervisor's handler
+        signal.pthread_sigmask(signal.SIG_BLOCK, _STOP_SIGNALS)
+        try:
+            pid = os.fork()
+            if pid == 0:
+                run_worker(self.app, self.sock, self.graceful_timeout, worker)
+        finally:
+            signal.pthread_sigmask(signal.SIG_UNBLOCK, _STOP_SIGNALS)
+        self.children[pid] = worker
+
+    def stop(self, sig: int = signal.SIGTERM):
+        if not self.stopping:
+            self.stopping = True
+            self.deadline = time.monotonic() + self.graceful_timeout + SHUTDOWN_MARGIN_SECONDS
+            print(f"Stopping {len(self.children)} workers (graceful timeout {self.graceful_timeout:g}s)")
+        # a second SIGINT makes uvicorn skip the drain
+        self.signal_children(sig)
+
+    def signal_children(self, sig: int):
+        for pid in list(self.children):
+            try:
+                os.kill(pid, sig)
+            except ProcessLookupError:
+                pass
+
+    def _handle_signal(self, signum, frame):
+        self.stop(signum)
+
+    def reap(self):
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                self.children.clear()
+                return
+            if pid == 0:
+                return
+            worker = self.children.pop(pid, None)
+            if worker is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            if self.stopping:
+                continue
+            if code == WORKER_BOOT_ERROR:
+                print(f"Worker {pid} failed to start, shutting down")
+                self.exit_code = 1
+                self.stop()
+                continue
+            print(f"Worker {pid} exited with code {code}, starting a new one")
+            self.spawn(worker)
+
+    def run(self) -> int:
+        signal.signal(signal.SIGTERM, self._handle_signal)
+        signal.signal(signal.SIGINT, self._handle_signal)
+        # objects created so far are never collected: GC passes would otherwise write to
+        # (and un-share) their pages in every worker
+        gc.freeze()
+        for worker in range(1, self.workers + 1):
+            self.spawn(worker)
+        print(f"Serving on {self.sock.getsockname()} with {self.workers} workers: {sorted(self.children)}")
+
+        while self.children:
+            self.reap()
+            if self.stopping and self.children and time.monotonic() > self.deadline:
+                print(f"Killing {len(self.children)} workers still running after the graceful timeout")
+                self.signal_children(signal.SIGKILL)
+                self.deadline = float("inf")
+            time.sleep(0.1)
+        self.sock.close()
+        return self.exit_code
+
+
+def serve(app, host: str, port: int, workers: int, graceful_timeout: float) -> int:
+    sock = bind_socket(host, port)
+    return Supervisor(app, sock, workers, graceful_timeout).run()
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.serve", description="Run the API with N worker processes.")
+    parser.add_argument("--workers", type=int, default=settings.SERVER_WORKERS or os.cpu_count() or 1)
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=int(settings.PORT))
+    parser.add_argument("--graceful-timeout", type=float, default=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS)
+    args = parser.parse_args(argv)
+
+    app = preload()
+    if settings.DB_AUTO_MIGRATE:
+        migrate()
+    return serve(app, args.host, args.port, args.workers, args.graceful_timeout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,16 +1,24 @@
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.main import app
-from app.connections.db_connector import Base, get_db
+from app.connections.db_connector import Base, get_db, get_async_db, get_async_session_factory
 from app.models.user_model import UserModel
 from app.helpers.utils.password_hash import pwd_context
 from app.helpers.enums.enum_config import userRoles
+from app.api.services.count_service import count_cache
+from app.helpers.utils.jwt_util import verified_token_cache
+from app.helpers.utils.principal_cache import principal_cache
+from app.helpers.utils.rate_limiter import rate_limiter
+from app.helpers.utils.token_revocation import token_revocations
 
 
 # Test database (SQLite)
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+ASYNC_SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
@@ -20,6 +28,13 @@ TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
 
+# NullPool: every TestClient runs its own event loop, so connections must not be pooled across tests
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
+TestingAsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 
 # Database fixture
 @pytest.fixture(scope="function")
@@ -42,12 +57,25 @@ def client(db):
         finally:
             pass
 
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_session_factory] = lambda: TestingAsyncSessionLocal
 
     with TestClient(app) as c:
         yield c
 
     app.dependency_overrides.clear()
+    # user ids are reused once the test tables are dropped
+    principal_cache.clear()
+    verified_token_cache.clear()
+    count_cache.clear()
+    # every test client calls from the same address
+    rate_limiter.backend.clear()
+    token_revocations.clear()
 
 #Admin User
 @pytest.fixture
@@ -45,6 +45,23 @@ def test_login_missing_fields(client):
     assert response.json()["error"] is True
 
 
+def test_login_throttled_before_password_verify(client, test_user):
+    from app.helpers.utils.password_hash import hashing_stats
+
+    payload = {"username": "user1", "email": test_user.email, "password": "wrongpass"}
+    # LOGIN_RATE_LIMIT_PER_USER defaults to 5/minute
+    for _ in range(5):
+        assert client.post(AUTH_LOGIN_URL, json=payload).status_code == 401
+
+    verified = hashing_stats.completed
+    response = client.post(AUTH_LOGIN_URL, json={**payload, "username": " USER1 "})
+
+    assert response.status_code == 429
+    assert int(response.headers["retry-after"]) >= 1
+    # rejected without a bcrypt verify
+    assert hashing_stats.completed == verified
+
+
 def admin_token(client, db):
     admin = UserModel(
         user_name="admin",
@@ -96,6 +113,47 @@ def test_get_users_success(client, db):
     assert body["data"]["message"] == "Users fetched successfully."
 
 
+def test_login_and_get_users_on_sync_sessions(client, db, admin_user, monkeypatch):
+    # DB_ASYNC_ENABLED=false: the services run on a sync Session behind SyncSessionAdapter
+    from app.connections import db_connector
+    from app.connections.db_connector import get_async_db, get_async_session_factory
+    from app.core.config import settings
+    from app.main import app
+    from app.test.conftest import TestingSessionLocal
+
+    monkeypatch.setattr(settings, "DB_ASYNC_ENABLED", False)
+    monkeypatch.setattr(db_connector, "SessionLocal", TestingSessionLocal)
+    opened = []
+
+    class CountingAdapter(db_connector.SyncSessionAdapter):
+        def __init__(self, session):
+            opened.append(session)
+            super().__init__(session)
+
+    monkeypatch.setattr(db_connector, "SyncSessionAdapter", CountingAdapter)
+    # the real dependencies, not the async test sessions
+    app.dependency_overrides.pop(get_async_db)
+    app.dependency_overrides.pop(get_async_session_factory)
+
+    response = client.post(
+        AUTH_LOGIN_URL, json={"username": "admin", "email": admin_user.email, "password": "admin123"}
+    )
+    assert response.status_code == 200
+    headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+    response = client.get(AUTH_GET_USERS_URL, headers=headers)
+    assert response.status_code == 200
+    assert [user["email"] for user in response.json()["data"]["users"]] == [admin_user.email]
+
+    response = client.get(f"{API_PREFIX}/auth/exportUsers", headers=headers)
+    assert response.status_code == 200
+    assert admin_user.email in response.text
+
+    db.expire_all()
+    assert db.get(UserModel, admin_user.id).last_login is not None
+    assert len(opened) >= 3
+
+
 def test_get_users_unauthorized(client):
     response = client.get(AUTH_GET_USERS_URL)
 
@@ -189,3 +247,290 @@ def test_get_users_pagination_page_out_of_range(client, db):
 
     assert body["error"] is True
     assert body["data"]["message"] == "No users found."
+
+
+def test_current_user_served_from_principal_cache(client, db, test_user):
+    from app.helpers.utils.principal_cache import principal_cache
+
+    response = client.post(
+        AUTH_LOGIN_URL,
+        json={"username": "user1", "email": test_user.email, "password": "correctpass"},
+    )
+    headers = {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 200
+    hits = principal_cache.stats()["hits"]
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 200
+    assert principal_cache.stats()["hits"] == hits + 1
+
+    # deactivation through the ORM drops the cached principal
+    test_user.is_active = False
+    db.commit()
+
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 401
+
+
+def test_get_users_cursor_pagination(client, db):
+    users = [
+        UserModel(
+            user_name=f"user{i}",
+            email=f"user{i}@test.com",
+            password="hashed",
+            role=userRoles.USER,
+        )
+        for i in range(7)
+    ]
+    db.add_all(users)
+    db.commit()
+
+    token = admin_token(client, db)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    seen = []
+    response = client.get(f"{AUTH_GET_USERS_URL}?items_per_page=3", headers=headers)
+    while True:
+        assert response.status_code == 200
+        data = response.json()["data"]
+        seen.extend(user["id"] for user in data["users"])
+        next_cursor = data["pagination"]["next_cursor"]
+        if not next_cursor:
+            break
+        response = client.get(
+            AUTH_GET_USERS_URL,
+            params={"items_per_page": 3, "cursor": next_cursor},
+            headers=headers,
+        )
+        assert response.json()["data"]["pagination"]["total"] is None
+
+    # 7 users + 1 admin, newest first, no duplicates across pages
+    assert len(seen) == 8
+    assert len(set(seen)) == 8
+
+
+def test_get_users_invalid_cursor(client, db):
+    token = admin_token(client, db)
+
+    response = client.get(
+        f"{AUTH_GET_USERS_URL}?cursor=not-a-cursor",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_users_count_modes(client, db):
+    token = admin_token(client, db)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # SQLite has no planner estimate: falls back to an exact count
+    response = client.get(f"{AUTH_GET_USERS_URL}?count_mode=estimated", headers=headers)
+    pagination = response.json()["data"]["pagination"]
+    assert pagination["total"] == 1
+    assert pagination["is_estimate"] is False
+
+    # second cached call is served from the count cache and flagged as such
+    client.get(f"{AUTH_GET_USERS_URL}?count_mode=cached", headers=headers)
+    response = client.get(f"{AUTH_GET_USERS_URL}?count_mode=cached", headers=headers)
+    pagination = response.json()["data"]["pagination"]
+    assert pagination["total"] == 1
+    assert pagination["is_estimate"] is True
+
+
+def _login_headers(client, user, password):
+    response = client.post(
+        AUTH_LOGIN_URL,
+        json={"username": user.user_name, "email": user.email, "password": password},
+    )
+    return {"Authorization": f"Bearer {response.json()['data']['access_token']}"}
+
+
+def test_logout_revokes_only_that_token(client, test_user):
+    from app.helpers.utils.token_revocation import token_revocations
+
+    headers = _login_headers(client, test_user, "correctpass")
+    other_headers = _login_headers(client, test_user, "correctpass")
+
+    # never revoked: settled by the Bloom filter alone
+    negatives = token_revocations.stats()["filter_negatives"]
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 200
+    assert token_revocations.stats()["filter_negatives"] == negatives + 1
+
+    assert client.post(f"{API_PREFIX}/auth/logout", headers=headers).status_code == 200
+
+    response = client.get(f"{API_PREFIX}/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+    assert client.get(f"{API_PREFIX}/auth/me", headers=other_headers).status_code == 200
+
+
+def test_concurrent_logout_of_the_same_token_succeeds(client, test_user):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+
+    from app.api.services.revocation_service import logout_user
+    from app.helpers.utils.token_revocation import token_revocations
+    from app.models.token_revocation_model import RevokedTokenModel
+    from app.test.conftest import TestingAsyncSessionLocal
+
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=5)
+    payload = {"sub": str(test_user.id), "jti": "raced", "exp": expires_at.timestamp()}
+
+    async def scenario():
+        async with TestingAsyncSessionLocal() as other, TestingAsyncSessionLocal() as db:
+            assert await db.get(RevokedTokenModel, "raced") is None
+            # the other request inserts the row between this one's lookup and its commit
+            other.add(RevokedTokenModel(jti="raced", user_id=test_user.id, expires_at=expires_at))
+            await other.commit()
+
+            async def not_found_yet(*args, **kwargs):
+                return None
+
+            db.get = not_found_yet
+            return await logout_user(payload=payload, db=db)
+
+    assert asyncio.run(scenario())["status_code"] == 200
+    assert token_revocations.is_revoked({"sub": str(test_user.id), "jti": "raced"})
+
+
+def test_revoke_all_user_tokens(client, admin_user, test_user):
+    headers = _login_headers(client, test_user, "correctpass")
+    admin_headers = _login_headers(client, admin_user, "admin123")
+
+    # users can only revoke their own tokens
+    response = client.post(f"{API_PREFIX}/auth/revokeUserTokens/{admin_user.id}", headers=headers)
+    assert response.status_code == 403
+
+    response = client.post(f"{API_PREFIX}/auth/revokeUserTokens/{test_user.id}", headers=admin_headers)
+    assert response.status_code == 200
+
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 401
+    assert client.get(f"{API_PREFIX}/auth/me", headers=admin_headers).status_code == 200
+    # tokens issued after the cutoff are accepted
+    new_headers = _login_headers(client, test_user, "correctpass")
+    assert client.get(f"{API_PREFIX}/auth/me", headers=new_headers).status_code == 200
+
+
+def test_refresher_does_a_full_load_when_startup_load_failed(client, test_user):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+
+    from app.connections.revocation_sync import RevocationRefresher
+    from app.helpers.utils.token_revocation import token_revocations
+    from app.models.token_revocation_model import RevokedTokenModel, UserTokenRevocationModel
+    from app.test.conftest import TestingAsyncSessionLocal
+
+    # revoked an hour before this worker booted, well before any overlap window
+    now = datetime.now(timezone.utc)
+    an_hour_ago = now - timedelta(hours=1)
+    half_an_hour_ago = now - timedelta(minutes=30)
+
+    async def seed():
+        async with TestingAsyncSessionLocal() as session:
+            session.add_all([
+                RevokedTokenModel(jti="logged-out", user_id=test_user.id, expires_at=now + timedelta(hours=1), revoked_at=an_hour_ago),
+                RevokedTokenModel(jti="expired", user_id=test_user.id, expires_at=now - timedelta(minutes=1), revoked_at=an_hour_ago),
+                UserTokenRevocationModel(user_id=test_user.id, revoked_at=half_an_hour_ago),
+            ])
+            await session.commit()
+
+    asyncio.run(seed())
+    token_revocations.clear()  # as if load_revocations had failed at startup
+
+    refresher = RevocationRefresher(interval=60)
+    refresher._session_factory = TestingAsyncSessionLocal
+    assert refresher.watermark is None
+    asyncio.run(refresher.refresh())
+
+    sub = str(test_user.id)
+    assert token_revocations.is_revoked({"sub": sub, "jti": "logged-out", "iat": now.timestamp()})
+    assert token_revocations.is_revoked({"sub": sub, "jti": "other", "iat": half_an_hour_ago.timestamp() - 60})
+    assert not token_revocations.is_revoked({"sub": sub, "jti": "expired", "iat": now.timestamp()})
+    assert refresher.watermark is not None
+    assert token_revocations.loaded
+
+
+def test_refresher_prunes_cutoffs_older_than_a_token_lifetime(client, admin_user, test_user):
+    import asyncio
+    from datetime import datetime, timedelta, timezone
+
+    from sqlalchemy import select
+
+    from app.connections.revocation_sync import RevocationRefresher
+    from app.core.config import settings
+    from app.helpers.utils.token_revocation import token_revocations
+    from app.models.token_revocation_model import UserTokenRevocationModel
+    from app.test.conftest import TestingAsyncSessionLocal
+
+    now = datetime.now(timezone.utc)
+    lifetime = timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    async def seed():
+        async with TestingAsyncSessionLocal() as session:
+            session.add_all([
+                # every token this cutoff covers has expired by now
+                UserTokenRevocationModel(user_id=test_user.id, revoked_at=now - lifetime - timedelta(minutes=1)),
+                UserTokenRevocationModel(user_id=admin_user.id, revoked_at=now - timedelta(minutes=1)),
+            ])
+            await session.commit()
+
+    async def remaining():
+        async with TestingAsyncSessionLocal() as session:
+            return set((await session.execute(select(UserTokenRevocationModel.user_id))).scalars())
+
+    asyncio.run(seed())
+    token_revocations.clear()
+    refresher = RevocationRefresher(interval=60)
+    refresher._session_factory = TestingAsyncSessionLocal
+    asyncio.run(refresher.refresh())
+
+    assert token_revocations.stats()["users_revoked"] == 1
+    assert asyncio.run(remaining()) == {admin_user.id}
+
+
+def test_authentication_refused_until_revocations_are_loaded(client, test_user, monkeypatch):
+    import asyncio
+
+    from app.connections.revocation_sync import load_revocations, revocation_refresher
+    from app.helpers.utils.token_revocation import token_revocations
+    from app.test.conftest import TestingAsyncSessionLocal
+
+    headers = _login_headers(client, test_user, "correctpass")
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 200  # principal now cached
+
+    def broken_session():
+        raise ConnectionError("database unavailable")
+
+    # the startup load fails: nothing is known about revoked tokens
+    token_revocations.clear()
+    monkeypatch.setattr(revocation_refresher, "watermark", None)
+    load_revocations(broken_session)
+
+    response = client.get(f"{API_PREFIX}/auth/me", headers=headers)
+    assert response.status_code == 503
+    assert int(response.headers["retry-after"]) >= 1
+
+    # the refresher's first (full) pass lets authentication through again
+    monkeypatch.setattr(revocation_refresher, "_session_factory", TestingAsyncSessionLocal)
+    asyncio.run(revocation_refresher.refresh())
+    assert client.get(f"{API_PREFIX}/auth/me", headers=headers).status_code == 200
+
+
+def test_refresher_runs_first_pass_immediately_without_a_load():
+    import asyncio
+
+    from app.connections.revocation_sync import RevocationRefresher
+
+    async def scenario():
+        refresher = RevocationRefresher(interval=60)
+        calls = []
+
+        async def refresh():
+            calls.append(True)
+
+        refresher.refresh = refresh
+        refresher.start(session_factory=None)
+        await asyncio.sleep(0.05)
+        await refresher.stop()
+        return calls
+
+    assert asyncio.run(scenario()) == [True]
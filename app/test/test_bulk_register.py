@@ -0,0 +1,57 @@
+from app.helpers.enums.enum_config import userRegisterToken
+from app.models.user_model import UserModel
+
+API_PREFIX = "/api/v1"
+BULK_REGISTER_URL = f"{API_PREFIX}/auth/registerUsers/bulk"
+TOKEN = userRegisterToken.REGISTRATION_TOKEN.value
+
+
+def _user(i, **overrides):
+    user = {
+        "user_name": f"bulk{i}",
+        "email": f"bulk{i}@test.com",
+        "password": "secret",
+        "registration_token": TOKEN,
+        "role": "USER",
+    }
+    user.update(overrides)
+    return user
+
+
+def test_bulk_register_json_array(client, db, test_user):
+    payload = [
+        _user(0),
+        _user(1),
+        _user(2, email=test_user.email),  # already stored
+        _user(3, email="bulk0@test.com"),  # repeated in the payload
+        {"user_name": "broken"},
+    ]
+
+    response = client.post(BULK_REGISTER_URL, json=payload)
+
+    assert response.status_code == 200
+    data = response.json()["data"]
+    assert [row["status"] for row in data["results"]] == [
+        "created", "created", "duplicate", "duplicate", "invalid"
+    ]
+    assert data["summary"]["created"] == 2
+    assert db.query(UserModel).filter(UserModel.email.like("bulk%")).count() == 2
+
+
+def test_bulk_register_ndjson(client, db):
+    import json
+
+    body = "\n".join(json.dumps(_user(i)) for i in range(3))
+
+    response = client.post(
+        BULK_REGISTER_URL, content=body, headers={"Content-Type": "application/x-ndjson"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["data"]["summary"]["created"] == 3
+
+
+def test_bulk_register_rejects_non_array(client):
+    response = client.post(BULK_REGISTER_URL, json={"user_name": "x"})
+
+    assert response.status_code == 400
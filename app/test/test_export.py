@@ -0,0 +1,58 @@
+import csv
+import io
+import json
+
+from app.models.user_model import UserModel
+from app.helpers.enums.enum_config import userRoles
+from app.test.test_auth import admin_token
+
+API_PREFIX = "/api/v1"
+EXPORT_URL = f"{API_PREFIX}/auth/exportUsers"
+
+
+def _seed(db, count):
+    db.add_all(
+        UserModel(user_name=f"user{i}", email=f"user{i}@test.com", password="hashed", role=userRoles.USER)
+        for i in range(count)
+    )
+    db.commit()
+
+
+def test_export_users_ndjson(client, db, monkeypatch):
+    from app.core.config import settings
+
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 4)  # several partitions
+    _seed(db, 10)
+    token = admin_token(client, db)
+
+    response = client.get(EXPORT_URL, headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert len(rows) == 11  # 10 users + admin
+    assert rows[0]["role"] in ("ADMIN", "USER")
+
+
+def test_export_users_csv(client, db):
+    _seed(db, 3)
+    token = admin_token(client, db)
+
+    response = client.get(f"{EXPORT_URL}?format=csv", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(rows) == 4
+    assert {row["role"] for row in rows} == {"ADMIN", "USER"}
+
+
+def test_export_users_requires_admin(client, test_user):
+    response = client.post(
+        f"{API_PREFIX}/auth/login",
+        json={"username": "user1", "email": test_user.email, "password": "correctpass"},
+    )
+    token = response.json()["data"]["access_token"]
+
+    response = client.get(EXPORT_URL, headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 403
@@ -0,0 +1,211 @@
+API_PREFIX = "/api/v1"
+HEALTH_URL = f"{API_PREFIX}/health"
+POOL_STATS_URL = f"{API_PREFIX}/health/pool"
+
+
+def test_health_check(client):
+    response = client.get(HEALTH_URL)
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "ok"
+
+
+def test_pool_stats(client):
+    response = client.get(POOL_STATS_URL)
+
+    assert response.status_code == 200
+    pools = response.json()["pools"]
+
+    # startup connectivity check goes through the sync pool
+    assert pools["sync"]["checkouts"] >= 1
+    for key in ("checked_out", "overflow", "checkout_wait_seconds_max", "timeouts"):
+        assert key in pools["sync"]
+
+
+def test_hashing_stats(client, test_user):
+    client.post(
+        f"{API_PREFIX}/auth/login",
+        json={"username": "user1", "email": test_user.email, "password": "correctpass"},
+    )
+
+    response = client.get(f"{API_PREFIX}/health/hashing")
+
+    assert response.status_code == 200
+    hashing = response.json()["hashing"]
+    assert hashing["completed"] >= 1
+    assert hashing["queued"] == 0
+
+
+def test_hashing_queue_depth_survives_cancelled_waiters(monkeypatch):
+    import asyncio
+    from app.helpers.utils import password_hash
+
+    async def scenario():
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setattr(password_hash, "_semaphore", semaphore)
+        queued = password_hash.hashing_stats.queued
+        await semaphore.acquire()  # every slot busy
+        waiter = asyncio.create_task(password_hash.hash_password("secret"))
+        await asyncio.sleep(0.01)
+        assert password_hash.hashing_stats.queued == queued + 1
+
+        waiter.cancel()  # e.g. the request timed out while queued
+        await asyncio.gather(waiter, return_exceptions=True)
+        semaphore.release()
+        return queued
+
+    queued = asyncio.run(scenario())
+
+    assert password_hash.hashing_stats.queued == queued
+
+
+def test_hashing_slot_held_until_cancelled_hash_finishes(monkeypatch):
+    import asyncio
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from app.helpers.utils import password_hash
+
+    release = threading.Event()
+    executor = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(password_hash, "_executor", executor)
+
+    async def scenario():
+        semaphore = asyncio.Semaphore(1)
+        monkeypatch.setattr(password_hash, "_semaphore", semaphore)
+        caller = asyncio.create_task(password_hash._run(release.wait, 5))
+        await asyncio.sleep(0.01)
+        caller.cancel()  # the client went away; the thread keeps hashing
+        await asyncio.gather(caller, return_exceptions=True)
+        still_held = semaphore.locked()
+
+        release.set()
+        for _ in range(100):
+            if not semaphore.locked():
+                break
+            await asyncio.sleep(0.01)
+        return still_held, semaphore.locked()
+
+    try:
+        assert asyncio.run(scenario()) == (True, False)
+    finally:
+        executor.shutdown()
+
+
+def test_metrics_endpoint(client, test_user):
+    client.post(
+        f"{API_PREFIX}/auth/login",
+        json={"username": "user1", "email": test_user.email, "password": "correctpass"},
+    )
+    client.get(HEALTH_URL)
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+    assert f'http_requests_total{{method="POST",route="{API_PREFIX}/auth/login",status="200"}}' in body
+    assert f'http_request_duration_seconds_bucket{{method="GET",route="{HEALTH_URL}",le="+Inf"}}' in body
+    assert 'password_hash_duration_seconds_count{operation="verify"}' in body
+    assert 'db_pool{engine="sync",stat="checkouts"}' in body
+
+
+def test_query_metrics_histogram():
+    from sqlalchemy import create_engine, text
+
+    from app.connections.query_metrics import instrument_queries
+    from app.helpers.utils.metrics import db_query_duration_seconds
+
+    engine = create_engine("sqlite://")
+    instrument_queries(engine, "test")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        conn.execute(text("select 2"))
+
+    counts, total = db_query_duration_seconds.values()[("test", "select")]
+    assert sum(counts) == 2
+    assert total > 0
+    rendered = "\n".join(db_query_duration_seconds.render())
+    assert 'db_query_duration_seconds_count{engine="test",operation="select"} 2' in rendered
+    engine.dispose()
+
+
+def test_metric_shards_merge_across_threads():
+    import threading
+
+    from app.helpers.utils.metrics import Counter, Histogram
+
+    counter = Counter("jobs_total", "Jobs.", ("kind",))
+    histogram = Histogram("job_seconds", "Job time.", buckets=(0.1, 1.0))
+
+    def work():
+        for _ in range(1000):
+            counter.inc(("a",))
+            histogram.observe(0.5)
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert counter.values() == {("a",): 4000}
+    assert histogram.render()[2:] == [
+        'job_seconds_bucket{le="0.1"} 0',
+        'job_seconds_bucket{le="1"} 4000',
+        'job_seconds_bucket{le="+Inf"} 4000',
+        "job_seconds_sum 2000",
+        "job_seconds_count 4000",
+    ]
+
+
+def test_openapi_served_from_prebuilt_file(client, tmp_path, monkeypatch):
+    import json
+    from app.core.config import settings
+    from app.helpers.utils.custom_openapi import write_openapi
+    from app.main import app
+
+    path = tmp_path / "openapi.json"
+    write_openapi(app, str(path))
+    schema = json.loads(path.read_text())
+    assert "/api/v1/auth/login" in schema["paths"]
+
+    # the file is served as-is, nothing is generated
+    schema["info"]["title"] = "Prebuilt"
+    path.write_text(json.dumps(schema))
+    monkeypatch.setattr(settings, "OPENAPI_SCHEMA_FILE", str(path))
+    monkeypatch.setattr(app, "openapi_schema", None)
+
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert response.json()["info"]["title"] == "Prebuilt"
+
+
+def test_missing_openapi_schema_file_fails_startup(tmp_path, monkeypatch):
+    import pytest
+    from fastapi.testclient import TestClient
+    from app.core.config import settings
+    from app.main import app
+
+    monkeypatch.setattr(settings, "OPENAPI_SCHEMA_FILE", str(tmp_path / "missing.json"))
+    monkeypatch.setattr(app, "openapi_schema", None)
+
+    with pytest.raises(FileNotFoundError):
+        with TestClient(app):
+            pass
+
+
+def test_bad_encryption_key_fails_startup(monkeypatch):
+    import pytest
+    from fastapi.testclient import TestClient
+    from app.core.config import settings
+    from app.helpers.utils.encrypt import get_cipher
+    from app.main import app
+
+    monkeypatch.setattr(settings, "ENCRYPTION_KEY", "not-a-fernet-key")
+    get_cipher.cache_clear()
+    try:
+        with pytest.raises(ValueError):
+            with TestClient(app):
+                pass
+    finally:
+        get_cipher.cache_clear()
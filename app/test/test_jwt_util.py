@@ -0,0 +1,129 @@
+from datetime import timedelta
+
+import pytest
+
+from app.helpers.utils.jwt_util import create_access_token, verified_token_cache, verify_token
+
+
+def test_verify_token_is_cached_until_expiry():
+    verified_token_cache.clear()
+    token, _ = create_access_token({"sub": "1"})
+
+    first = verify_token(token)
+    hits = verified_token_cache.stats()["hits"]
+    second = verify_token(token)
+
+    assert first == second
+    assert verified_token_cache.stats()["hits"] == hits + 1
+
+    # callers get their own copy of the claims
+    second["sub"] = "2"
+    assert verify_token(token)["sub"] == "1"
+
+
+def test_expired_token_is_not_cached():
+    verified_token_cache.clear()
+    token, _ = create_access_token({"sub": "1"}, expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(ValueError):
+        verify_token(token)
+    assert len(verified_token_cache) == 0
+
+
+def test_iat_is_truncated_to_the_millisecond(monkeypatch):
+    from datetime import datetime, timezone
+
+    from jose import jwt
+
+    from app.helpers.utils import jwt_util
+
+    issued = datetime.fromtimestamp(1_700_000_000.0009, timezone.utc)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return issued
+
+    monkeypatch.setattr(jwt_util, "datetime", FrozenDatetime)
+    token, _ = create_access_token({"sub": "1"})
+
+    # rounding would give .001, after the real issue time (and after a revoke-all cutoff at it)
+    assert jwt.get_unverified_claims(token)["iat"] == 1_700_000_000.0
+
+
+def test_bloom_filter_has_no_false_negatives():
+    from app.helpers.utils.bloom_filter import BloomFilter
+
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"revoked-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+    false_positives = sum(f"valid-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+def _pem(private_key) -> str:
+    from cryptography.hazmat.primitives import serialization
+
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def _public_pem(private_key) -> str:
+    from cryptography.hazmat.primitives import serialization
+
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def test_asymmetric_keyring_rotation(monkeypatch):
+    from cryptography.hazmat.primitives.asymmetric import ed25519, rsa
+    from jose import jwt
+    from app.helpers.utils import jwt_util
+    from app.helpers.utils.jwt_keys import JWTKeyRing
+
+    old_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    new_key = ed25519.Ed25519PrivateKey.generate()
+
+    old_ring = JWTKeyRing("RS256", private_key=_pem(old_key), key_id="old")
+    monkeypatch.setattr(jwt_util, "get_keyring", lambda: old_ring)
+    old_token, _ = create_access_token({"sub": "1"})
+    assert jwt.get_unverified_header(old_token) == {"alg": "RS256", "kid": "old", "typ": "JWT"}
+
+    # rotate: sign with the Ed25519 key, keep accepting the RSA one
+    ring = JWTKeyRing("EdDSA", private_key=_pem(new_key), verification_keys={"old": _public_pem(old_key)})
+    monkeypatch.setattr(jwt_util, "get_keyring", lambda: ring)
+    verified_token_cache.clear()
+    new_token, _ = create_access_token({"sub": "2"})
+
+    assert jwt.get_unverified_header(new_token)["kid"] == ring.kid
+    assert verify_token(new_token)["sub"] == "2"
+    assert verify_token(old_token)["sub"] == "1"
+
+    # public keys only, one per kid
+    keys = {key["kid"]: key for key in ring.jwks()["keys"]}
+    assert keys[ring.kid]["kty"] == "OKP" and "d" not in keys[ring.kid]
+    assert keys["old"]["kty"] == "RSA" and keys["old"]["alg"] == "RS256" and "d" not in keys["old"]
+
+    # a token whose kid is not in the ring is rejected
+    stranger = JWTKeyRing("EdDSA", private_key=_pem(ed25519.Ed25519PrivateKey.generate()))
+    forged = jwt.encode({"sub": "1"}, stranger.signing_key, algorithm="EdDSA", headers={"kid": "old"})
+    with pytest.raises(ValueError):
+        verify_token(forged)
+
+
+def test_jwks_endpoint_is_cacheable(client):
+    response = client.get("/.well-known/jwks.json")
+
+    assert response.status_code == 200
+    # HS256: the shared secret is never published
+    assert response.json() == {"keys": []}
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    etag = response.headers["etag"]
+    response = client.get("/.well-known/jwks.json", headers={"If-None-Match": etag})
+    assert response.status_code == 304
@@ -0,0 +1,349 @@
+import json
+import logging
+
+from starlette.applications import Starlette
+from starlette.responses import StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from app.middlewares.logging_middleware import RotationalLoggerMiddleware
+
+
+def _streaming_app():
+    async def stream(request):
+        await request.body()
+
+        async def chunks():
+            for _ in range(4):
+                yield b"x" * 100
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return Starlette(routes=[Route("/stream", stream, methods=["POST"])])
+
+
+def test_access_log_truncates_bodies_without_buffering(caplog):
+    app = RotationalLoggerMiddleware(_streaming_app(), capture_body=True, max_body_bytes=64)
+
+    with caplog.at_level(logging.INFO, logger="rotational_logger"):
+        response = TestClient(app).post("/stream", content=b"y" * 200)
+
+    assert response.status_code == 200
+    assert response.content == b"x" * 400
+
+    entry = caplog.records[-1].log_entry
+    assert entry["status_code"] == 200
+    assert entry["request_bytes"] == 200
+    assert entry["response_bytes"] == 400
+    assert entry["response_body"] == "x" * 64
+    assert entry["body_truncated"] is True
+
+
+def test_bounded_log_queue_drops_when_full():
+    import queue
+
+    from app.helpers.loggers.logging_config import BoundedQueueHandler, log_queue_stats
+
+    handler = BoundedQueueHandler(queue.Queue(maxsize=1), full_policy="drop")
+    record = logging.LogRecord("rotational_logger", logging.INFO, __file__, 0, "msg", None, None)
+    dropped = log_queue_stats.dropped
+
+    handler.handle(record)
+    handler.handle(record)
+
+    assert handler.queue.qsize() == 1
+    assert log_queue_stats.dropped == dropped + 1
+
+
+def test_json_formatter_and_sampler():
+    from app.helpers.loggers.json_formatter import AccessLogSampler, JsonFormatter
+
+    record = logging.LogRecord("rotational_logger", logging.INFO, __file__, 0, "access", None, None)
+    record.log_entry = {"path": "/api/v1/health", "status_code": 200}
+
+    line = json.loads(JsonFormatter().format(record))
+    assert line["level"] == "INFO"
+    assert line["path"] == "/api/v1/health"
+    assert "timestamp" in line
+
+    sampler = AccessLogSampler({"/api/v1/health|2xx": 0.0, "*|5xx": 1.0})
+    assert sampler.filter(record) is False
+    record.log_entry["status_code"] = 503
+    assert sampler.filter(record) is True
+    assert sampler.rate_for("/api/v1/auth/me", 200) == 1.0
+
+
+def test_route_overrides_follow_api_prefix():
+    from app.core.config import Settings
+
+    settings = Settings(API_PREFIX="/v2")
+
+    assert settings.REQUEST_TIMEOUT_OVERRIDES == {"/v2/health": 1, "/v2/auth/exportUsers": 60}
+    assert settings.REQUEST_BODY_LIMIT_OVERRIDES == {"/v2/auth/login": 16384, "/v2/auth/registerUsers/bulk": 10485760}
+    assert settings.RATE_LIMIT_ROUTES == {"/v2/health": "", "/metrics": "", "/v2/auth/registerUsers": "30/minute"}
+
+
+def test_timeout_middleware_cancels_and_uses_route_budget():
+    import asyncio
+
+    from starlette.responses import PlainTextResponse
+
+    from app.middlewares.timeout_middleware import TimeoutMiddleware, timeout_stats
+
+    state = {"cancelled": False}
+
+    async def slow(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            state["cancelled"] = True
+            raise
+        return PlainTextResponse("done")
+
+    async def quick(request):
+        await asyncio.sleep(0.1)
+        return PlainTextResponse("done")
+
+    inner = Starlette(routes=[Route("/slow/{item}", slow), Route("/export/quick", quick)])
+    app = TimeoutMiddleware(inner, timeout=0.05, route_timeouts={"/export": 1})
+    before = timeout_stats.before_response.get("/slow/{item}", 0)
+
+    with TestClient(app) as client:
+        response = client.get("/slow/1")
+        assert response.status_code == 408
+        assert response.json()["data"]["message"] == "Request timed out after 0.05 seconds"
+        assert state["cancelled"] is True
+        assert timeout_stats.before_response["/slow/{item}"] == before + 1
+
+        # the prefix override gives /export a longer budget than the default
+        assert client.get("/export/quick").text == "done"
+
+
+def test_timeout_stats_key_unmatched_paths_together():
+    import asyncio
+
+    from app.middlewares.timeout_middleware import TimeoutMiddleware, timeout_stats
+
+    async def no_routes(scope, receive, send):
+        await asyncio.sleep(5)
+
+    app = TimeoutMiddleware(no_routes, timeout=0.05)
+    before = timeout_stats.before_response.get("unmatched", 0)
+
+    client = TestClient(app)
+    for item in (1, 2):
+        assert client.get(f"/scan/{item}").status_code == 408
+
+    assert timeout_stats.before_response["unmatched"] == before + 2
+    assert "/scan/1" not in timeout_stats.before_response
+
+
+def test_timeout_middleware_aborts_started_stream():
+    import asyncio
+
+    import pytest
+
+    from app.middlewares.timeout_middleware import TimeoutMiddleware, timeout_stats
+
+    async def stalled(request):
+        async def chunks():
+            yield b"first"
+            await asyncio.sleep(5)
+            yield b"never"
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app = TimeoutMiddleware(Starlette(routes=[Route("/stalled", stalled)]), timeout=0.05)
+    before = timeout_stats.after_response_start.get("/stalled", 0)
+
+    # headers are already sent, so no 408 is possible: the request is aborted instead
+    with pytest.raises(asyncio.TimeoutError):
+        TestClient(app).get("/stalled")
+    assert timeout_stats.after_response_start["/stalled"] == before + 1
+
+
+def test_timeout_raised_inside_the_app_is_not_a_408():
+    import pytest
+
+    from app.middlewares.request_pipeline_middleware import RequestPipelineMiddleware
+    from app.middlewares.timeout_middleware import TimeoutMiddleware, timeout_stats
+
+    async def upstream(request):
+        raise TimeoutError("database statement timeout")
+
+    inner = Starlette(routes=[Route("/upstream", upstream)])
+    before = timeout_stats.before_response.get("/upstream", 0)
+    for app in (TimeoutMiddleware(inner, timeout=5), RequestPipelineMiddleware(inner, timeout=5)):
+        with pytest.raises(TimeoutError, match="database statement timeout"):
+            TestClient(app).get("/upstream")
+    # not counted as a request timeout either
+    assert timeout_stats.before_response.get("/upstream", 0) == before
+
+
+def test_timeout_does_not_cut_off_slow_streams():
+    import asyncio
+
+    from app.middlewares.request_pipeline_middleware import RequestPipelineMiddleware
+    from app.middlewares.timeout_middleware import TimeoutMiddleware
+
+    async def export(request):
+        async def chunks():
+            for index in range(6):
+                await asyncio.sleep(0.03)
+                yield f"{index}\n".encode()
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    inner = Starlette(routes=[Route("/export", export)])
+    # the body takes ~0.18s in total, but no gap between chunks reaches the 0.1s budget
+    for app in (TimeoutMiddleware(inner, timeout=0.1), RequestPipelineMiddleware(inner, timeout=0.1)):
+        response = TestClient(app).get("/export")
+        assert response.status_code == 200
+        assert response.text == "".join(f"{index}\n" for index in range(6))
+
+
+def test_payload_limit_cuts_off_chunked_body():
+    import asyncio
+
+    from starlette.responses import PlainTextResponse
+
+    from app.middlewares.payload_limit_middleware import PayloadLimitMiddleware
+
+    async def upload(request):
+        await request.body()
+        return PlainTextResponse("stored")
+
+    inner = Starlette(routes=[Route("/login", upload, methods=["POST"]), Route("/bulk", upload, methods=["POST"])])
+    app = PayloadLimitMiddleware(inner, max_content_size=1000, route_limits={"/login": 100})
+
+    async def call(path):
+        # chunked upload: no Content-Length, ten 50 byte messages
+        pulled, sent = [], []
+        chunks = [{"type": "http.request", "body": b"x" * 50, "more_body": i < 9} for i in range(10)]
+
+        async def receive():
+            pulled.append(1)
+            return chunks.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        scope = {"type": "http", "method": "POST", "path": path, "headers": [], "query_string": b""}
+        await app(scope, receive, send)
+        return len(pulled), sent
+
+    pulled, sent = asyncio.run(call("/login"))
+    assert sent[0]["status"] == 413
+    assert b"Max allowed size is 0.10 KB" in sent[1]["body"]
+    # reading stopped at the first chunk past the limit and the app's own answer was dropped
+    assert pulled == 3
+    assert len(sent) == 2
+
+    pulled, sent = asyncio.run(call("/bulk"))
+    assert sent[0]["status"] == 200
+    assert pulled == 10
+
+    # a declared Content-Length over the limit is rejected before the body is read
+    assert TestClient(app).post("/login", content=b"x" * 101).status_code == 413
+
+
+def test_request_pipeline_limits_times_out_and_logs(caplog):
+    import asyncio
+
+    from starlette.responses import PlainTextResponse
+
+    from app.middlewares.request_pipeline_middleware import RequestPipelineMiddleware
+
+    async def echo(request):
+        return PlainTextResponse(await request.body())
+
+    async def slow(request):
+        await asyncio.sleep(5)
+
+    inner = Starlette(routes=[Route("/echo", echo, methods=["POST"]), Route("/slow", slow)])
+    app = RequestPipelineMiddleware(
+        inner, timeout=0.05, max_content_size=100, route_limits={"/echo": 10}, capture_body=True, max_body_bytes=4
+    )
+    client = TestClient(app)
+
+    with caplog.at_level(logging.INFO, logger="rotational_logger"):
+        assert client.post("/echo", content=b"hello").text == "hello"
+        ok = caplog.records[-1].log_entry
+        assert client.post("/echo", content=b"x" * 11).status_code == 413
+        too_large = caplog.records[-1].log_entry
+        assert client.get("/slow").status_code == 408
+        timed_out = caplog.records[-1].log_entry
+
+    assert ok["status_code"] == 200
+    assert ok["request_body"] == "hell"
+    assert ok["body_truncated"] is True
+    # responses produced by the pipeline itself are access-logged as well
+    assert too_large["status_code"] == 413
+    assert timed_out["status_code"] == 408
+
+
+def test_token_bucket_refills_and_evicts():
+    import asyncio
+
+    from app.helpers.utils.rate_limiter import InMemoryRateLimitBackend, RateLimit
+
+    now = [0.0]
+    backend = InMemoryRateLimitBackend(max_keys=2, sweep_interval=60, clock=lambda: now[0])
+    limit = RateLimit.parse("2/second")
+    assert limit == RateLimit(capacity=2, rate=2.0)
+    assert RateLimit.parse("") is None
+
+    async def run():
+        assert await backend.hit("a", limit) == 0
+        assert await backend.hit("a", limit) == 0
+        assert await backend.hit("a", limit) == 0.5  # empty: one token back in 0.5s
+        now[0] = 0.5
+        assert await backend.hit("a", limit) == 0  # refilled lazily
+
+        # past max_keys the least recently hit bucket goes first
+        await backend.hit("b", limit)
+        await backend.hit("c", limit)
+        assert backend.stats()["buckets"] == 2
+        assert await backend.hit("a", limit) == 0  # dropped, so it starts full again
+
+        # the periodic sweep drops buckets that are back to full
+        now[0] = 120
+        await backend.hit("d", limit)
+        assert backend.stats()["buckets"] == 1
+
+    asyncio.run(run())
+
+
+def test_incomplete_rate_limit_backend_fails_at_construction():
+    import pytest
+
+    from app.helpers.utils.rate_limiter import RateLimitBackend
+
+    class HitOnly(RateLimitBackend):
+        async def hit(self, key, limit, cost=1):
+            return 0.0
+
+    with pytest.raises(TypeError):
+        HitOnly()
+
+
+def test_rate_limit_middleware_per_route_prefix():
+    from starlette.responses import PlainTextResponse
+
+    from app.helpers.utils.rate_limiter import rate_limiter
+    from app.middlewares.rate_limit_middleware import RateLimitMiddleware
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    inner = Starlette(routes=[Route("/api/items", ok), Route("/health", ok)])
+    app = RateLimitMiddleware(inner, default="2/minute", route_limits={"/health": ""})
+    client = TestClient(app)
+    rate_limiter.backend.clear()
+
+    assert [client.get("/api/items").status_code for _ in range(3)] == [200, 200, 429]
+    response = client.get("/api/items")
+    assert response.headers["retry-after"] == "30"
+    assert response.json()["data"]["message"] == "Too many requests. Please retry later."
+    assert all(client.get("/health").status_code == 200 for _ in range(5))
+    rate_limiter.backend.clear()
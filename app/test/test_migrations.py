@@ -0,0 +1,66 @@
+from sqlalchemy import create_engine, inspect, text
+
+from app.connections.migrations import MIGRATIONS, applied_versions, run_migrations
+from app.test.conftest import engine
+
+
+def _plan(sql, **params):
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def test_migrations_create_schema_and_are_idempotent(tmp_path):
+    fresh = create_engine(f"sqlite:///{tmp_path}/migrate.db")
+
+    assert run_migrations(fresh) == [migration.version for migration in MIGRATIONS]
+    assert run_migrations(fresh) == []
+    assert applied_versions(fresh) == {migration.version for migration in MIGRATIONS}
+
+    index_names = {index["name"] for index in inspect(fresh).get_indexes("users")}
+    assert "ix_users_created_at_id" in index_names
+    assert "ix_users_user_name_email_role" not in index_names
+    fresh.dispose()
+
+
+def test_redundant_login_index_is_dropped(tmp_path, monkeypatch):
+    from app.connections import migrations
+
+    # a database migrated before migration 5 existed
+    old = create_engine(f"sqlite:///{tmp_path}/old.db")
+    monkeypatch.setattr(migrations, "MIGRATIONS", [m for m in MIGRATIONS if m.version < 5])
+    assert run_migrations(old) == [1, 2, 3, 4]
+    assert "ix_users_user_name_email_role" in {index["name"] for index in inspect(old).get_indexes("users")}
+
+    monkeypatch.setattr(migrations, "MIGRATIONS", MIGRATIONS)
+    assert run_migrations(old) == [5]
+    assert "ix_users_user_name_email_role" not in {index["name"] for index in inspect(old).get_indexes("users")}
+    old.dispose()
+
+
+def _unique_index_on(column):
+    # name of the index SQLite creates for a UNIQUE column constraint
+    with engine.connect() as conn:
+        for row in conn.execute(text("PRAGMA index_list(users)")).all():
+            columns = [info[2] for info in conn.execute(text(f"PRAGMA index_info({row[1]})")).all()]
+            if row[2] and columns == [column]:
+                return row[1]
+
+
+def test_listing_uses_created_at_index(db):
+    plan = _plan("SELECT id FROM users ORDER BY created_at DESC, id DESC LIMIT 20")
+
+    assert "ix_users_created_at_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_login_and_registration_lookups_use_the_email_index(db):
+    login = _plan("SELECT id FROM users WHERE user_name = :u AND email = :e", u="a", e="b")
+    register = _plan(
+        "SELECT id FROM users WHERE user_name = :u AND email = :e AND role = :r", u="a", e="b", r="USER"
+    )
+
+    email_index = _unique_index_on("email")
+    assert email_index
+    for plan in (login, register):
+        assert f"SEARCH users USING INDEX {email_index} (email=?)" in plan
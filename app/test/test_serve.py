@@ -0,0 +1,112 @@
+import http.client
+import os
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.serve import worker_log_path
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="the launcher forks its workers")
+
+# a tiny ASGI app stands in for app.main: the launcher, not the API, is under test
+SERVER = """
+import asyncio, sys
+from app.core.config import settings
+from app.serve import serve
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                if {fail_startup}:
+                    await send({{"type": "lifespan.startup.failed", "message": "boom"}})
+                else:
+                    await send({{"type": "lifespan.startup.complete"}})
+            elif message["type"] == "lifespan.shutdown":
+                await send({{"type": "lifespan.shutdown.complete"}})
+                return
+    await asyncio.sleep(1.0 if scope["path"] == "/slow" else 0)
+    await send({{"type": "http.response.start", "status": 200, "headers": []}})
+    body = settings.LOG_FILE_PATH if scope["path"] == "/log-file" else scope["path"]
+    await send({{"type": "http.response.body", "body": body.encode()}})
+
+sys.exit(serve(app, "127.0.0.1", {port}, workers=2, graceful_timeout=5))
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start(fail_startup: bool = False):
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVER.format(port=port, fail_startup=fail_startup)],
+        stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True,
+    )
+    return process, port
+
+
+def _get(port: int, path: str, timeout: float = 5):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        return response.status, response.read().decode()
+    finally:
+        conn.close()
+
+
+def _wait_ready(port: int):
+    deadline = time.monotonic() + 15
+    while time.monotonic() < deadline:
+        try:
+            return _get(port, "/ready", timeout=1)
+        except OSError:
+            time.sleep(0.1)
+    raise AssertionError("server did not start")
+
+
+def test_sigterm_drains_in_flight_requests():
+    process, port = _start()
+    try:
+        assert _wait_ready(port) == (200, "/ready")
+        # each worker rotates its own access log
+        _, log_file = _get(port, "/log-file")
+        assert log_file in {worker_log_path(settings.LOG_FILE_PATH, worker) for worker in (1, 2)}
+
+        result = {}
+        slow = threading.Thread(target=lambda: result.update(response=_get(port, "/slow")))
+        slow.start()
+        time.sleep(0.3)  # the request is now in flight
+        process.send_signal(signal.SIGTERM)
+        slow.join(10)
+
+        assert result["response"] == (200, "/slow")
+        assert process.wait(15) == 0
+    finally:
+        if process.poll() is None:
+            process.kill()
+        process.communicate()
+
+
+def test_startup_failure_stops_instead_of_respawning():
+    process, _ = _start(fail_startup=True)
+    try:
+        assert process.wait(15) == 1
+        output = process.communicate()[0]
+    finally:
+        if process.poll() is None:
+            process.kill()
+
+    assert "failed to start" in output
+    assert "starting a new one" not in output
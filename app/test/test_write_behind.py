@@ -0,0 +1,72 @@
+import asyncio
+from datetime import datetime, timezone
+
+from app.connections.write_behind import LoginMetadataBuffer
+from app.models.user_model import UserModel
+from app.test.conftest import TestingAsyncSessionLocal
+
+
+def test_login_metadata_is_coalesced_and_flushed(db, test_user, admin_user):
+    async def scenario():
+        buffer = LoginMetadataBuffer(interval_ms=60_000, max_records=1000)
+        buffer.start(TestingAsyncSessionLocal)
+        now = datetime.now(timezone.utc)
+        buffer.record(test_user.id, access_token="first", last_login=now, updated_at=now)
+        buffer.record(test_user.id, access_token="second", last_login=now, updated_at=now)
+        buffer.record(admin_user.id, access_token="admin", last_login=now, updated_at=now)
+        await buffer.stop()  # flushes on shutdown
+        return buffer.snapshot()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["coalesced"] == 1
+    assert stats["flushed_batches"] == 1
+    assert stats["flushed_rows"] == 2
+    db.expire_all()
+    assert db.get(UserModel, test_user.id).access_token == "second"
+    assert db.get(UserModel, admin_user.id).last_login is not None
+
+
+def test_flush_skips_users_deleted_since_login(db, test_user, admin_user):
+    async def scenario():
+        buffer = LoginMetadataBuffer(interval_ms=60_000, max_records=1000)
+        buffer.start(TestingAsyncSessionLocal)
+        now = datetime.now(timezone.utc)
+        buffer.record(test_user.id, access_token="gone", last_login=now, updated_at=now)
+        buffer.record(admin_user.id, access_token="admin", last_login=now, updated_at=now)
+        db.delete(db.get(UserModel, test_user.id))
+        db.commit()
+        await buffer.stop()
+        return buffer.snapshot()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["errors"] == 0
+    assert stats["pending"] == 0
+    db.expire_all()
+    assert db.get(UserModel, admin_user.id).access_token == "admin"
+
+
+def test_failing_flush_is_retried_a_bounded_number_of_times(test_user):
+    class BrokenSession:
+        async def __aenter__(self):
+            raise ConnectionError("database unavailable")
+
+        async def __aexit__(self, *exc_info):
+            return False
+
+    async def scenario():
+        buffer = LoginMetadataBuffer(interval_ms=60_000, max_records=1000, max_attempts=3)
+        buffer.start(BrokenSession)
+        now = datetime.now(timezone.utc)
+        buffer.record(test_user.id, access_token="token", last_login=now, updated_at=now)
+        for _ in range(5):
+            await buffer.flush()
+        await buffer.stop()
+        return buffer.snapshot()
+
+    stats = asyncio.run(scenario())
+
+    assert stats["errors"] == 3
+    assert stats["pending"] == 0
+    assert stats["dropped_rows"] == 1
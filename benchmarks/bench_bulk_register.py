@@ -0,0 +1,86 @@
+"""
+Registration throughput (users/second): one register_user call per user vs
+bulk_register_users, against a temporary SQLite database.
+
+bcrypt rounds are lowered (``--rounds``, default 4) so the numbers show the
+database-path difference; at production cost hashing dominates both paths and
+throughput scales with PASSWORD_HASH_WORKERS.
+
+Usage:
+    python -m benchmarks.bench_bulk_register [users] [--rounds N]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ENCRYPTION_KEY", "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine  # noqa: E402
+
+from app.api.services.auth_service import register_user  # noqa: E402
+from app.api.services.bulk_register_service import bulk_register_users  # noqa: E402
+from app.connections.db_connector import Base  # noqa: E402
+from app.helpers.enums.enum_config import userRegisterToken  # noqa: E402
+from app.helpers.utils.password_hash import pwd_context, shutdown_password_executor  # noqa: E402
+
+
+def _users(prefix, count):
+    return [
+        {
+            "user_name": f"{prefix}{i}",
+            "email": f"{prefix}{i}@bench.com",
+            "password": "secret",
+            "registration_token": userRegisterToken.REGISTRATION_TOKEN.value,
+            "role": "USER",
+        }
+        for i in range(count)
+    ]
+
+
+async def run(count: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp}/bench.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+        async with session_factory() as db:
+            started = time.perf_counter()
+            for user in _users("single", count):
+                await register_user(data=user, db=db)
+            single = time.perf_counter() - started
+
+        async with session_factory() as db:
+            started = time.perf_counter()
+            await bulk_register_users(items=_users("bulk", count), db=db)
+            bulk = time.perf_counter() - started
+
+        await engine.dispose()
+
+    print(f"{count} users")
+    print(f"  register_user x{count}: {count / single:10.1f} users/s ({single:.2f}s)")
+    print(f"  bulk_register_users:  {count / bulk:10.1f} users/s ({bulk:.2f}s)")
+
+
+def main():
+    args = sys.argv[1:]
+    rounds = 4
+    if "--rounds" in args:
+        position = args.index("--rounds")
+        rounds = int(args[position + 1])
+        del args[position:position + 2]
+    count = int(args[0]) if args else 1000
+
+    pwd_context.update(bcrypt__rounds=rounds)
+    print(f"bcrypt rounds={rounds}")
+    try:
+        asyncio.run(run(count))
+    finally:
+        shutdown_password_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Cold start profile: ``python -X importtime -c "import app.main"`` in fresh
+interpreters, plus time to first response (import, startup events, first
+GET /api/v1/health through TestClient) against a temporary SQLite database.
+
+Reports the median of the runs; the module table is the slowest imports
+(cumulative time, median over the runs) of the packages that matter here.
+
+Usage:
+    python -m benchmarks.bench_cold_start [runs] [--top N]
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+_TMP = tempfile.mkdtemp()
+ENV = {
+    "JWT_SECRET_KEY": "benchmark-secret",
+    "ENCRYPTION_KEY": "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=",
+    "DATABASE_URL": f"sqlite:///{_TMP}/bench.db",
+    "LOG_FILE_PATH": f"{_TMP}/app.log",
+}
+
+# modules worth watching on the startup path (top-level packages plus our own)
+WATCH = ("app.", "fastapi", "starlette", "pydantic", "sqlalchemy", "jose", "passlib", "cryptography", "uvicorn", "orjson")
+
+FIRST_REQUEST = """
+import json, time
+t0 = time.perf_counter()
+from app.main import app
+t1 = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(app) as client:
+    t2 = time.perf_counter()
+    status = client.get("/api/v1/health").status_code
+    t3 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "startup": t2 - t1, "first_request": t3 - t2, "status": status}))
+"""
+
+
+def _env() -> Dict[str, str]:
+    env = dict(os.environ)
+    for key, value in ENV.items():
+        env.setdefault(key, value)
+    return env
+
+
+def import_profile() -> Dict[str, int]:
+    # module -> cumulative microseconds, from one fresh interpreter
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        capture_output=True, text=True, env=_env(), check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, self_us, cumulative_us, name = (part.strip() for part in line.replace("import time:", "|", 1).split("|"))
+        cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def first_request() -> Dict[str, float]:
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_REQUEST], capture_output=True, text=True, env=_env(), check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(runs: int = 5, top: int = 15):
+    profiles: List[Dict[str, int]] = [import_profile() for _ in range(runs)]
+    timings = [first_request() for _ in range(runs)]
+
+    print(f"cold start, median of {runs} fresh interpreters")
+    print(f"  import app.main (-X importtime)  {statistics.median(p['app.main'] for p in profiles) / 1000:8.1f} ms")
+    for phase in ("import", "startup", "first_request"):
+        print(f"  {phase:<32} {statistics.median(t[phase] for t in timings) * 1000:8.1f} ms")
+    total = statistics.median(sum(t[p] for p in ("import", "startup", "first_request")) for t in timings)
+    print(f"  {'time to first response':<32} {total * 1000:8.1f} ms")
+
+    modules = set().union(*profiles)
+    medians = {
+        name: statistics.median(p.get(name, 0) for p in profiles)
+        for name in modules
+        if name.startswith(WATCH) and name != "app.main"
+    }
+    print(f"\n  slowest imports (cumulative ms, includes what they import)")
+    for name, value in sorted(medians.items(), key=lambda item: item[1], reverse=True)[:top]:
+        print(f"    {name:<48} {value / 1000:8.1f}")
+    for package in ("jose.jwt", "passlib.context", "cryptography", "uvicorn"):
+        loaded = sum(package in p for p in profiles)
+        print(f"  {package:<14} imported at startup in {loaded}/{runs} runs")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    top = 15
+    if "--top" in args:
+        index = args.index("--top")
+        top = int(args[index + 1])
+        del args[index:index + 2]
+    main(int(args[0]) if args else 5, top)
@@ -0,0 +1,85 @@
+"""
+/getUsers page build + render at 100 items per page: ORM rows + isoformat dicts +
+stdlib JSONResponse (before) vs column rows + user_rows_to_wire + FastJSONResponse (after).
+
+Usage:
+    python -m benchmarks.bench_get_users [iterations]
+"""
+import os
+import sys
+import tempfile
+import timeit
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ENCRYPTION_KEY", "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.connections.db_connector import Base  # noqa: E402
+from app.helpers.enums.enum_config import userRoles  # noqa: E402
+from app.helpers.utils.fast_json import HAS_ORJSON  # noqa: E402
+from app.helpers.utils.json_response import FastJSONResponse  # noqa: E402
+from app.helpers.utils.user_serializer import USER_LIST_COLUMNS, user_rows_to_wire  # noqa: E402
+from app.models.user_model import UserModel  # noqa: E402
+
+ITEMS_PER_PAGE = 100
+
+
+def _envelope(users):
+    return {"error": False, "data": {"users": users, "message": "Users fetched successfully."}}
+
+
+def before(session):
+    users = (
+        session.execute(select(UserModel).order_by(UserModel.created_at.desc()).limit(ITEMS_PER_PAGE))
+        .scalars()
+        .all()
+    )
+    user_list = [
+        {
+            "id": str(user.id),
+            "username": user.user_name,
+            "email": user.email,
+            "role": user.role.value,
+            "lastLogin": user.last_login.isoformat() if user.last_login else None,
+            "createdAt": user.created_at.isoformat() if user.created_at else None,
+        }
+        for user in users
+    ]
+    session.expunge_all()  # the request-scoped session would start empty
+    return JSONResponse(_envelope(user_list)).body
+
+
+def after(session):
+    rows = session.execute(
+        select(*USER_LIST_COLUMNS).order_by(UserModel.created_at.desc()).limit(ITEMS_PER_PAGE)
+    ).all()
+    return FastJSONResponse(_envelope(user_rows_to_wire(rows))).body
+
+
+def main(iterations: int = 500):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add_all(
+            UserModel(user_name=f"user{i}", email=f"user{i}@bench.com", password="x", role=userRoles.USER)
+            for i in range(1000)
+        )
+        session.commit()
+        session.expunge_all()
+
+        print(f"/getUsers page of {ITEMS_PER_PAGE}, {iterations} iterations, best of 3 (orjson={HAS_ORJSON})")
+        results = {}
+        for name, func in (("before", before), ("after", after)):
+            results[name] = min(timeit.repeat(lambda: func(session), number=iterations, repeat=3))
+            print(f"  {name:<7} {results[name] / iterations * 1e3:8.3f} ms/page")
+        print(f"  speedup: {results['before'] / results['after']:.2f}x")
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
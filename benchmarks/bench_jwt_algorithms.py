@@ -0,0 +1,81 @@
+"""
+Sign and verify cost per JWT algorithm (HS256, RS256, ES256, EdDSA), with the
+key object parsed once (as JWTKeyRing holds it) and with the key passed as a
+secret/PEM string, which python-jose parses again on every call.
+
+Keys are generated in memory; the verified-token cache is not involved. The
+string-key columns run iterations / 50 calls.
+
+Usage:
+    python -m benchmarks.bench_jwt_algorithms [iterations]
+"""
+import os
+import sys
+import timeit
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ENCRYPTION_KEY", "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=")
+
+from cryptography.hazmat.primitives import serialization  # noqa: E402
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa  # noqa: E402
+from jose import jwt  # noqa: E402
+
+from app.helpers.utils.jwt_keys import JWTKeyRing  # noqa: E402
+
+CLAIMS = {"sub": "1", "role": "ADMIN", "exp": 4102444800, "iat": 1767225600.0, "jti": "0" * 32}
+
+
+def _pem(private_key) -> str:
+    return private_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    ).decode()
+
+
+def _public_pem(private_key) -> str:
+    return private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+
+
+def _cases():
+    yield "HS256", "benchmark-secret", "benchmark-secret"
+    for algorithm, private_key in (
+        ("RS256", rsa.generate_private_key(public_exponent=65537, key_size=2048)),
+        ("ES256", ec.generate_private_key(ec.SECP256R1())),
+        ("EdDSA", ed25519.Ed25519PrivateKey.generate()),
+    ):
+        yield algorithm, _pem(private_key), _public_pem(private_key)
+
+
+def _per_call(func, iterations: int) -> float:
+    return min(timeit.repeat(func, number=iterations, repeat=3)) / iterations * 1e6
+
+
+def main(iterations: int = 2000):
+    print(f"jwt sign/verify, {iterations} calls, best of 3 (us/call)")
+    print(f"  {'algorithm':<10} {'sign':>9} {'verify':>9} {'sign (str key)':>15} {'verify (str key)':>17}  token bytes")
+    for algorithm, signing_pem, verifying_pem in _cases():
+        if algorithm == "HS256":
+            ring = JWTKeyRing(algorithm, secret=signing_pem)
+        else:
+            ring = JWTKeyRing(algorithm, private_key=signing_pem)
+        key, _ = ring.verification_key(ring.kid)
+        token = jwt.encode(CLAIMS, ring.signing_key, algorithm=algorithm, headers=ring.headers)
+
+        row = [
+            _per_call(lambda: jwt.encode(CLAIMS, ring.signing_key, algorithm=algorithm, headers=ring.headers), iterations),
+            _per_call(lambda: jwt.decode(token, key, algorithms=[algorithm]), iterations),
+        ]
+        # RSA private key parsing alone takes tens of milliseconds: fewer rounds for these
+        reparse_iterations = max(1, iterations // 50)
+        row += [
+            _per_call(
+                lambda: jwt.encode(CLAIMS, signing_pem, algorithm=algorithm, headers=ring.headers), reparse_iterations
+            ),
+            _per_call(lambda: jwt.decode(token, verifying_pem, algorithms=[algorithm]), reparse_iterations),
+        ]
+        print(f"  {algorithm:<10} {row[0]:9.1f} {row[1]:9.1f} {row[2]:15.1f} {row[3]:17.1f}  {len(token)}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,97 @@
+"""
+Per-request latency and allocations of the auth lookups: full UserModel entity
+vs the column-restricted selects used by login_user and get_current_user.
+
+Allocation is the tracemalloc peak above baseline during one call (best of
+several), latency is the mean over many calls. The seeded user carries a
+realistic ~300 byte access_token.
+
+Usage:
+    python -m benchmarks.bench_lean_auth_queries [iterations]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ENCRYPTION_KEY", "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.connections.db_connector import Base  # noqa: E402
+from app.helpers.enums.enum_config import userRoles  # noqa: E402
+from app.helpers.utils.principal_cache import Principal  # noqa: E402
+from app.helpers.utils.user_serializer import LOGIN_COLUMNS, PRINCIPAL_COLUMNS  # noqa: E402
+from app.models.user_model import UserModel  # noqa: E402
+
+
+def _cases(session):
+    by_login = (UserModel.user_name == "bench", UserModel.email == "bench@bench.com")
+
+    def login_full():
+        user = session.execute(select(UserModel).where(*by_login).limit(1)).scalars().first()
+        session.expunge_all()  # request-scoped session starts empty every time
+        return user.password
+
+    def login_lean():
+        return session.execute(select(*LOGIN_COLUMNS).where(*by_login).limit(1)).first().password
+
+    def principal_full():
+        user = session.execute(select(UserModel).where(UserModel.id == 1)).scalars().first()
+        session.expunge_all()
+        return Principal.from_user(user)
+
+    def principal_lean():
+        return Principal.from_user(session.execute(select(*PRINCIPAL_COLUMNS).where(UserModel.id == 1)).first())
+
+    return {
+        "login (full entity)": login_full,
+        "login (columns)": login_lean,
+        "get_current_user (full entity)": principal_full,
+        "get_current_user (columns)": principal_lean,
+    }
+
+
+def _peak_bytes(func, samples: int = 5) -> int:
+    # peak traced memory above the pre-call baseline
+    best = None
+    for _ in range(samples):
+        tracemalloc.start()
+        baseline, _ = tracemalloc.get_traced_memory()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        best = peak - baseline if best is None else min(best, peak - baseline)
+    return best
+
+
+def main(iterations: int = 2000):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        session.add(UserModel(
+            user_name="bench", email="bench@bench.com", password="$2b$12$" + "x" * 53,
+            role=userRoles.USER, access_token="e" * 300,
+        ))
+        session.commit()
+        session.expunge_all()
+
+        print(f"{iterations} calls per case")
+        for name, func in _cases(session).items():
+            func()  # warm statement cache
+            started = time.perf_counter()
+            for _ in range(iterations):
+                func()
+            latency = (time.perf_counter() - started) / iterations
+            print(f"  {name:<32} {latency * 1e6:8.1f} us/call  {_peak_bytes(func):7d} B peak")
+
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,182 @@
+"""
+Per-layer middleware overhead on the real app: requests/second and p50/p99
+latency of /api/v1/health and /api/v1/auth/me with each middleware on its own,
+the four separate layers stacked, and the consolidated RequestPipelineMiddleware
+(+ CORS) that main.py installs.
+
+Requests are sent one at a time straight into the ASGI app (or through httpx's
+ASGITransport with ``--httpx``, which adds a constant client cost per request),
+so the numbers are in-process overhead only (no sockets). Stacks are interleaved
+over several rounds and each one's best round is reported. /auth/me runs against a
+temporary SQLite database; the principal and verified-token caches are warm, so
+it mostly measures the dependency + serialization path. Access records go
+through the normal log queue to a log file in the temporary directory.
+
+Usage:
+    python -m benchmarks.bench_middleware_stack [requests] [--httpx]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+_TMP = tempfile.mkdtemp()
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark-secret")
+os.environ.setdefault("ENCRYPTION_KEY", "h6EODPukwTkvZgil_1qxlOk8BRKQsdDI0QrY0u3Lb7Q=")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_TMP}/bench.db")
+os.environ.setdefault("LOG_FILE_PATH", f"{_TMP}/app.log")
+
+import httpx  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+
+from app.connections import db_connector  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.helpers.enums.enum_config import userRoles  # noqa: E402
+from app.helpers.utils.jwt_util import create_access_token  # noqa: E402
+from app.main import app  # noqa: E402
+from app.middlewares.logging_middleware import RotationalLoggerMiddleware  # noqa: E402
+from app.middlewares.payload_limit_middleware import PayloadLimitMiddleware  # noqa: E402
+from app.middlewares.request_pipeline_middleware import RequestPipelineMiddleware  # noqa: E402
+from app.middlewares.timeout_middleware import TimeoutMiddleware  # noqa: E402
+from app.models.user_model import UserModel  # noqa: E402
+
+CORS = Middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["GET", "POST"], allow_headers=["*"], allow_credentials=True)
+LOGGER = Middleware(RotationalLoggerMiddleware)
+TIMEOUT = Middleware(TimeoutMiddleware, timeout=settings.REQUEST_TIMEOUT_SECONDS, route_timeouts=settings.REQUEST_TIMEOUT_OVERRIDES)
+PAYLOAD = Middleware(PayloadLimitMiddleware, max_content_size=settings.MAX_REQUEST_BODY_BYTES, route_limits=settings.REQUEST_BODY_LIMIT_OVERRIDES)
+PIPELINE = Middleware(
+    RequestPipelineMiddleware,
+    timeout=settings.REQUEST_TIMEOUT_SECONDS,
+    route_timeouts=settings.REQUEST_TIMEOUT_OVERRIDES,
+    max_content_size=settings.MAX_REQUEST_BODY_BYTES,
+    route_limits=settings.REQUEST_BODY_LIMIT_OVERRIDES,
+)
+
+# outermost first, as Starlette stores app.user_middleware
+STACKS = {
+    "no middleware": [],
+    "cors only": [CORS],
+    "access log only": [LOGGER],
+    "timeout only": [TIMEOUT],
+    "payload limit only": [PAYLOAD],
+    "separate layers (4)": [PAYLOAD, TIMEOUT, CORS, LOGGER],
+    "cors + pipeline": [CORS, PIPELINE],
+}
+
+
+def _use_stack(middleware):
+    # Starlette rebuilds the middleware stack on the next request
+    app.user_middleware = list(middleware)
+    app.middleware_stack = None
+
+
+def _seed_token() -> str:
+    session = db_connector.SessionLocal()
+    user = UserModel(user_name="bench", email="bench@bench.com", password="x", role=userRoles.USER)
+    session.add(user)
+    session.commit()
+    token, _ = create_access_token({"sub": str(user.id), "role": user.role.value})
+    session.close()
+    return token
+
+
+def _asgi_client(asgi):
+    # minimal in-process client: one GET per call, response body discarded
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def get(path, headers):
+        status = []
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "server": ("bench", 80),
+            "client": ("127.0.0.1", 50000),
+            "root_path": "",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "headers": [(b"host", b"bench")] + [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+        }
+        await asgi(scope, receive, send)
+        return status[0]
+
+    return get
+
+
+async def _round(get, path, headers, count):
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(count):
+        t0 = time.perf_counter()
+        status = await get(path, headers)
+        latencies.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+    assert status == 200, status
+
+    latencies.sort()
+    return {
+        "rps": count / elapsed,
+        "p50": statistics.median(latencies) * 1e3,
+        "p99": latencies[int(len(latencies) * 0.99) - 1] * 1e3,
+    }
+
+
+async def _measure(get, path, headers, count, rounds=5):
+    # stacks are interleaved round by round so machine drift hits all of them alike
+    best = {}
+    for _ in range(rounds):
+        for name, middleware in STACKS.items():
+            _use_stack(middleware)
+            for _ in range(50):  # warm up caches and the rebuilt middleware stack
+                await get(path, headers)
+            result = await _round(get, path, headers, count)
+            if name not in best or result["rps"] > best[name]["rps"]:
+                best[name] = result
+    return best
+
+
+async def run(count: int, use_httpx: bool = False):
+    db_connector.init_db()
+    token = _seed_token()
+    targets = {
+        f"{settings.API_PREFIX}/health": {},
+        f"{settings.API_PREFIX}/auth/me": {"Authorization": f"Bearer {token}"},
+    }
+    original = list(app.user_middleware)
+
+    client = None
+    if use_httpx:
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench")
+
+        async def get(path, headers):
+            return (await client.get(path, headers=headers)).status_code
+    else:
+        get = _asgi_client(app)
+
+    for path, headers in targets.items():
+        print(f"GET {path}, {count} sequential requests x 5 rounds (best), {'httpx' if use_httpx else 'raw ASGI'}")
+        print(f"  {'stack':<22} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, result in (await _measure(get, path, headers, count)).items():
+            print(f"  {name:<22} {result['rps']:9.0f} {result['p50']:8.3f} {result['p99']:8.3f}")
+
+    if client is not None:
+        await client.aclose()
+    _use_stack(original)
+    await db_connector.shutdown_db()
+
+
+if __name__ == "__main__":
+    args = [arg for arg in sys.argv[1:] if not arg.startswith("--")]
+    asyncio.run(run(int(args[0]) if args else 2000, use_httpx="--httpx" in sys.argv))